@@ -0,0 +1,235 @@
+"""
+Generation of synthetic compstates for benchmarking.
+
+The generated compstates are valid (they pass :func:`sr.comp.validation.validate`)
+and are committed to a fresh git repository, so that they can be loaded by
+:class:`sr.comp.comp.SRComp` exactly as a real compstate would be.
+"""
+
+from datetime import datetime, timedelta
+import os
+import random
+import subprocess
+
+from dateutil.tz import tzoffset
+import yaml
+
+
+MATCH_SLOT_LENGTHS = {'pre': 60, 'match': 180, 'post': 60, 'total': 300}
+STAGING = {
+    'opens': 300,
+    'closes': 120,
+    'duration': 180,
+    'signal_teams': 240,
+    'signal_shepherds': {'Blue': 241, 'Green': 241},
+}
+ROUND_SPACING = 300
+FINAL_DELAY = 300
+TIMEZONE = tzoffset('BST', 3600)
+LEAGUE_START = datetime(2014, 4, 26, 10, 0, tzinfo=TIMEZONE)
+
+SCORER_SOURCE = '''\
+class Scorer(object):
+    def __init__(self, teams_data, arena_data):
+        self._teams_data = teams_data
+
+    def calculate_scores(self):
+        return {tla: info['score'] for tla, info in self._teams_data.items()}
+'''
+
+
+def team_tlas(num_teams):
+    """Get the TLAs of the teams in a generated compstate."""
+    return ['T{0:04}'.format(i) for i in range(num_teams)]
+
+
+def arena_names(num_arenas):
+    """Get the names of the arenas in a generated compstate."""
+    return [chr(ord('A') + i) for i in range(num_arenas)]
+
+
+def _dump(root, relpath, data):
+    path = os.path.join(root, relpath)
+    dirname = os.path.dirname(path)
+    if not os.path.exists(dirname):
+        os.makedirs(dirname)
+    with open(path, 'w') as f:
+        yaml.safe_dump(data, f, default_flow_style=False)
+
+
+def league_matches(rand, tlas, arenas, num_teams_per_arena, num_matches):
+    """
+    Generate random league matches, in the form of ``league.yaml``.
+
+    :param random.Random rand: The source of randomness.
+    :param list tlas: The TLAs of the teams.
+    :param list arenas: The names of the arenas.
+    :param int num_teams_per_arena: The number of teams in each match.
+    :param int num_matches: The number of matches (slots).
+    """
+
+    matches = {}
+    teams_per_slot = num_teams_per_arena * len(arenas)
+    for num in range(num_matches):
+        slot_teams = rand.sample(tlas, min(teams_per_slot, len(tlas)))
+        matches[num] = {}
+        for i, arena in enumerate(arenas):
+            teams = slot_teams[i * num_teams_per_arena:
+                               (i + 1) * num_teams_per_arena]
+            teams += [None] * (num_teams_per_arena - len(teams))
+            matches[num][arena] = teams
+    return matches
+
+
+def _score_sheet(rand, arena, num, teams):
+    teams_data = {}
+    for zone, tla in enumerate(teams):
+        if tla is None:
+            continue
+        teams_data[tla] = {
+            'score': rand.randint(0, 20),
+            'zone': zone,
+            'present': rand.random() > 0.05,
+            'disqualified': rand.random() < 0.01,
+        }
+    return {'arena_id': arena, 'match_number': num, 'teams': teams_data}
+
+
+def schedule_config(num_matches, num_delays, knockout_arity, num_arenas):
+    """
+    Generate the configuration of the schedule, in the form of
+    ``schedule.yaml``, with periods long enough to fit all the matches.
+
+    :param int num_matches: The number of league matches (slots).
+    :param int num_delays: The number of delays during the league.
+    :param int knockout_arity: The number of teams in the knockouts.
+    :param int num_arenas: The number of arenas.
+    """
+
+    # pylint: disable=too-many-locals
+    slot = timedelta(seconds=MATCH_SLOT_LENGTHS['total'])
+
+    delays = []
+    for i in range(num_delays):
+        num = (i + 1) * num_matches // (num_delays + 1)
+        delays.append({
+            'delay': 15 + i % 4 * 15,
+            'time': LEAGUE_START + slot * num + timedelta(seconds=2),
+        })
+    total_delay = timedelta(seconds=sum(d['delay'] for d in delays))
+
+    league_end = LEAGUE_START + slot * num_matches + total_delay + \
+                 timedelta(hours=1)
+
+    knockout_start = league_end + timedelta(hours=1)
+    # Generously over-estimate the length of the knockouts
+    knockout_slots = knockout_arity // num_arenas + 4 * knockout_arity.bit_length()
+    knockout_end = knockout_start + slot * knockout_slots + \
+                   timedelta(seconds=(ROUND_SPACING + FINAL_DELAY) *
+                             knockout_arity.bit_length()) + \
+                   timedelta(hours=1)
+
+    return {
+        'match_periods': {
+            'league': [{
+                'start_time': LEAGUE_START,
+                'end_time': league_end,
+                'description': 'The league',
+            }],
+            'knockout': [{
+                'start_time': knockout_start,
+                'end_time': knockout_end,
+                'description': 'The knockouts',
+            }],
+        },
+        'match_slot_lengths': MATCH_SLOT_LENGTHS,
+        'staging': STAGING,
+        'timezone': 'Europe/London',
+        'delays': delays,
+        'league': {'extra_spacing': []},
+        'knockout': {
+            'round_spacing': ROUND_SPACING,
+            'final_delay': FINAL_DELAY,
+            'arity': knockout_arity,
+            'single_arena': {'rounds': 3, 'arenas': ['A']},
+        },
+    }
+
+
+def generate(root, num_teams=64, num_arenas=2, num_matches=100,
+             num_scored=None, num_delays=5, knockout_arity=None, seed=0):
+    """
+    Generate a synthetic compstate.
+
+    :param str root: The directory to create the compstate in. It will be
+                     created if it doesn't exist, and should be empty.
+    :param int num_teams: The number of teams.
+    :param int num_arenas: The number of arenas.
+    :param int num_matches: The number of league matches (slots).
+    :param int num_scored: The number of league matches which have score
+                           sheets. Defaults to all of them.
+    :param int num_delays: The number of delays during the league.
+    :param int knockout_arity: The number of teams in the knockouts.
+                               Defaults to all the teams.
+    :param int seed: The seed for the random content.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-locals
+
+    if num_scored is None:
+        num_scored = num_matches
+    if knockout_arity is None:
+        knockout_arity = num_teams
+
+    rand = random.Random(seed)
+    tlas = team_tlas(num_teams)
+    arenas = arena_names(num_arenas)
+    num_teams_per_arena = 4
+
+    _dump(root, 'teams.yaml', {'teams': {
+        tla: {'name': 'Team {0}'.format(tla), 'rookie': i % 5 == 0}
+        for i, tla in enumerate(tlas)
+    }})
+    _dump(root, 'arenas.yaml', {
+        'arenas': {arena: {'display_name': 'Arena {0}'.format(arena),
+                           'colour': '#cccccc'}
+                   for arena in arenas},
+        'corners': {n: {'colour': '#{0:02x}0000'.format(n * 40)}
+                    for n in range(num_teams_per_arena)},
+    })
+
+    half = num_teams // 2
+    _dump(root, 'layout.yaml', {'teams': [
+        {'name': 'north', 'display_name': 'North', 'teams': tlas[:half]},
+        {'name': 'south', 'display_name': 'South', 'teams': tlas[half:]},
+    ]})
+    _dump(root, 'shepherding.yaml', {'shepherds': [
+        {'name': 'Blue', 'colour': 'blue', 'regions': ['north']},
+        {'name': 'Green', 'colour': 'green', 'regions': ['south']},
+    ]})
+    _dump(root, 'awards.yaml', {'committee': tlas[0], 'image': tlas[1:3]})
+
+    matches = league_matches(rand, tlas, arenas, num_teams_per_arena,
+                              num_matches)
+    _dump(root, 'league.yaml', {'matches': matches})
+    _dump(root, 'schedule.yaml', schedule_config(num_matches, num_delays,
+                                           knockout_arity, num_arenas))
+
+    scoring_dir = os.path.join(root, 'scoring')
+    os.makedirs(scoring_dir)
+    with open(os.path.join(scoring_dir, 'score.py'), 'w') as f:
+        f.write(SCORER_SOURCE)
+
+    for num in range(num_scored):
+        for arena, teams in matches[num].items():
+            relpath = os.path.join('league', arena, '{0:04}.yaml'.format(num))
+            _dump(root, relpath, _score_sheet(rand, arena, num, teams))
+
+    def git(*args):
+        command = ('git', '-c', 'user.name=Benchmarks',
+                   '-c', 'user.email=benchmarks@example.com')
+        subprocess.check_call(command + args, cwd=root)
+
+    git('init', '-q')
+    git('add', '.')
+    git('commit', '-q', '-m', 'Generated compstate')
@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+"""
+Benchmark the loading of a compstate.
+
+Each phase of the loading is timed separately, against either a generated
+compstate (see :mod:`compstate`) or an existing one. The results are
+emitted as JSON, so that they can be compared between versions.
+
+Example usage::
+
+    python benchmarks/load.py --scale stress --output stress.json
+"""
+
+from __future__ import print_function
+
+from argparse import ArgumentParser
+import os
+import shutil
+import sys
+import tempfile
+
+# Benchmark the working copy rather than any installed version
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from sr.comp import arenas, teams, yaml_loader
+from sr.comp.comp import SRComp, load_scorer
+from sr.comp.knockout_scheduler import KnockoutScheduler
+from sr.comp.matches import MatchSchedule
+from sr.comp.scores import Scores
+from sr.comp.validation import validate
+
+import compstate
+from timing import measure, report
+
+
+SCALES = {
+    'realistic': {
+        'num_teams': 56,
+        'num_arenas': 2,
+        'num_matches': 130,
+        'num_delays': 5,
+        'knockout_arity': 32,
+    },
+    'stress': {
+        'num_teams': 1000,
+        'num_arenas': 8,
+        'num_matches': 2000,
+        'num_delays': 100,
+        'knockout_arity': 256,
+    },
+}
+
+
+class Loader(object):
+    """The parts of a compstate which each phase needs to be given."""
+
+    def __init__(self, root):
+        self.root = root
+        self.teams = teams.load_teams(self.path('teams.yaml'))
+        self.arenas = arenas.load_arenas(self.path('arenas.yaml'))
+        self.num_teams_per_arena = len(arenas.load_corners(
+            self.path('arenas.yaml')))
+        self.scorer = load_scorer(root)
+        self.config = yaml_loader.load(self.path('schedule.yaml'))
+        self.league = yaml_loader.load(self.path('league.yaml'))['matches']
+
+    def path(self, name):
+        return os.path.join(self.root, name)
+
+    def load(self):
+        comp = SRComp(self.root)
+        # Include the parts which are only loaded on demand
+        comp.awards, comp.venue # pylint: disable=pointless-statement
+        return comp
+
+    def scores(self):
+        scores = Scores(self.root, self.teams.keys(), self.scorer,
+                        self.num_teams_per_arena)
+        scores.knockout, scores.tiebreaker # pylint: disable=pointless-statement
+        return scores
+
+    def schedule(self, scores):
+        return MatchSchedule.create(self.path('schedule.yaml'),
+                                    self.path('league.yaml'), scores,
+                                    self.arenas, self.num_teams_per_arena,
+                                    self.teams)
+
+    def league_schedule(self):
+        return MatchSchedule(self.config, self.league, self.teams,
+                             self.num_teams_per_arena)
+
+    def knockouts(self, schedule, scores):
+        scheduler = KnockoutScheduler(schedule, scores, self.arenas,
+                                      self.num_teams_per_arena, self.teams,
+                                      self.config)
+        scheduler.add_knockouts()
+
+
+def run(root, repeat):
+    """
+    Time each of the phases of loading the given compstate.
+
+    :param str root: The path to the compstate.
+    :param int repeat: The number of times to time each phase.
+    :return: A :class:`dict` of the results for each phase.
+    """
+
+    loader = Loader(root)
+    scores = loader.scores()
+    comp = loader.load()
+
+    def quiet_validate(comp):
+        # Don't let the reports of missing scores swamp the results
+        stderr = sys.stderr
+        with open(os.devnull, 'w') as sys.stderr:
+            try:
+                return validate(comp)
+            finally:
+                sys.stderr = stderr
+
+    return {
+        'srcomp': measure(loader.load, repeat=repeat),
+        'scores': measure(loader.scores, repeat=repeat),
+        'schedule': measure(lambda: loader.schedule(scores), repeat=repeat),
+        'knockouts': measure(lambda s: loader.knockouts(s, scores),
+                             setup=loader.league_schedule, repeat=repeat),
+        'validate': measure(lambda: quiet_validate(comp), repeat=repeat),
+    }
+
+
+def main():
+    parser = ArgumentParser(description="Benchmark the loading of a "
+                                        "compstate")
+    parser.add_argument('--compstate', help="Benchmark an existing "
+                        "compstate rather than generating one")
+    parser.add_argument('--scale', choices=sorted(SCALES),
+                        default='realistic', help="The size of compstate to "
+                        "generate (default: %(default)s)")
+    parser.add_argument('--teams', type=int, dest='num_teams')
+    parser.add_argument('--arenas', type=int, dest='num_arenas')
+    parser.add_argument('--matches', type=int, dest='num_matches',
+                        help="The number of league matches")
+    parser.add_argument('--scored', type=int, dest='num_scored',
+                        help="The number of league matches with score "
+                        "sheets (default: all)")
+    parser.add_argument('--delays', type=int, dest='num_delays')
+    parser.add_argument('--knockout-arity', type=int, dest='knockout_arity',
+                        help="The number of teams in the knockouts")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=5,
+                        help="The number of times to time each phase "
+                        "(default: %(default)s)")
+    parser.add_argument('--output', help="Write the JSON results to this "
+                        "file rather than to stdout")
+    args = parser.parse_args()
+
+    if args.compstate is not None:
+        config = {'compstate': args.compstate}
+        results = run(args.compstate, args.repeat)
+    else:
+        config = dict(SCALES[args.scale], seed=args.seed)
+        for key in ('num_teams', 'num_arenas', 'num_matches', 'num_scored',
+                    'num_delays', 'knockout_arity'):
+            value = getattr(args, key)
+            if value is not None:
+                config[key] = value
+
+        root = tempfile.mkdtemp()
+        try:
+            compstate.generate(root, **config)
+            results = run(root, args.repeat)
+        finally:
+            shutil.rmtree(root)
+
+    config['repeat'] = args.repeat
+
+    if args.output is None:
+        report('load', config, results)
+    else:
+        with open(args.output, 'w') as f:
+            report('load', config, results, f)
+
+
+if __name__ == '__main__':
+    main()
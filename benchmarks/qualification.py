@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+"""
+Benchmark the analysis of the places teams could finish the league in.
+
+Compstates are generated with increasing numbers of the league matches
+scored, and the best and worst places of every team found for each, as
+:func:`sr.comp.qualification.league_position_bounds` does.
+
+Example usage::
+
+    python benchmarks/qualification.py --teams 120 --arenas 4 --matches 40
+"""
+
+from __future__ import division
+
+from argparse import ArgumentParser
+import os
+import shutil
+import sys
+import tempfile
+
+# Benchmark the working copy rather than any installed version
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from sr.comp.comp import SRComp
+from sr.comp.qualification import league_position_bounds
+
+import compstate
+from timing import measure, report
+
+
+def run(config, scored, repeat):
+    """
+    Time the analysis with each of the given numbers of matches scored.
+
+    :param dict config: The arguments for :func:`compstate.generate`.
+    :param list scored: The numbers of league matches to score.
+    :param int repeat: The number of times to time each.
+    :return: A :class:`dict` of the results for each number scored.
+    """
+
+    results = {}
+    for num_scored in scored:
+        root = tempfile.mkdtemp()
+        try:
+            compstate.generate(root, num_scored=num_scored, **config)
+            comp = SRComp(root)
+        finally:
+            shutil.rmtree(root)
+
+        result = measure(lambda: league_position_bounds(comp), repeat=repeat)
+        result['per_item'] = result['min'] / config['num_teams']
+        results[str(num_scored)] = result
+
+    return results
+
+
+def main():
+    parser = ArgumentParser(description="Benchmark the analysis of the "
+                                        "places teams could finish the "
+                                        "league in")
+    parser.add_argument('--teams', type=int, default=120, dest='num_teams',
+                        help="(default: %(default)s)")
+    parser.add_argument('--arenas', type=int, default=4, dest='num_arenas',
+                        help="(default: %(default)s)")
+    parser.add_argument('--matches', type=int, default=40,
+                        dest='num_matches', help="The number of league "
+                        "matches (default: %(default)s)")
+    parser.add_argument('--scored', type=int, nargs='+',
+                        default=[10, 20, 30],
+                        help="The numbers of league matches to score "
+                        "(default: %(default)s)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="The number of times to time each "
+                        "(default: %(default)s)")
+    parser.add_argument('--output', help="Write the JSON results to this "
+                        "file rather than to stdout")
+    args = parser.parse_args()
+
+    config = {
+        'num_teams': args.num_teams,
+        'num_arenas': args.num_arenas,
+        'num_matches': args.num_matches,
+        'seed': args.seed,
+    }
+    results = run(config, args.scored, args.repeat)
+
+    config['scored'] = args.scored
+    config['repeat'] = args.repeat
+
+    if args.output is None:
+        report('qualification', config, results)
+    else:
+        with open(args.output, 'w') as f:
+            report('qualification', config, results, f)
+
+
+if __name__ == '__main__':
+    main()
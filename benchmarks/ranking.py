@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+"""
+Benchmark the ranking of the league.
+
+Random league and game points are generated for increasing numbers of teams,
+with plenty of ties, and then ranked as :class:`sr.comp.scores.LeagueScores`
+does whenever the scores change.
+
+Example usage::
+
+    python benchmarks/ranking.py --sizes 1000 10000 100000
+"""
+
+from __future__ import division
+
+from argparse import ArgumentParser
+import os
+import random
+import sys
+
+# Benchmark the working copy rather than any installed version
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from sr.comp.scores import LeagueScores, TeamScore
+
+import compstate
+from timing import measure, report
+
+
+def team_scores(rand, num_teams):
+    """
+    Generate random scores for the given number of teams.
+
+    :param random.Random rand: The source of randomness.
+    :param int num_teams: The number of teams.
+    :return: A :class:`dict` of TLA to :class:`TeamScore`.
+    """
+
+    return {tla: TeamScore(league=rand.randint(0, num_teams // 10),
+                           game=rand.randint(0, 200))
+            for tla in compstate.team_tlas(num_teams)}
+
+
+def run(sizes, repeat):
+    """
+    Time ranking the league at each of the given sizes.
+
+    :param list sizes: The numbers of teams to rank.
+    :param int repeat: The number of times to time each size.
+    :return: A :class:`dict` of the results for each size.
+    """
+
+    rand = random.Random(0)
+
+    results = {}
+    for num_teams in sizes:
+        scores = team_scores(rand, num_teams)
+        result = measure(lambda: LeagueScores.rank_league(scores),
+                         repeat=repeat)
+        result['per_item'] = result['min'] / num_teams
+        results[str(num_teams)] = result
+
+    return results
+
+
+def main():
+    parser = ArgumentParser(description="Benchmark the ranking of the "
+                                        "league")
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[1000, 10000, 100000],
+                        help="The numbers of teams to rank "
+                        "(default: %(default)s)")
+    parser.add_argument('--repeat', type=int, default=5,
+                        help="The number of times to time each size "
+                        "(default: %(default)s)")
+    parser.add_argument('--output', help="Write the JSON results to this "
+                        "file rather than to stdout")
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.repeat)
+
+    config = {
+        'sizes': args.sizes,
+        'repeat': args.repeat,
+    }
+
+    if args.output is None:
+        report('ranking', config, results)
+    else:
+        with open(args.output, 'w') as f:
+            report('ranking', config, results, f)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+"""
+Benchmark the construction of the league schedule as it grows.
+
+The schedule is built (without any files) for increasing numbers of league
+matches and delays, so that the time per match can be compared across the
+sizes: if construction is linear then this stays roughly constant.
+
+Example usage::
+
+    python benchmarks/schedule.py --sizes 1000 4000 16000 64000
+"""
+
+from __future__ import division
+
+from argparse import ArgumentParser
+import os
+import random
+import sys
+
+# Benchmark the working copy rather than any installed version
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from sr.comp.matches import MatchSchedule
+from sr.comp.teams import Team
+
+import compstate
+from timing import measure, report
+
+
+NUM_TEAMS = 200
+NUM_ARENAS = 4
+NUM_TEAMS_PER_ARENA = 4
+
+
+def run(sizes, delays_per_match, repeat):
+    """
+    Time building the schedule at each of the given sizes.
+
+    :param list sizes: The numbers of league matches to build.
+    :param float delays_per_match: The number of delays per league match.
+    :param int repeat: The number of times to time each size.
+    :return: A :class:`dict` of the results for each size.
+    """
+
+    rand = random.Random(0)
+    tlas = compstate.team_tlas(NUM_TEAMS)
+    arenas = compstate.arena_names(NUM_ARENAS)
+    teams = {tla: Team(tla, tla, False, None) for tla in tlas}
+
+    results = {}
+    for num_matches in sizes:
+        num_delays = int(num_matches * delays_per_match)
+        config = compstate.schedule_config(num_matches, num_delays,
+                                           NUM_TEAMS, NUM_ARENAS)
+        league = compstate.league_matches(rand, tlas, arenas,
+                                          NUM_TEAMS_PER_ARENA, num_matches)
+
+        def build():
+            schedule = MatchSchedule(config, league, teams,
+                                     NUM_TEAMS_PER_ARENA)
+            assert schedule.n_league_matches == num_matches
+            return schedule
+
+        result = measure(build, repeat=repeat)
+        result['num_delays'] = num_delays
+        result['per_item'] = result['min'] / (num_matches + num_delays)
+        results[str(num_matches)] = result
+
+    return results
+
+
+def main():
+    parser = ArgumentParser(description="Benchmark the construction of the "
+                                        "league schedule")
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[1000, 4000, 16000, 64000],
+                        help="The numbers of league matches to build "
+                        "(default: %(default)s)")
+    parser.add_argument('--delays-per-match', type=float, default=0.1,
+                        help="(default: %(default)s)")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="The number of times to time each size "
+                        "(default: %(default)s)")
+    parser.add_argument('--output', help="Write the JSON results to this "
+                        "file rather than to stdout")
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.delays_per_match, args.repeat)
+
+    # How much slower each item is at the largest size than at the smallest;
+    # roughly 1 if construction is linear.
+    per_item = [results[str(size)]['per_item'] for size in sorted(args.sizes)]
+    results['scaling'] = per_item[-1] / per_item[0]
+
+    config = {
+        'sizes': args.sizes,
+        'delays_per_match': args.delays_per_match,
+        'num_teams': NUM_TEAMS,
+        'num_arenas': NUM_ARENAS,
+        'repeat': args.repeat,
+    }
+
+    if args.output is None:
+        report('schedule', config, results)
+    else:
+        with open(args.output, 'w') as f:
+            report('schedule', config, results, f)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+"""
+Benchmark the stable random number generator used by the knockouts.
+
+This times generating random numbers, and shuffling the zones of knockout
+matches as the automatic knockout scheduler does: seeding once and then
+shuffling each match's teams. If :mod:`numpy` is installed, this also times
+replaying those shuffles for many seeds at once with a batch of generators.
+
+Example usage::
+
+    python benchmarks/stable_random.py --numbers 100000 --matches 10000
+"""
+
+from __future__ import division
+
+from argparse import ArgumentParser
+import os
+import sys
+
+# Benchmark the working copy rather than any installed version
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from sr.comp.knockout_scheduler.stable_random import Random
+
+from timing import measure, report
+
+
+def run(num_numbers, num_matches, repeat):
+    """
+    Time generating random numbers and shuffling zones.
+
+    :param int num_numbers: The number of random numbers to generate.
+    :param int num_matches: The number of matches to shuffle the zones of.
+    :param int repeat: The number of times to time each.
+    :return: A :class:`dict` of the results.
+    """
+
+    def numbers():
+        rand = Random()
+        rand.seed(b'benchmark')
+        for _ in range(num_numbers):
+            rand.random()
+
+    def shuffles():
+        rand = Random()
+        rand.seed(b'benchmark')
+        for _ in range(num_matches):
+            rand.shuffle(['ABC', 'DEF', 'GHI', None])
+
+    results = {
+        'random': measure(numbers, repeat=repeat),
+        'shuffle': measure(shuffles, repeat=repeat),
+    }
+    results['random']['per_item'] = results['random']['min'] / num_numbers
+    results['shuffle']['per_item'] = results['shuffle']['min'] / num_matches
+
+    try:
+        import numpy
+    except ImportError:
+        return results
+
+    seeds = ['benchmark {0}'.format(i).encode('utf-8')
+             for i in range(num_matches)]
+
+    def batch_shuffles():
+        batch = Random.batch(seeds)
+        zones = numpy.array([['ABC', 'DEF', 'GHI', None]] * len(seeds),
+                            dtype=object)
+        batch.shuffle(zones)
+
+    results['batch_shuffle'] = measure(batch_shuffles, repeat=repeat)
+    results['batch_shuffle']['per_item'] = \
+        results['batch_shuffle']['min'] / num_matches
+    return results
+
+
+def main():
+    parser = ArgumentParser(description="Benchmark the stable random number "
+                                        "generator")
+    parser.add_argument('--numbers', type=int, default=100000,
+                        help="The number of random numbers to generate "
+                        "(default: %(default)s)")
+    parser.add_argument('--matches', type=int, default=10000,
+                        help="The number of matches to shuffle the zones of "
+                        "(default: %(default)s)")
+    parser.add_argument('--repeat', type=int, default=5,
+                        help="The number of times to time each "
+                        "(default: %(default)s)")
+    parser.add_argument('--output', help="Write the JSON results to this "
+                        "file rather than to stdout")
+    args = parser.parse_args()
+
+    results = run(args.numbers, args.matches, args.repeat)
+
+    config = {
+        'numbers': args.numbers,
+        'matches': args.matches,
+        'repeat': args.repeat,
+    }
+
+    if args.output is None:
+        report('stable_random', config, results)
+    else:
+        with open(args.output, 'w') as f:
+            report('stable_random', config, results, f)
+
+
+if __name__ == '__main__':
+    main()
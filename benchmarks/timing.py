@@ -0,0 +1,91 @@
+"""Helpers for timing benchmarks and reporting their results."""
+
+from __future__ import division
+
+import gc
+import json
+import platform
+import sys
+from timeit import default_timer
+
+try:
+    import tracemalloc
+except ImportError:
+    # Python 2
+    tracemalloc = None
+
+
+def measure(func, setup=None, repeat=5):
+    """
+    Time a function, and find the peak memory it allocates.
+
+    Each repetition calls ``setup`` (if given) outside of the timed region
+    and then passes its result to ``func``. The peak memory is measured in a
+    separate, untimed, call since tracing allocations is slow.
+
+    :param func: The function to measure.
+    :param setup: An optional function whose result is passed to ``func``.
+    :param int repeat: The number of timed repetitions.
+    :return: A :class:`dict` of the timings (in seconds) and the peak memory
+             (in bytes, or ``None`` if it can't be measured).
+    """
+
+    times = []
+    for _ in range(repeat):
+        args = () if setup is None else (setup(),)
+        gc.collect()
+        start = default_timer()
+        func(*args)
+        times.append(default_timer() - start)
+
+    peak_memory = None
+    if tracemalloc is not None:
+        args = () if setup is None else (setup(),)
+        gc.collect()
+        tracemalloc.start()
+        try:
+            func(*args)
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    times.sort()
+    return {
+        'times': times,
+        'min': times[0],
+        'median': times[len(times) // 2],
+        'peak_memory': peak_memory,
+    }
+
+
+def environment():
+    """Describe the environment the benchmarks are running in."""
+    return {
+        'python': sys.version.split()[0],
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+    }
+
+
+def report(name, config, results, output=None):
+    """
+    Emit the results of a benchmark run as JSON.
+
+    :param str name: The name of the benchmark.
+    :param dict config: The parameters the benchmark was run with.
+    :param dict results: A mapping of the names of the things measured to
+                         the results from :func:`measure`.
+    :param output: An optional file to write to. Defaults to stdout.
+    """
+
+    data = {
+        'benchmark': name,
+        'environment': environment(),
+        'config': config,
+        'results': results,
+    }
+
+    if output is None:
+        output = sys.stdout
+    json.dump(data, output, indent=2, sort_keys=True)
+    output.write('\n')
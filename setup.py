@@ -26,6 +26,10 @@ setup(
     author='Student Robotics Competition Software SIG',
     author_email='srobo-devel@googlegroups.com',
     install_requires=install_requires,
+    extras_require={
+        # For sr.comp.score_matrix
+        'analytics': ['numpy >=1.8'],
+    },
     setup_requires=[
         'nose >=1.3, <2',
         'Sphinx >=1.3, <2'
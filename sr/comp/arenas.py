@@ -9,7 +9,7 @@ Arena = namedtuple('Arena', ['name', 'display_name', 'colour'])
 Corner = namedtuple("Corner", ["number", "colour"])
 
 
-def load_arenas(filename):
+def load_arenas(filename, cache=None):
     """
     Load arenas from a YAML file.
 
@@ -17,6 +17,8 @@ def load_arenas(filename):
     ----------
     filename : str
         The filename of the YAML file to load arenas from.
+    cache : sr.comp.cache.FileCache, optional
+        A cache of previously loaded files.
 
     Returns
     -------
@@ -24,7 +26,7 @@ def load_arenas(filename):
         A mapping of arena names to :class:`Arena` objects.
     """
 
-    y = yaml_loader.load(filename)
+    y = yaml_loader.cached_load(filename, cache)
 
     arenas_data = y['arenas']
 
@@ -36,7 +38,7 @@ def load_arenas(filename):
     return arenas
 
 
-def load_corners(filename):
+def load_corners(filename, cache=None):
     """
     Load corner colours from a YAML file.
 
@@ -44,6 +46,8 @@ def load_corners(filename):
     ----------
     filename : str
         The filename of the YAML file to load corners from.
+    cache : sr.comp.cache.FileCache, optional
+        A cache of previously loaded files.
 
     Returns
     -------
@@ -51,7 +55,7 @@ def load_corners(filename):
         A mapping of corner numbers to :class:`Corner` objects.
     """
 
-    y = yaml_loader.load(filename)
+    y = yaml_loader.cached_load(filename, cache)
 
     corners = OrderedDict()
     for number, corner in y['corners'].items():
@@ -0,0 +1,439 @@
+"""Caching of values derived from the files within a compstate."""
+
+from collections import OrderedDict
+import errno
+import glob
+import hashlib
+import os
+import pickle
+from subprocess import check_output
+import sys
+import tempfile
+
+from . import yaml_loader
+
+
+def file_signature(path):
+    """
+    Get a value which changes whenever the given file is modified.
+
+    :param str path: The path to the file.
+    :return: A tuple of the file's inode, size and modification time.
+    """
+
+    st = os.stat(path)
+    return st.st_ino, st.st_size, st.st_mtime
+
+
+def git_blob_id(content):
+    """
+    Compute the id which git would give to a blob with the given content.
+
+    :param bytes content: The content of the blob.
+    :return: The hex SHA-1 of the blob.
+    """
+
+    h = hashlib.sha1()
+    h.update('blob {0}\0'.format(len(content)).encode('ascii'))
+    h.update(content)
+    return h.hexdigest()
+
+
+def _read_pickle(path):
+    """
+    Read a pickled value from the given file, or ``None`` if it is missing,
+    unreadable or corrupt.
+
+    The files are only ever a cache, so any problem with them is treated as
+    a miss, and the value is computed (and written) afresh.
+    """
+    try:
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    except Exception: # pylint: disable=broad-except
+        # Unpickling corrupt data can fail in all sorts of ways
+        return None
+
+
+def _write_pickle(path, data):
+    """
+    Atomically write a pickled value to the given file.
+
+    Failures to write (for example, to a read-only or full disk) are
+    ignored, since the files are only ever a cache.
+    """
+    dirname = os.path.dirname(path)
+    try:
+        if not os.path.exists(dirname):
+            try:
+                os.makedirs(dirname)
+            except OSError as e:
+                if e.errno != errno.EEXIST:
+                    raise
+
+        # Write to a temporary file and move it into place so that
+        # concurrent readers never see a partially written file.
+        fd, tmp_path = tempfile.mkstemp(dir=dirname)
+    except EnvironmentError:
+        return
+
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(data, f, pickle.HIGHEST_PROTOCOL)
+        os.rename(tmp_path, path)
+    except EnvironmentError:
+        try:
+            os.remove(tmp_path)
+        except EnvironmentError:
+            pass
+
+
+class BlobStore(object):
+    """
+    A persistent store of parsed YAML files, keyed by the git blob id of
+    their contents.
+
+    Since the keys are derived from the content of the files there is no
+    need to ever invalidate the stored values, and the store can safely be
+    shared between working copies, branches and processes.
+
+    :param str directory: The directory to store the parsed files in.
+    """
+
+    @classmethod
+    def for_repo(cls, root):
+        """
+        Create a store within the git directory of the given repository.
+
+        :param str root: The path to a git repository.
+        """
+
+        git_dir = check_output(('git', 'rev-parse', '--git-dir'),
+                               universal_newlines=True,
+                               cwd=root).strip()
+        return cls(os.path.join(root, git_dir, 'srcomp-cache'))
+
+    def __init__(self, directory):
+        # Pickles aren't portable between major Python versions, and the
+        # parsed form depends on the loader, so keep those separate.
+        version = 'yaml-v1-py{0}'.format(sys.version_info[0])
+        self.directory = os.path.join(directory, version)
+
+    def _path(self, blob_id):
+        return os.path.join(self.directory, blob_id[:2], blob_id[2:])
+
+    def loads(self, content):
+        """
+        Parse YAML content, reusing the stored result if there is one.
+
+        :param bytes content: The YAML content.
+        :return: The parsed contents.
+        """
+
+        path = self._path(git_blob_id(content))
+
+        data = _read_pickle(path)
+        if data is None:
+            data = yaml_loader.loads(content)
+            _write_pickle(path, data)
+
+        return data
+
+    def load_yaml(self, path):
+        """
+        Load a YAML file, reusing the stored result if there is one.
+
+        :param str path: The path to the YAML file.
+        :return: The parsed contents.
+        """
+
+        with open(path, 'rb') as f:
+            content = f.read()
+        return self.loads(content)
+
+
+class ContentMemo(object):
+    """
+    A memo of values derived from content, keyed by identifiers of that
+    content (such as git blob ids) rather than by file paths.
+
+    The most recently used values are kept in memory. If a directory is
+    given, all values are also persisted there, so that they can be reused
+    by other processes.
+
+    :param int max_entries: The maximum number of values to keep in memory.
+    :param str directory: An optional directory to persist values in.
+    """
+
+    def __init__(self, max_entries=10000, directory=None):
+        self.max_entries = max_entries
+        self.directory = directory
+        if directory is not None:
+            version = 'memo-v1-py{0}'.format(sys.version_info[0])
+            self.directory = os.path.join(directory, version)
+
+        self._values = OrderedDict()
+
+    def _path(self, key):
+        digest = hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, digest[:2], digest[2:])
+
+    def get(self, key):
+        """
+        Get a memoised value.
+
+        :param tuple key: The key for the value. This should be composed of
+                          strings and numbers only, so that it has a stable
+                          ``repr`` for use in the persistent store.
+        :return: The value, or ``None`` if there isn't one.
+        """
+
+        value = self._values.pop(key, None)
+        if value is None and self.directory is not None:
+            value = _read_pickle(self._path(key))
+
+        if value is not None:
+            # Mark as most recently used
+            self._values[key] = value
+            self._evict()
+
+        return value
+
+    def put(self, key, value):
+        """
+        Memoise a value.
+
+        :param tuple key: The key for the value, as for :meth:`get`.
+        :param value: The value, which must not be ``None``.
+        """
+
+        self._values.pop(key, None)
+        self._values[key] = value
+        self._evict()
+
+        if self.directory is not None:
+            _write_pickle(self._path(key), value)
+
+    def memoize(self, key, factory):
+        """
+        Get a memoised value, computing it if needed.
+
+        :param tuple key: The key for the value, as for :meth:`get`.
+        :param factory: A callable which computes the value.
+        :return: The (possibly memoised) value.
+        """
+
+        value = self.get(key)
+        if value is None:
+            value = factory()
+            self.put(key, value)
+        return value
+
+    def _evict(self):
+        while len(self._values) > self.max_entries:
+            self._values.popitem(last=False)
+
+    def __len__(self):
+        return len(self._values)
+
+
+class FileCache(object):
+    """
+    A cache of values derived from the contents of files.
+
+    Entries are keyed by the path of the file they were derived from and an
+    arbitrary key describing how they were derived. An entry is only reused
+    while the file's signature (see :func:`file_signature`) is unchanged.
+
+    The cache is also the means by which files are read, allowing derived
+    classes (such as :class:`sr.comp.git_tree.GitTreeCache`) to provide
+    the files from elsewhere.
+
+    Consumers must treat the values they get from the cache as immutable,
+    since they may be shared with other :class:`sr.comp.comp.SRComp`
+    instances.
+
+    :param FileCache previous: An optional cache whose entries should be
+                               reused by this one, if they are still valid.
+    :param changed_paths: An optional iterable of paths which are known to
+                          have changed since ``previous`` was populated.
+                          Entries for these are never reused.
+    :param BlobStore store: An optional persistent store used when parsing
+                            YAML files. Defaults to the store of
+                            ``previous``, if any.
+    :param ContentMemo memo: An optional memo of values derived from file
+                             contents, such as the results of scoring score
+                             sheets. Defaults to the memo of ``previous``,
+                             if any.
+    """
+
+    def __init__(self, previous=None, changed_paths=(), store=None,
+                 memo=None):
+        self._entries = {}
+
+        self._previous_entries = {}
+        if previous is not None:
+            # pylint: disable=protected-access
+            self._previous_entries = previous._entries
+            if store is None:
+                store = previous._store
+            if memo is None:
+                memo = previous.memo
+
+        self._store = store
+
+        self.memo = memo
+        """The :class:`ContentMemo` for this cache, if any."""
+
+        self._changed_paths = set(os.path.abspath(p) for p in changed_paths)
+
+    def get(self, path, key, factory):
+        """
+        Get a value derived from the given file.
+
+        :param str path: The path to the file the value is derived from.
+        :param key: A hashable description of how the value is derived.
+        :param factory: A callable which computes the value; it is only
+                        called if there is no valid cached value.
+        :return: The (possibly cached) value.
+        """
+
+        path = os.path.abspath(path)
+
+        # Find the signature before computing the value so that a file which
+        # changes while we're reading it won't be considered valid next time.
+        signature = self.signature(path)
+
+        entry = self._find(path, key, signature)
+        if entry is not None:
+            value = entry[1]
+        else:
+            value = factory()
+
+        self._entries[(path, key)] = (signature, value)
+        return value
+
+    def _find(self, path, key, signature):
+        entry_key = (path, key)
+
+        entry = self._entries.get(entry_key)
+        if entry is None and path not in self._changed_paths:
+            entry = self._previous_entries.get(entry_key)
+
+        if entry is not None and entry[0] == signature:
+            return entry
+        return None
+
+    def contains(self, path, key):
+        """
+        Whether or not there is a valid cached value derived from the given
+        file.
+
+        :param str path: The path to the file the value is derived from.
+        :param key: A hashable description of how the value is derived.
+        """
+
+        path = os.path.abspath(path)
+        return self._find(path, key, self.signature(path)) is not None
+
+    def put(self, path, key, signature, value):
+        """
+        Add a value derived from the given file to the cache.
+
+        This is intended for values which are computed elsewhere, such as
+        in another process; most users should use :meth:`get` instead.
+
+        :param str path: The path to the file the value is derived from.
+        :param key: A hashable description of how the value is derived.
+        :param signature: The signature of the file, as returned by
+                          :meth:`signature`, from *before* it was read.
+        :param value: The value to store.
+        """
+
+        self._entries[(os.path.abspath(path), key)] = (signature, value)
+
+    def signature(self, path):
+        """
+        Get a value which changes whenever the given file is modified.
+
+        :param str path: The path to the file.
+        """
+        return file_signature(path)
+
+    def read(self, path):
+        """
+        Read the contents of the given file.
+
+        :param str path: The path to the file.
+        :return: The contents of the file, as bytes.
+        """
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def content_id(self, path):
+        """
+        Get an identifier for the current contents of the given file.
+
+        :param str path: The path to the file.
+        :return: The git blob id of the file's contents.
+        """
+        return git_blob_id(self.read(path))
+
+    def exists(self, path):
+        """Whether or not the given file exists."""
+        return os.path.exists(path)
+
+    def commit(self, root):
+        """
+        Get the commit which the files are read from.
+
+        :param str root: The path to the git repository.
+        :return: The id of the ``HEAD`` commit of the repository.
+        """
+        return check_output(('git', 'rev-parse', 'HEAD'),
+                            universal_newlines=True,
+                            cwd=root).strip()
+
+    def glob(self, pattern):
+        """
+        Find the files which match the given pattern.
+
+        :param str pattern: A pattern, as for :func:`glob.glob`.
+        :return: A sorted list of the matching paths.
+        """
+        return sorted(glob.glob(pattern))
+
+    def load_yaml(self, path):
+        """
+        Load a YAML file, reusing the parsed contents if they are unchanged.
+
+        :param str path: The path to the YAML file.
+        :return: The parsed contents.
+        """
+
+        return self.get(path, 'yaml', lambda: self.parse_yaml(path))
+
+    def parse_yaml(self, path):
+        """
+        Parse a YAML file without keeping the result in memory.
+
+        This is intended for files whose parsed contents are only used to
+        derive other (cached) values, such as score sheets.
+
+        :param str path: The path to the YAML file.
+        :return: The parsed contents.
+        """
+
+        return self.loads(self.read(path))
+
+    def loads(self, content):
+        """
+        Parse YAML content, via the persistent store if there is one.
+
+        :param bytes content: The YAML content.
+        :return: The parsed contents.
+        """
+
+        if self._store is None:
+            return yaml_loader.loads(content)
+        return self._store.loads(content)
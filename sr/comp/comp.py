@@ -3,18 +3,31 @@
 from copy import copy
 import imp
 import os
-from subprocess import check_output
+import shutil
 import sys
+import tempfile
+from timeit import default_timer
 
 from . import arenas, matches, scores, teams, venue
+from .cache import BlobStore, FileCache
+from .git_tree import GitTreeCache
+from .load_profile import LoadProfile
 from .winners import compute_awards
 
 
-def load_scorer(root):
+def load_scorer(root, source=None, modules=None):
     """
     Load the scorer module from Compstate repo.
 
     :param str root: The path to the compstate repo.
+    :param bytes source: Optional source code of the scorer module to use
+                         instead of the ``scoring/score.py`` file.
+    :param dict modules: Optional source code (as bytes) of the other
+                         modules in the ``scoring`` directory, keyed by
+                         module name, for the scorer to import instead of
+                         those in ``root``. These are imported afresh, even
+                         if modules of the same names have already been
+                         imported, and are not left in :data:`sys.modules`.
     """
 
     # Deep path hacks
@@ -22,72 +35,239 @@ def load_scorer(root):
     score_source = os.path.join(score_directory, 'score.py')
 
     saved_path = copy(sys.path)
-    sys.path.append(score_directory)
+    saved_modules = {}
+    modules_directory = None
 
-    imported_library = imp.load_source('score.py', score_source)
+    if modules is None:
+        sys.path.append(score_directory)
+    else:
+        modules_directory = tempfile.mkdtemp()
+        for name, module_source in modules.items():
+            module_path = os.path.join(modules_directory, name + '.py')
+            with open(module_path, 'wb') as f:
+                f.write(module_source)
+            saved_modules[name] = sys.modules.pop(name, None)
+        sys.path.append(modules_directory)
 
-    sys.path = saved_path
+    try:
+        if source is None:
+            imported_library = imp.load_source('score.py', score_source)
+        else:
+            imported_library = imp.new_module('score.py')
+            imported_library.__file__ = score_source
+            code = compile(source, score_source, 'exec')
+            exec(code, imported_library.__dict__) # pylint: disable=exec-used
+    finally:
+        sys.path = saved_path
+        for name, module in saved_modules.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+        if modules_directory is not None:
+            shutil.rmtree(modules_directory)
 
     return imported_library.Scorer
 
 
+def _load_scorer_from_cache(root, cache):
+    """
+    Load the scorer of a compstate, reading it and the other modules in its
+    ``scoring`` directory through the given cache.
+
+    The scorer is reused from the cache while none of those files change.
+
+    :param str root: The path to the compstate repo.
+    :param FileCache cache: The cache.
+    :return: A tuple of the scorer class and an identifier for the contents
+             of the files it was loaded from, or ``None`` if the cache has
+             no memo (since it's then not needed).
+    """
+
+    score_source = os.path.join(root, 'scoring', 'score.py')
+    module_paths = [path for path in cache.glob(os.path.join(root, 'scoring',
+                                                             '*.py'))
+                    if os.path.basename(path) != 'score.py']
+
+    def module_name(path):
+        return os.path.splitext(os.path.basename(path))[0]
+
+    def load():
+        modules = dict((module_name(path), cache.read(path))
+                       for path in module_paths)
+        return load_scorer(root, cache.read(score_source), modules)
+
+    key = ('scorer',) + tuple((module_name(path), cache.signature(path))
+                              for path in module_paths)
+    scorer = cache.get(score_source, key, load)
+
+    scorer_id = None
+    if cache.memo is not None:
+        scorer_id = ' '.join([cache.content_id(score_source)] +
+                             [cache.content_id(path) for path in module_paths])
+
+    return scorer, scorer_id
+
+
 class SRComp(object):
     """
     A class containing all the various parts of a competition.
 
     :param str root: The root path of the ``compstate`` repo.
+    :param FileCache cache: An optional cache of the values derived from
+                            the files in the compstate. Most users should
+                            use :meth:`from_previous` or :meth:`reload`
+                            rather than passing this directly.
+    :param bool persistent_cache: Whether to keep the parsed contents of the
+                                  compstate's YAML files in a persistent
+                                  store within its git directory, so that
+                                  future loads (even in other processes) can
+                                  skip parsing unchanged files. Ignored if
+                                  ``cache`` is given.
+    :param int workers: An optional number of worker processes to use to
+                        score the score sheets. See :class:`.Scores`.
+    :param ContentMemo score_memo: An optional memo of the results of
+                                   scoring score sheets, keyed by the
+                                   content of the sheets and of the
+                                   scorer. This may be shared between
+                                   instances for different compstates or
+                                   revisions. Ignored if ``cache`` is given.
     """
 
-    def __init__(self, root):
+    @classmethod
+    def from_previous(cls, previous, root=None, changed_paths=(),
+                      workers=None):
+        """
+        Load a competition, reusing whatever can be reused from a previously
+        loaded instance.
+
+        Score sheets and other files which haven't changed (according to
+        their size and modification time) are not re-parsed or re-scored;
+        everything derived from them (league positions, knockouts, awards
+        and so on) is recomputed as normal. The ``previous`` instance is
+        not modified.
+
+        :param SRComp previous: The previously loaded competition.
+        :param str root: The root path of the ``compstate`` repo. Defaults
+                         to the root of ``previous``.
+        :param changed_paths: An optional iterable of paths (absolute, or
+                              relative to ``root``) which are known to have
+                              changed, and which should therefore be
+                              reloaded regardless of their signatures.
+        :param int workers: As for :class:`SRComp`. Defaults to the value
+                            used for ``previous``.
+        :return: A new :class:`SRComp` instance.
+        """
+
+        # pylint: disable=protected-access
+
+        if root is None:
+            root = previous.root
+
+        if workers is None:
+            workers = previous._workers
+
+        changed_paths = [os.path.join(root, p) for p in changed_paths]
+        cache = FileCache(previous._cache, changed_paths)
+        return cls(root, cache=cache, workers=workers)
+
+    @classmethod
+    def from_revision(cls, repo_path, revision='HEAD', previous=None,
+                      persistent_cache=False, workers=None, score_memo=None):
+        """
+        Load a competition from a revision of a ``compstate`` repo, without
+        needing it to be checked out.
+
+        All the files, including the scorer and the other modules in its
+        ``scoring`` directory, are read directly from the git objects for the
+        revision. The working copy is not touched.
+
+        :param str repo_path: The path to the ``compstate`` repo.
+        :param str revision: The revision to load.
+        :param SRComp previous: An optional previously loaded competition
+                                (from any revision) whose results should be
+                                reused for files which are unchanged.
+        :param bool persistent_cache: As for :class:`SRComp`.
+        :param int workers: As for :class:`SRComp`.
+        :param ContentMemo score_memo: As for :class:`SRComp`. Defaults to
+                                       the memo used by ``previous``.
+        :return: A new :class:`SRComp` instance.
+        """
+
+        store = BlobStore.for_repo(repo_path) if persistent_cache else None
+        # pylint: disable=protected-access
+        previous_cache = previous._cache if previous is not None else None
+
+        with GitTreeCache(repo_path, revision, previous_cache,
+                          store=store, memo=score_memo) as cache:
+            return cls(repo_path, cache=cache, workers=workers)
+
+    def __init__(self, root, cache=None, persistent_cache=False,
+                 workers=None, score_memo=None):
+        # pylint: disable=too-many-statements
         self.root = root
+        self._workers = workers
+
+        profile = LoadProfile()
+        self._profile = profile
+        start = default_timer()
 
-        self.state = check_output(('git', 'rev-parse', 'HEAD'),
-                                  universal_newlines=True,
-                                  cwd=root).strip()
-        """The current commit of the Compstate repository."""
+        if cache is None:
+            store = BlobStore.for_repo(root) if persistent_cache else None
+            cache = FileCache(store=store, memo=score_memo)
+        self._cache = cache
 
-        self.teams = teams.load_teams(os.path.join(root, "teams.yaml"))
-        """A :class:`collections.OrderedDict` mapping TLAs to
-        :class:`sr.comp.teams.Team` objects."""
+        with profile.phase('git'):
+            self.state = cache.commit(root)
+            """The current commit of the Compstate repository."""
 
-        self.arenas = arenas.load_arenas(os.path.join(root, "arenas.yaml"))
-        """A :class:`collections.OrderedDict` mapping arena names to
-        :class:`sr.comp.arenas.Arena` objects."""
+        with profile.phase('teams'):
+            self.teams = teams.load_teams(os.path.join(root, "teams.yaml"),
+                                          cache)
+            """A :class:`collections.OrderedDict` mapping TLAs to
+            :class:`sr.comp.teams.Team` objects."""
 
-        self.corners = arenas.load_corners(os.path.join(root, "arenas.yaml"))
-        """A :class:`collections.OrderedDict` mapping corner numbers to
-        :class:`sr.comp.arenas.Corner` objects."""
+        with profile.phase('arenas'):
+            self.arenas = arenas.load_arenas(os.path.join(root, "arenas.yaml"),
+                                             cache)
+            """A :class:`collections.OrderedDict` mapping arena names to
+            :class:`sr.comp.arenas.Arena` objects."""
+
+            self.corners = arenas.load_corners(os.path.join(root,
+                                                            "arenas.yaml"),
+                                               cache)
+            """A :class:`collections.OrderedDict` mapping corner numbers to
+            :class:`sr.comp.arenas.Corner` objects."""
 
         self.num_teams_per_arena = len(self.corners)
 
-        scorer = load_scorer(root)
-        self.scores = scores.Scores(root, self.teams.keys(), scorer, self.num_teams_per_arena)
-        """A :class:`sr.comp.scores.Scores` instance."""
+        # Reusing the scorer class (rather than re-importing it) when it
+        # hasn't changed is what allows unchanged score sheets' scores to be
+        # reused from the cache.
+        with profile.phase('scorer'):
+            scorer, scorer_id = _load_scorer_from_cache(root, cache)
+
+        with profile.phase('scores'):
+            self.scores = scores.Scores(root, self.teams.keys(), scorer,
+                                        self.num_teams_per_arena, cache,
+                                        workers, scorer_id)
+            """A :class:`sr.comp.scores.Scores` instance."""
 
-        schedule_fname = os.path.join(root, "schedule.yaml")
-        league_fname = os.path.join(root, "league.yaml")
-        self.schedule = matches.MatchSchedule.create(schedule_fname,
-                                                     league_fname, self.scores,
-                                                     self.arenas, self.num_teams_per_arena,
-                                                     self.teams)
-        """A :class:`sr.comp.matches.MatchSchedule` instance."""
+        with profile.phase('schedule'):
+            self.schedule = matches.MatchSchedule.create(
+                os.path.join(root, "schedule.yaml"),
+                os.path.join(root, "league.yaml"), self.scores, self.arenas,
+                self.num_teams_per_arena, self.teams, cache, profile,
+            )
+            """A :class:`sr.comp.matches.MatchSchedule` instance."""
 
         self.timezone = self.schedule.timezone
         """The timezone of the competition."""
 
-        self.awards = compute_awards(self.scores,
-                                     self.schedule.final_match,
-                                     self.teams,
-                                     os.path.join(root, "awards.yaml"))
-        """A :class:`dict` mapping :class:`sr.comp.winners.Award` objects to
-        a :class:`list` of teams."""
-
-        self.venue = venue.Venue(self.teams.keys(),
-                                 os.path.join(root, "layout.yaml"),
-                                 os.path.join(root, "shepherding.yaml"))
-        """A :class:`sr.comp.venue.Venue` instance."""
+        self._awards = None
+        self._venue = None
 
-        self.venue.check_staging_times(self.schedule.staging_times)
+        profile.record('total', default_timer() - start)
 
         pyver = sys.version_info
         if pyver[0] == 3 and (pyver < (3, 4, 4) or pyver == (3, 5, 0)):
@@ -96,3 +276,71 @@ class SRComp(object):
                  "have the same `dst()` and `utcoffset()` values (such as BST). "
                  "Using Python 2 instead is recommended. "
                  "See https://bugs.python.org/issue23600.")
+
+    @property
+    def awards(self):
+        """
+        A :class:`dict` mapping :class:`sr.comp.winners.Award` objects to a
+        :class:`list` of teams.
+
+        The awards are only computed when first accessed.
+        """
+
+        if self._awards is None:
+            with self._profile.phase('awards'):
+                self._awards = compute_awards(self.scores,
+                                              self.schedule.final_match,
+                                              self.teams,
+                                              os.path.join(self.root,
+                                                           "awards.yaml"),
+                                              self._cache)
+        return self._awards
+
+    @property
+    def venue(self):
+        """
+        A :class:`sr.comp.venue.Venue` instance.
+
+        The venue is only loaded (and checked against the staging times of
+        the matches) when first accessed.
+        """
+
+        if self._venue is None:
+            with self._profile.phase('venue'):
+                venue_ = venue.Venue(self.teams.keys(),
+                                     os.path.join(self.root, "layout.yaml"),
+                                     os.path.join(self.root,
+                                                  "shepherding.yaml"),
+                                     self._cache)
+                venue_.check_staging_times(self.schedule.staging_times)
+            self._venue = venue_
+        return self._venue
+
+    @property
+    def load_profile(self):
+        """
+        A :class:`collections.OrderedDict` mapping the names of the phases of
+        loading the competition to a :class:`dict` of the ``time`` (in
+        seconds) spent in each and the ``count`` of times each was entered.
+
+        The phases of building the schedule are prefixed ``schedule.``, and
+        ``total`` covers the whole of the construction of this instance.
+        The knockout scores are only loaded (in the ``scores.knockout``
+        phase) once all the league matches have been scored. The ``awards``
+        and ``venue`` phases only appear once those have been accessed. See also :class:`sr.comp.load_profile.LoadProfile`.
+        """
+        return self._profile.phases
+
+    def reload(self, changed_paths=()):
+        """
+        Load the current state of this competition's ``compstate``, reusing
+        whatever is unchanged from this instance.
+
+        See :meth:`from_previous` for details.
+
+        :param changed_paths: An optional iterable of paths which are known
+                              to have changed.
+        :return: A new :class:`SRComp` instance.
+        """
+
+        return self.from_previous(self, changed_paths=changed_paths)
@@ -0,0 +1,196 @@
+"""A compact, array-backed store of scheduled matches."""
+
+from array import array
+from datetime import timedelta
+
+from dateutil.tz import tzutc
+
+from .match_period import Match
+
+
+_UTC = tzutc()
+
+
+def _int_array(values):
+    """Create the smallest array which can hold the given non-negative ints."""
+    largest = max(values) if values else 0
+    for typecode in ('B', 'H', 'I'):
+        if largest < 2 ** (8 * array(typecode).itemsize):
+            return array(typecode, values)
+    return array('l', values)
+
+
+class _Interner(object):
+    """
+    Assigns a small integer to each distinct value.
+
+    :param key: An optional callable giving the (hashable) key which
+                identifies each value. Defaults to the value itself.
+    """
+
+    def __init__(self, key=None):
+        self.values = []
+        self._ids = {}
+        self._key = key
+
+    def __call__(self, value):
+        key = value if self._key is None else self._key(value)
+        id_ = self._ids.get(key)
+        if id_ is None:
+            id_ = self._ids[key] = len(self.values)
+            self.values.append(value)
+        return id_
+
+
+def _to_microseconds(delta):
+    return (delta.days * 86400 + delta.seconds) * 10 ** 6 + delta.microseconds
+
+
+def _to_utc(time):
+    """
+    Convert an aware datetime to UTC, leaving naive datetimes alone.
+
+    Differences between aware datetimes with the same ``tzinfo`` ignore
+    their UTC offsets, so are wrong across daylight saving changes unless
+    they are converted first.
+    """
+    if time.tzinfo is None:
+        return time
+    return time.astimezone(_UTC)
+
+
+class CompactSchedule(object):
+    """
+    A read-only copy of a list of match slots (such as
+    :attr:`sr.comp.matches.MatchSchedule.matches`), stored in columnar
+    arrays rather than as a :class:`.Match` per match and a :class:`dict`
+    per slot.
+
+    Each match is stored as a row of small integers, indexing into tables
+    of the distinct arenas, teams, types and time zones, and its times as
+    offsets from the start of the first match (in UTC, so that they are
+    correct across daylight saving changes). Display names are only stored
+    where they differ from the default ``'Match {num}'``. This uses roughly
+    an order of magnitude less memory than the list of slots, which helps
+    when many copies of a schedule are held at once.
+
+    The store behaves like the list of slots: indexing or iterating over it
+    gives a :class:`dict` of arena to :class:`.Match` for each slot. These
+    are built on access, so should not be expected to be the same objects
+    each time, though they will compare equal.
+
+    :param list matches: A list of slots, each a :class:`dict` of arena to
+                         :class:`.Match`.
+    """
+
+    def __init__(self, matches):
+        # pylint: disable=too-many-locals
+
+        arenas = _Interner()
+        teams = _Interner()
+        types = _Interner()
+        # Not all tzinfo implementations are hashable
+        timezones = _Interner(key=id)
+
+        slot_offsets = [0]
+        nums = []
+        arena_ids = []
+        team_offsets = [0]
+        team_ids = []
+        starts = []
+        ends = []
+        type_ids = []
+        timezone_ids = []
+        resolved = []
+        self._display_names = {}
+
+        self._epoch = None
+        for slot in matches:
+            for arena, match in slot.items():
+                if self._epoch is None:
+                    self._epoch = _to_utc(match.start_time)
+
+                row = len(nums)
+                nums.append(match.num)
+                arena_ids.append(arenas(arena))
+
+                team_ids += [teams(tla) for tla in match.teams]
+                team_offsets.append(len(team_ids))
+
+                starts.append(_to_microseconds(_to_utc(match.start_time) -
+                                               self._epoch))
+                ends.append(_to_microseconds(_to_utc(match.end_time) -
+                                             self._epoch))
+                timezone_ids.append(timezones(match.start_time.tzinfo))
+
+                type_ids.append(types(match.type))
+                resolved.append(1 if match.use_resolved_ranking else 0)
+
+                if match.display_name != 'Match {0}'.format(match.num):
+                    self._display_names[row] = match.display_name
+
+            slot_offsets.append(len(nums))
+
+        self._arenas = arenas.values
+        self._teams = teams.values
+        self._types = types.values
+        self._timezones = timezones.values
+
+        self._slot_offsets = _int_array(slot_offsets)
+        self._nums = _int_array(nums)
+        self._arena_ids = _int_array(arena_ids)
+        self._team_offsets = _int_array(team_offsets)
+        self._team_ids = _int_array(team_ids)
+        # Doubles hold whole numbers of microseconds exactly for well over
+        # a century, and are available on all platforms and Pythons.
+        self._starts = array('d', starts)
+        self._ends = array('d', ends)
+        self._type_ids = _int_array(type_ids)
+        self._timezone_ids = _int_array(timezone_ids)
+        self._resolved = _int_array(resolved)
+
+    def _time(self, offset, timezone_id):
+        time = self._epoch + timedelta(microseconds=offset)
+        tzinfo = self._timezones[timezone_id]
+        if tzinfo is not None:
+            time = time.astimezone(tzinfo)
+        return time
+
+    def _match(self, row):
+        num = self._nums[row]
+        timezone_id = self._timezone_ids[row]
+        team_ids = self._team_ids[self._team_offsets[row]:
+                                  self._team_offsets[row + 1]]
+
+        return Match(
+            num=num,
+            display_name=self._display_names.get(row,
+                                                 'Match {0}'.format(num)),
+            arena=self._arenas[self._arena_ids[row]],
+            teams=[self._teams[id_] for id_ in team_ids],
+            start_time=self._time(self._starts[row], timezone_id),
+            end_time=self._time(self._ends[row], timezone_id),
+            type=self._types[self._type_ids[row]],
+            use_resolved_ranking=bool(self._resolved[row]),
+        )
+
+    def __len__(self):
+        return len(self._slot_offsets) - 1
+
+    def __getitem__(self, index):
+        num_slots = len(self)
+        if index < 0:
+            index += num_slots
+        if not 0 <= index < num_slots:
+            raise IndexError("slot index out of range")
+
+        rows = range(self._slot_offsets[index], self._slot_offsets[index + 1])
+        slot = {}
+        for row in rows:
+            match = self._match(row)
+            slot[match.arena] = match
+        return slot
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
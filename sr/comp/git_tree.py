@@ -0,0 +1,210 @@
+"""Access to the files within a revision of a git repository."""
+
+from fnmatch import fnmatch
+import os
+import subprocess
+
+from .cache import FileCache
+
+
+class GitTree(object):
+    """
+    The files within a given revision of a git repository.
+
+    The listing of the files is obtained once, from ``git ls-tree``, and
+    their contents are read on demand through a single long-running
+    ``git cat-file --batch`` process rather than via the filesystem. This
+    means that the revision need not be checked out.
+
+    Paths are relative to the root of the repository and use ``/`` as the
+    separator, as git does.
+
+    :param str repo_path: The path to the git repository.
+    :param str revision: The revision to read.
+    """
+
+    def __init__(self, repo_path, revision='HEAD'):
+        self.repo_path = repo_path
+
+        self.commit = self._git('rev-parse', '--verify',
+                                revision + '^{commit}').decode('ascii').strip()
+        """The id of the commit the tree belongs to."""
+
+        self._blobs = {}
+        listing = self._git('ls-tree', '-r', '-z', '--full-tree', self.commit)
+        for entry in listing.split(b'\0'):
+            if not entry:
+                continue
+            info, path = entry.split(b'\t', 1)
+            _, type_, blob_id = info.split()
+            if type_ != b'blob':
+                # Submodules
+                continue
+            self._blobs[path.decode('utf-8')] = blob_id.decode('ascii')
+
+        self._batch = None
+        self._closed = False
+
+    def _git(self, *args):
+        return subprocess.check_output(('git',) + args, cwd=self.repo_path)
+
+    def blob_id(self, path):
+        """
+        Get the id of the blob at the given path.
+
+        :param str path: The path of the file within the tree.
+        :return: The hex blob id.
+        :raises KeyError: If the file doesn't exist in the tree.
+        """
+        return self._blobs[path]
+
+    def exists(self, path):
+        """Whether or not the given file exists within the tree."""
+        return path in self._blobs
+
+    def glob(self, pattern):
+        """
+        Find the files within the tree which match the given pattern.
+
+        As with :func:`glob.glob`, wildcards do not match across path
+        separators.
+
+        :param str pattern: A shell-style pattern.
+        :return: A sorted list of the matching paths.
+        """
+
+        pattern_parts = pattern.split('/')
+
+        def matches(path):
+            parts = path.split('/')
+            return len(parts) == len(pattern_parts) and \
+                all(fnmatch(p, pp) for p, pp in zip(parts, pattern_parts))
+
+        return sorted(path for path in self._blobs if matches(path))
+
+    def read(self, path):
+        """
+        Read the contents of a file within the tree.
+
+        :param str path: The path of the file within the tree.
+        :return: The contents of the file, as bytes.
+        :raises KeyError: If the file doesn't exist in the tree.
+        """
+
+        blob_id = self._blobs[path]
+
+        if self._closed:
+            return self._git('cat-file', 'blob', blob_id)
+
+        if self._batch is None:
+            self._batch = subprocess.Popen(('git', 'cat-file', '--batch'),
+                                           cwd=self.repo_path,
+                                           stdin=subprocess.PIPE,
+                                           stdout=subprocess.PIPE)
+
+        self._batch.stdin.write(blob_id.encode('ascii') + b'\n')
+        self._batch.stdin.flush()
+
+        header = self._batch.stdout.readline().split()
+        if len(header) != 3:
+            raise RuntimeError("Unable to read blob {0} ({1}).".format(blob_id,
+                                                                       path))
+
+        size = int(header[2])
+        content = self._batch.stdout.read(size)
+        # Discard the newline which follows the content
+        self._batch.stdout.read(1)
+
+        return content
+
+    def close(self):
+        """
+        Stop the underlying ``git cat-file`` process, if running.
+
+        The tree can still be read after it has been closed, though each
+        read then uses a separate ``git`` process.
+        """
+        self._closed = True
+        if self._batch is not None:
+            self._batch.stdin.close()
+            self._batch.wait()
+            self._batch.stdout.close()
+            self._batch = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class GitTreeCache(FileCache):
+    """
+    A :class:`.FileCache` whose files are read from a revision of a git
+    repository rather than from the filesystem.
+
+    Paths given to the cache are still absolute (or relative to the current
+    directory) paths within the working copy of the repository, so that
+    the cache can be used in place of a normal :class:`.FileCache`. Entries
+    are reused based on the blob ids of the files.
+
+    :param str repo_path: The path to the git repository.
+    :param str revision: The revision to read.
+    :param FileCache previous: An optional cache whose entries should be
+                               reused by this one, if they are still valid.
+    :param changed_paths: An optional iterable of paths which are known to
+                          have changed since ``previous`` was populated.
+    :param BlobStore store: An optional persistent store used when parsing
+                            YAML files.
+    :param ContentMemo memo: An optional memo of values derived from file
+                             contents.
+    """
+
+    def __init__(self, repo_path, revision='HEAD', previous=None,
+                 changed_paths=(), store=None, memo=None):
+        super(GitTreeCache, self).__init__(previous, changed_paths, store,
+                                           memo)
+        self.root = os.path.abspath(repo_path)
+        self.tree = GitTree(repo_path, revision)
+
+    def _tree_path(self, path):
+        relpath = os.path.relpath(os.path.abspath(path), self.root)
+        return relpath.replace(os.sep, '/')
+
+    def signature(self, path):
+        try:
+            return self.tree.blob_id(self._tree_path(path))
+        except KeyError:
+            raise IOError("No such file in {0}: '{1}'".format(self.tree.commit,
+                                                              path))
+
+    def read(self, path):
+        try:
+            return self.tree.read(self._tree_path(path))
+        except KeyError:
+            raise IOError("No such file in {0}: '{1}'".format(self.tree.commit,
+                                                              path))
+
+    def content_id(self, path):
+        # The signature is already the blob id of the file's contents
+        return self.signature(path)
+
+    def exists(self, path):
+        return self.tree.exists(self._tree_path(path))
+
+    def commit(self, root):
+        return self.tree.commit
+
+    def glob(self, pattern):
+        matches = self.tree.glob(self._tree_path(pattern))
+        return [os.path.join(self.root, *path.split('/')) for path in matches]
+
+    def close(self):
+        """Stop the underlying ``git cat-file`` process, if running."""
+        self.tree.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -1,6 +1,6 @@
 """An automatic seeded knockout schedule."""
 
-import math
+from collections import deque
 from datetime import timedelta
 
 from ..match_period import Match, MatchType
@@ -13,9 +13,11 @@ class KnockoutScheduler(BaseKnockoutScheduler):
     """
     A class that can be used to generate a knockout schedule based on seeding.
 
-    Due to the way the seeding logic works, this class is suitable only when
-    games feature four slots for competitors, with the top two progressing to
-    the next round.
+    The top ``teams_advancing`` teams in each match progress to the next
+    round, which may be set in the knockout configuration and defaults to
+    half of the teams in each match. The winners of whole matches must make
+    up each match of the next round, so the number of teams per arena must
+    be a multiple of the number advancing.
 
     :param schedule: The league schedule.
     :param scores: The scores.
@@ -25,21 +27,7 @@ class KnockoutScheduler(BaseKnockoutScheduler):
     :param config: Custom configuration for the knockout scheduler.
     """
 
-    num_teams_per_arena = 4
-    """
-    Constant value due to the way the automatic seeding works.
-    """
-
     def __init__(self, schedule, scores, arenas, num_teams_per_arena, teams, config):
-        if num_teams_per_arena != self.num_teams_per_arena:
-            raise ValueError(
-                "The automatic knockout scheduler can only be used for {0} teams"
-                " per arena (and not {1})".format(
-                    self.num_teams_per_arena,
-                    num_teams_per_arena,
-                ),
-            )
-
         super(KnockoutScheduler, self).__init__(
             schedule,
             scores,
@@ -49,6 +37,22 @@ class KnockoutScheduler(BaseKnockoutScheduler):
             config,
         )
 
+        self.num_teams_advancing = config["knockout"].get(
+            "teams_advancing",
+            num_teams_per_arena // 2,
+        )
+        """The number of teams which progress from each match."""
+
+        # Raises ValueError if the winners can't make up whole matches
+        self.num_feeding_matches = seeding.num_feeding_matches(
+            num_teams_per_arena,
+            self.num_teams_advancing,
+        )
+        """
+        The number of matches whose winners make up each match of the next
+        round.
+        """
+
         self.R = stable_random.Random()
 
         self.clock = MatchPeriodClock(self.period, self.schedule.delays)
@@ -62,6 +66,8 @@ class KnockoutScheduler(BaseKnockoutScheduler):
 
         self.knockout_rounds += [[]]
 
+        matches = deque(matches)
+
         round_num = 0
         while len(matches):
             # Deliberately not using iterslots since we need to ensure
@@ -71,7 +77,7 @@ class KnockoutScheduler(BaseKnockoutScheduler):
 
             new_matches = {}
             for arena in arenas:
-                teams = matches.pop(0)
+                teams = matches.popleft()
 
                 if len(teams) < self.num_teams_per_arena:
                     # Fill empty zones with None
@@ -109,15 +115,15 @@ class KnockoutScheduler(BaseKnockoutScheduler):
         """
 
         ranking = self.get_ranking(game)
-        return ranking[:2]
+        return ranking[:self.num_teams_advancing]
 
     def _add_round(self, arenas, rounds_remaining):
         prev_round = self.knockout_rounds[-1]
         matches = []
 
-        for i in range(0, len(prev_round), 2):
+        for i in range(0, len(prev_round), self.num_feeding_matches):
             winners = []
-            for parent in prev_round[i:i + 2]:
+            for parent in prev_round[i:i + self.num_feeding_matches]:
                 winners += self.get_winners(parent)
 
             matches.append(winners)
@@ -127,7 +133,7 @@ class KnockoutScheduler(BaseKnockoutScheduler):
     def _add_first_round(self, conf_arity=None):
         next_match_num = len(self.schedule.matches)
         teams = self._get_non_dropped_out_teams(next_match_num)
-        if not self._played_all_league_matches():
+        if not self.played_all_league_matches():
             teams = [UNKNOWABLE_TEAM] * len(teams)
 
         arity = len(teams)
@@ -141,16 +147,22 @@ class KnockoutScheduler(BaseKnockoutScheduler):
 
         matches = []
 
-        for seeds in seeding.first_round_seeding(arity):
+        for seeds in seeding.first_round_seeding(arity,
+                                                 self.num_teams_per_arena,
+                                                 self.num_teams_advancing):
             match_teams = [teams[seed] for seed in seeds]
             matches.append(match_teams)
 
         rounds_remaining = self.get_rounds_remaining(matches)
         self._add_round_of_matches(matches, self.arenas, rounds_remaining)
 
-    @staticmethod
-    def get_rounds_remaining(prev_matches):
-        return int(math.log(len(prev_matches), 2))
+    def get_rounds_remaining(self, prev_matches):
+        rounds = 0
+        num_matches = len(prev_matches)
+        while num_matches > 1:
+            num_matches //= self.num_feeding_matches
+            rounds += 1
+        return rounds
 
     def add_knockouts(self):
         knockout_conf = self.config["knockout"]
@@ -171,7 +183,7 @@ class KnockoutScheduler(BaseKnockoutScheduler):
             else:
                 arenas = self.arenas
 
-            if len(self.knockout_rounds[-1]) == 2:
+            if len(self.knockout_rounds[-1]) == self.num_feeding_matches:
                 # Extra delay before the final match
                 final_delay = timedelta(seconds=knockout_conf["final_delay"])
                 self.clock.advance_time(final_delay)
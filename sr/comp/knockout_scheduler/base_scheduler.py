@@ -44,6 +44,8 @@ class BaseKnockoutScheduler(object):
         # involve the second seed).
         self.knockout_rounds = []
 
+        self._league_complete = None
+
         period_config = self.config["match_periods"]["knockout"][0]
         self.period = MatchPeriod(
             period_config["start_time"],
@@ -56,13 +58,21 @@ class BaseKnockoutScheduler(object):
             MatchType.knockout,
         )
 
-    def _played_all_league_matches(self):
+    def played_all_league_matches(self):
         """
         Check if all league matches have been played.
 
+        The answer is worked out once, since neither the league matches nor
+        their scores change while the knockouts are being added.
+
         :return: :py:bool:`True` if we've played all league matches.
         """
 
+        if self._league_complete is None:
+            self._league_complete = self._find_league_complete()
+        return self._league_complete
+
+    def _find_league_complete(self):
         for arena_matches in self.schedule.matches:
             for match in arena_matches.values():
                 if match.type != MatchType.league:
@@ -101,6 +111,11 @@ class BaseKnockoutScheduler(object):
 
         :param game: A game.
         """
+        if not self.played_all_league_matches():
+            # No knockout match can have been played yet, so avoid loading
+            # the knockout scores (which are only loaded when first needed)
+            return [UNKNOWABLE_TEAM] * self.num_teams_per_arena
+
         desc = (game.arena, game.num)
 
         # Get the resolved positions if present (will be a tla -> position map)
@@ -1,6 +1,3 @@
-import math
-
-
 def bit_mask(n):
     """Return an n-bit mask of 1's."""
 
@@ -8,45 +5,157 @@ def bit_mask(n):
 
 
 def reverse_bits(n, width):
-    """Reverse the bits of ``n``."""
+    """Reverse the lowest ``width`` bits of ``n``."""
+
+    reversed_n = 0
+    for _ in range(width):
+        reversed_n = (reversed_n << 1) | (n & 1)
+        n >>= 1
+    return reversed_n
+
+
+def reverse_digits(n, width, base=2):
+    """Reverse the lowest ``width`` digits of ``n`` in the given base."""
+
+    if base == 2:
+        return reverse_bits(n, width)
+
+    reversed_n = 0
+    for _ in range(width):
+        n, digit = divmod(n, base)
+        reversed_n = reversed_n * base + digit
+    return reversed_n
+
+
+def rotate_digits(n, width, base, offset):
+    """
+    Add ``offset`` to each of the lowest ``width`` digits of ``n`` in the
+    given base, wrapping around within each digit.
+
+    In base 2 with an offset of 1 this is the complement of ``n``.
+    """
 
-    b = '{:0{width}b}'.format(n, width=width)
-    return int(b[::-1], 2)
+    rotated_n = 0
+    scale = 1
+    for _ in range(width):
+        n, digit = divmod(n, base)
+        rotated_n += ((digit + offset) % base) * scale
+        scale *= base
+    return rotated_n
 
 
-def first_round_seeding(n_teams):
+def num_feeding_matches(n_per_match, n_advancing):
+    """
+    Return the number of matches whose winners make up each match of the
+    next round of a knockout.
+
+    :param int n_per_match: The number of teams in each match.
+    :param int n_advancing: The number of teams which advance from each
+                            match to the next round.
+    :raise ValueError: If the winners of whole matches cannot make up the
+                       matches of the next round.
+    """
+
+    if not 0 < n_advancing < n_per_match or n_per_match % n_advancing:
+        raise ValueError(
+            "Cannot seed a knockout with {0} of {1} teams per match "
+            "advancing".format(n_advancing, n_per_match),
+        )
+
+    return n_per_match // n_advancing
+
+
+#: The most teams covered by :func:`seeding_table` by default.
+MAX_TABLE_TEAMS = 256
+
+# The first round seeding for each number of teams, teams per match and
+# number advancing, as tuples
+_seedings = {}
+
+
+def seeding_table(max_teams=MAX_TABLE_TEAMS, n_per_match=4, n_advancing=2):
+    """
+    Return the seed arrangements for the first round of a knockout for every
+    number of teams up to ``max_teams``.
+
+    The arrangements are worked out once and then remembered, and so are
+    returned as tuples so that they cannot be changed.
+
+    :param int max_teams: The most teams to include.
+    :param int n_per_match: The number of teams in each match.
+    :param int n_advancing: The number of teams which advance from each
+                            match to the next round.
+    :return: A :class:`dict` mapping numbers of teams to tuples of matches,
+             each a tuple of seeds, as for :func:`first_round_seeding`.
+    """
+
+    return dict((n_teams, _first_round_seeding(n_teams, n_per_match,
+                                               n_advancing))
+                for n_teams in range(1, max_teams + 1))
+
+
+def first_round_seeding(n_teams, n_per_match=4, n_advancing=2):
     """
     Return the seed arrangement for the first round of a knockout with
-    ``n_teams`` at 4 teams per match.
+    ``n_teams``.
+
+    There are a power of :func:`num_feeding_matches` matches, so that the
+    bracket closes to a single final, and the seeds are spread so that the
+    top seeds meet as late as possible.
+
+    The arrangements are remembered once worked out (see
+    :func:`seeding_table`); a new list is returned each time.
 
     :param int n_teams: The number of teams.
+    :param int n_per_match: The number of teams in each match.
+    :param int n_advancing: The number of teams which advance from each
+                            match to the next round.
     :return: A list of matches.
     """
 
-    # Round the number of teams up to a power of two
-    rounded_teams = int(2 ** math.ceil(math.log(n_teams, 2)))
+    return [list(seeds)
+            for seeds in _first_round_seeding(n_teams, n_per_match,
+                                              n_advancing)]
+
+
+def _first_round_seeding(n_teams, n_per_match, n_advancing):
+    key = (n_teams, n_per_match, n_advancing)
+    try:
+        return _seedings[key]
+    except KeyError:
+        seeding = tuple(tuple(seeds)
+                        for seeds in _calculate_first_round_seeding(*key))
+        _seedings[key] = seeding
+        return seeding
+
+
+def _calculate_first_round_seeding(n_teams, n_per_match, n_advancing):
+    n_feeding = num_feeding_matches(n_per_match, n_advancing)
 
-    n_per_match = 4
-    n_matches = int(math.ceil(float(rounded_teams) / n_per_match))
-    matches_bits = int(math.ceil(math.log(n_matches, 2)))
+    # Find the fewest matches for the teams which closes to a single final
+    n_matches = 1
+    matches_digits = 0
+    while n_matches * n_per_match < n_teams:
+        n_matches *= n_feeding
+        matches_digits += 1
 
     # Find the order in which we repeatedly insert teams into the
-    # match list.
+    # match list, with the digits of the offsets in base ``n_feeding``.
     # The pattern in the insertion offsets is:
-    #  - Even offset: Bitwise reversal of the offset in the offset table
-    #  -  Odd offset: Complement of the previous number
+    #  - First of each group of ``n_feeding`` offsets: Digit reversal of the
+    #    offset in the offset table
+    #  - Others: Each digit of the first of the group rotated by the
+    #    offset's place in the group (so with two matches feeding each
+    #    match, the complement of the previous number)
     # Derived using a similar approach to this website:
     # http://blogs.popart.com/2012/02/things-only-mathematicians-can-get-excited-about/
-    # but for matches with 4 teams in.
+    # but for matches with more than two teams in.
     ins_order = []
     for n in range(n_matches):
-        if n % 2 == 0:
-            # Even
-            v = reverse_bits(n, matches_bits)
-        else:
-            # Odd
-            v ^= bit_mask(matches_bits)
-        ins_order.append(v)
+        place = n % n_feeding
+        first = reverse_digits(n - place, matches_digits, n_feeding)
+        ins_order.append(rotate_digits(first, matches_digits, n_feeding,
+                                       place))
 
     matches = []
     for n in range(n_matches):
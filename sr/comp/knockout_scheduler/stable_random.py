@@ -5,6 +5,10 @@ from __future__ import print_function
 import hashlib
 
 
+#: The most bits which can be generated together.
+MAX_STEP = 21
+
+
 class Random(object):
     """
     Our own random number generator that is guaranteed to be stable.
@@ -32,28 +36,62 @@ class Random(object):
 
         self.state = int(h.hexdigest(), 16) & 0xffffffff
 
-    def _rand_bit(self):
-        bit = self.state & 1
-
-        nb = 0
-        for n in (20, 25, 30, 31):
-            nb ^= (self.state >> n) & 1
-
-        self.state <<= 1
-        self.state |= nb
+    def _advance(self, n):
+        """
+        Generate the next ``n`` bits, where ``n`` is at most
+        :data:`MAX_STEP`.
+
+        The generator is a linear feedback shift register: each new bit is
+        the XOR of the bits 21, 26, 31 and 32 places before it. ``state``
+        holds the last 32 bits, the most recent in the lowest place, and
+        the bits returned lag one behind those generated: the first is the
+        most recent bit already in ``state``. Since the taps are at least
+        21 places back, up to 21 new bits only depend on bits already in
+        ``state``, so they can be found together with a few shifts of it
+        rather than one at a time.
+        """
+
+        state = self.state
+        mask = (1 << n) - 1
+        new = ((state >> (21 - n)) ^ (state >> (26 - n)) ^
+               (state >> (31 - n)) ^ (state >> (32 - n))) & mask
+        state = ((state << n) | new) & 0xffffffff
+        self.state = state
+        return (state >> 1) & mask
 
-        return bit
+    def _rand_bit(self):
+        return self._advance(1)
 
     def getrandbits(self, n):
         v = 0
-        for _ in range(n):
-            v <<= 1
-            v |= self._rand_bit()
+        while n > 0:
+            step = min(n, MAX_STEP)
+            v = (v << step) | self._advance(step)
+            n -= step
         return v
 
     def random(self):
         return self.getrandbits(32) / float(1 << 32)
 
+    @staticmethod
+    def batch(seeds):
+        """
+        Get a batch of generators, one for each seed, which are advanced
+        together.
+
+        This requires :mod:`numpy`, which is an optional dependency.
+
+        :param list seeds: The seeds, as :class:`bytes`.
+        :return: A
+                 :class:`sr.comp.knockout_scheduler.stable_random_batch.RandomBatch`.
+        """
+
+        # Only imported here since numpy is optional
+        from .stable_random_batch import RandomBatch
+        batch = RandomBatch()
+        batch.seed(seeds)
+        return batch
+
     def shuffle(self, x):
         # Based on python's shuffle function
 
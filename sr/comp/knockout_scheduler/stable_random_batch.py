@@ -0,0 +1,107 @@
+"""
+Many stable random number generators, advanced together.
+
+This module requires :mod:`numpy`, which is an optional dependency.
+"""
+
+from __future__ import division
+
+import numpy
+
+from .stable_random import MAX_STEP, Random
+
+
+class RandomBatch(object):
+    """
+    A batch of independently seeded :class:`Random` generators which are
+    advanced together, with their states held in a :mod:`numpy` array.
+
+    Each generator in the batch produces exactly the same sequence as a
+    :class:`Random` given the same seed. This allows, for example, the
+    shuffling of the zones of the knockout matches to be replayed for many
+    different seedings at once::
+
+        batch = RandomBatch()
+        batch.seed(["".join(teams).encode("utf-8") for teams in seedings])
+        for zones in matches:
+            # ``zones`` has a row of teams for each seeding
+            batch.shuffle(zones)
+
+    :param int size: The number of generators in the batch.
+    """
+
+    def __init__(self, size=0):
+        self.state = numpy.zeros(size, dtype=numpy.uint32)
+        """A :class:`numpy.ndarray` of the states of the generators."""
+
+    def __len__(self):
+        return len(self.state)
+
+    def seed(self, seeds):
+        """
+        Seed the generators, replacing the batch with one generator for each
+        seed.
+
+        :param list seeds: The seeds, as :class:`bytes`.
+        """
+
+        states = []
+        for s in seeds:
+            rand = Random()
+            rand.seed(s)
+            states.append(rand.state)
+
+        self.state = numpy.array(states, dtype=numpy.uint32)
+
+    def _advance(self, n):
+        # As Random._advance, but for every state at once. The states are
+        # unsigned 32 bit integers, so any bits shifted past the top are
+        # dropped as they are there.
+        state = self.state
+        mask = numpy.uint32((1 << n) - 1)
+        new = ((state >> (21 - n)) ^ (state >> (26 - n)) ^
+               (state >> (31 - n)) ^ (state >> (32 - n))) & mask
+        state = (state << n) | new
+        self.state = state
+        return (state >> 1) & mask
+
+    def getrandbits(self, n):
+        """
+        Get ``n`` random bits from each generator.
+
+        :param int n: The number of bits, at most 64.
+        :return: A :class:`numpy.ndarray` of unsigned 64 bit integers.
+        """
+
+        if n > 64:
+            raise ValueError("Can only get up to 64 bits at once (not "
+                             "{0})".format(n))
+
+        v = numpy.zeros(len(self.state), dtype=numpy.uint64)
+        while n > 0:
+            step = min(n, MAX_STEP)
+            v = (v << step) | self._advance(step).astype(numpy.uint64)
+            n -= step
+        return v
+
+    def random(self):
+        """
+        Get a random number in the range [0, 1) from each generator.
+
+        :return: A :class:`numpy.ndarray` of floats.
+        """
+
+        return self.getrandbits(32) / float(1 << 32)
+
+    def shuffle(self, x):
+        """
+        Shuffle each row of ``x`` in place with its generator, as
+        :meth:`Random.shuffle` would.
+
+        :param numpy.ndarray x: An array with a row for each generator.
+        """
+
+        rows = numpy.arange(len(self.state))
+        for i in reversed(range(1, x.shape[1])):
+            j = (self.random() * (i + 1)).astype(numpy.intp)
+            x[rows, i], x[rows, j] = x[rows, j], x[rows, i]
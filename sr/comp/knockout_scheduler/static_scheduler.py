@@ -13,7 +13,7 @@ class StaticScheduler(BaseKnockoutScheduler):
     """
 
     def get_team(self, team_ref):
-        if not self._played_all_league_matches():
+        if not self.played_all_league_matches():
             return UNKNOWABLE_TEAM
 
         if team_ref.startswith('S'):
@@ -0,0 +1,241 @@
+"""
+Monte Carlo simulation of the outcome of the league.
+
+The league matches which haven't been scored yet are played out many times
+over at random, with each team's game points in each match drawn from the
+game points it has scored in the league so far. The final league positions
+from each of these trials then give an estimate of how likely each team is
+to finish in each position.
+"""
+
+import multiprocessing
+import random
+
+# For reasons which are not clear, Pylint on Travis doesn't find the ranker.
+from sr.comp import ranker # pylint: disable=no-name-in-module,relative-import
+
+from .match_period import MatchType
+from .scores import LeagueScores, TeamScore
+
+
+#: The number of trials simulated from each seed. Trials are split into
+#: chunks of this size (each with its own seed) so that the results for a
+#: given seed don't depend on how many workers are used.
+CHUNK_SIZE = 250
+
+
+class LeagueSimulation(object):
+    """
+    The results of simulating the remainder of the league.
+
+    :param int trials: The number of trials which were simulated.
+    :param dict position_counts: A mapping of TLAs to lists of the number of
+                                 trials in which the team finished in each
+                                 league position (the first entry being for
+                                 first place).
+    """
+
+    def __init__(self, trials, position_counts):
+        self.trials = trials
+        """The number of trials which were simulated."""
+
+        self.position_counts = position_counts
+        """
+        A :class:`dict` mapping TLAs to a :class:`list` of the number of
+        trials in which the team finished in each league position, the first
+        entry being for first place. Tied teams share a position, as in
+        :attr:`sr.comp.scores.LeagueScores.positions`.
+        """
+
+    def probabilities(self, tla):
+        """
+        Get the estimated probability of a team finishing in each position.
+
+        :param str tla: The TLA of the team.
+        :return: A :class:`list` of probabilities, the first entry being for
+                 first place.
+        """
+
+        return [count / float(self.trials)
+                for count in self.position_counts[tla]]
+
+    def probability_in_top(self, tla, num_positions):
+        """
+        Get the estimated probability of a team finishing in one of the top
+        positions, for example within the knockout ``arity``.
+
+        :param str tla: The TLA of the team.
+        :param int num_positions: The number of top positions.
+        """
+
+        counts = self.position_counts[tla][:num_positions]
+        return sum(counts) / float(self.trials)
+
+
+def remaining_league_matches(schedule, league_scores):
+    """
+    Find the league matches which haven't been scored yet.
+
+    :param schedule: A :class:`sr.comp.matches.MatchSchedule` instance.
+    :param league_scores: A :class:`sr.comp.scores.LeagueScores` instance.
+    :return: A :class:`list` of the :class:`.Match` instances.
+    """
+
+    remaining = []
+    for slot in schedule.matches:
+        for match in slot.values():
+            if match.type != MatchType.league:
+                continue
+            if (match.arena, match.num) not in league_scores.game_points:
+                remaining.append(match)
+    return remaining
+
+
+def game_points_history(league_scores):
+    """
+    Get the game points each team has scored in the league so far.
+
+    Teams which haven't played yet are given the game points of every team
+    so far, and if there are none of those then a single score of zero.
+
+    :param league_scores: A :class:`sr.comp.scores.LeagueScores` instance.
+    :return: A :class:`dict` mapping TLAs to a non-empty :class:`list` of
+             game points.
+    """
+
+    histories = {tla: [] for tla in league_scores.teams}
+    everything = []
+    for match_id in sorted(league_scores.game_points):
+        for tla, points in sorted(league_scores.game_points[match_id].items()):
+            histories[tla].append(points)
+            everything.append(points)
+
+    for tla, history in histories.items():
+        if not history:
+            history.extend(everything or [0])
+    return histories
+
+
+def _simulate_chunk(args):
+    """
+    Simulate a chunk of trials.
+
+    This is a module-level function so that it can be run in a worker
+    process; everything it needs is passed in ``args``.
+    """
+
+    # pylint: disable=too-many-locals
+    seed, trials, totals, matches, histories, num_teams_per_arena = args
+
+    rand = random.Random(seed)
+    random_ = rand.random
+    counts = {tla: [0] * len(totals) for tla in totals}
+
+    matches = [[(tla, histories[tla], len(histories[tla])) for tla in teams]
+               for teams in matches]
+
+    # The ranker only depends on the order of the points (and which are
+    # tied), so its results can be reused for any match with the same order.
+    ranked_cache = {}
+
+    for _ in range(trials):
+        league = {tla: points[0] for tla, points in totals.items()}
+        game = {tla: points[1] for tla, points in totals.items()}
+
+        for teams in matches:
+            sampled = [history[int(random_() * size)]
+                       for _, history, size in teams]
+            distinct = sorted(set(sampled))
+            order = tuple(distinct.index(points) for points in sampled)
+
+            ranked = ranked_cache.get(order)
+            if ranked is None:
+                positions = ranker.calc_positions(dict(enumerate(order)), ())
+                ranked_points = ranker.calc_ranked_points(positions, (),
+                                                          num_teams_per_arena)
+                ranked = ranked_cache[order] = [ranked_points[zone]
+                                                for zone in range(len(order))]
+
+            for (tla, _, _), points, ranked_points in zip(teams, sampled,
+                                                          ranked):
+                game[tla] += points
+                league[tla] += ranked_points
+
+        team_scores = {tla: TeamScore(league[tla], game[tla]) for tla in totals}
+        for tla, position in LeagueScores.rank_league(team_scores).items():
+            counts[tla][position - 1] += 1
+
+    return counts
+
+
+def _build_chunks(comp, trials, seed):
+    """
+    Split the trials into chunks, each with its own seed drawn from
+    ``seed``, ready to pass to :func:`_simulate_chunk`.
+    """
+
+    league_scores = comp.scores.league
+    totals = {tla: (score.league_points, score.game_points)
+              for tla, score in league_scores.teams.items()}
+    histories = game_points_history(league_scores)
+    matches = [[tla for tla in match.teams if tla is not None]
+               for match in remaining_league_matches(comp.schedule,
+                                                     league_scores)]
+
+    rand = random.Random(seed)
+    return [(rand.getrandbits(64), min(CHUNK_SIZE, trials - start),
+             totals, matches, histories, comp.num_teams_per_arena)
+            for start in range(0, trials, CHUNK_SIZE)]
+
+
+def _merge_counts(tlas, results):
+    """
+    Add up the position counts from each chunk of trials.
+
+    :param tlas: The TLAs of all the teams.
+    :param list results: The counts from each chunk, as returned by
+                         :func:`_simulate_chunk`.
+    :return: A :class:`dict` mapping TLAs to lists of total counts.
+    """
+
+    position_counts = {tla: [0] * len(tlas) for tla in tlas}
+    for counts in results:
+        for tla, team_counts in counts.items():
+            total_counts = position_counts[tla]
+            for i, count in enumerate(team_counts):
+                total_counts[i] += count
+    return position_counts
+
+
+def simulate_league(comp, trials=10000, seed=None, workers=None):
+    """
+    Simulate the remainder of the league.
+
+    Each team in each unscored league match is given game points chosen at
+    random from those it has scored in previous league matches (see
+    :func:`game_points_history`), which are then ranked exactly as a real
+    match would be. Teams are assumed to be present and not disqualified.
+
+    :param comp: A :class:`sr.comp.comp.SRComp` instance.
+    :param int trials: The number of trials to simulate.
+    :param seed: An optional seed for the random choices. The results for a
+                 given seed are always the same.
+    :param int workers: An optional number of worker processes to spread the
+                        trials over.
+    :return: A :class:`LeagueSimulation` instance.
+    """
+
+    chunks = _build_chunks(comp, trials, seed)
+
+    if workers is not None and workers > 1 and len(chunks) > 1:
+        pool = multiprocessing.Pool(workers)
+        try:
+            results = pool.map(_simulate_chunk, chunks)
+        finally:
+            pool.terminate()
+            pool.join()
+    else:
+        results = [_simulate_chunk(chunk) for chunk in chunks]
+
+    position_counts = _merge_counts(comp.scores.league.teams, results)
+    return LeagueSimulation(trials, position_counts)
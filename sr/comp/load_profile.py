@@ -0,0 +1,63 @@
+"""Timing of the phases of loading a competition."""
+
+from collections import OrderedDict
+from contextlib import contextmanager
+import logging
+from timeit import default_timer
+
+
+logger = logging.getLogger(__name__)
+
+
+class LoadProfile(object):
+    """
+    A record of the wall time spent in each phase of loading a competition.
+
+    Each phase is also logged (at ``DEBUG`` level) as it completes.
+    """
+
+    def __init__(self):
+        self.phases = OrderedDict()
+        """
+        A :class:`collections.OrderedDict` mapping the names of the phases,
+        in the order they were first entered (or recorded), to a
+        :class:`dict` of the total ``time`` (in seconds) spent in the phase
+        and the ``count`` of times the phase was completed.
+        """
+
+    def _entry(self, name):
+        entry = self.phases.get(name)
+        if entry is None:
+            entry = self.phases[name] = {'time': 0.0, 'count': 0}
+        return entry
+
+    def record(self, name, seconds):
+        """
+        Record time spent in a phase.
+
+        :param str name: The name of the phase.
+        :param float seconds: The wall time spent in the phase.
+        """
+
+        entry = self._entry(name)
+        entry['time'] += seconds
+        entry['count'] += 1
+
+        logger.debug("Loading phase '%s' took %.3fs", name, seconds)
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Time the phase which runs within the context.
+
+        :param str name: The name of the phase.
+        """
+
+        # Ensure that nested phases appear after this one
+        self._entry(name)
+
+        start = default_timer()
+        try:
+            yield
+        finally:
+            self.record(name, default_timer() - start)
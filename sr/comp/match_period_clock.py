@@ -1,5 +1,7 @@
 """A clock to manage match periods."""
 
+from collections import deque
+
 
 class OutOfTimeException(Exception):
     """
@@ -50,7 +52,7 @@ class MatchPeriodClock(object):
         """Create a new clock for the given period and collection of delays."""
         self._period = period
 
-        self._delays = self.delays_for_period(period, delays)
+        self._delays = deque(self.delays_for_period(period, delays))
 
         # The current time, including any delays
         self._current_time = period.start_time
@@ -109,8 +111,8 @@ class MatchPeriodClock(object):
 
     def _apply_delays(self):
         delays = self._delays
-        while len(delays) and delays[0].time <= self._current_time:
-            self._apply_delay(delays.pop(0).delay)
+        while delays and delays[0].time <= self._current_time:
+            self._apply_delay(delays.popleft().delay)
 
     def _apply_delay(self, delay):
         self._current_time += delay
@@ -1,6 +1,8 @@
 """Match schedule library."""
 
-from collections import namedtuple
+from bisect import bisect_left, bisect_right
+from collections import defaultdict, namedtuple
+import copy
 import datetime
 from datetime import timedelta
 
@@ -9,7 +11,9 @@ from dateutil.tz import gettz
 from . import yaml_loader
 from .match_period import MatchPeriod, Match, MatchType
 from .match_period_clock import MatchPeriodClock
-from .knockout_scheduler import KnockoutScheduler, StaticScheduler
+from .knockout_scheduler import KnockoutScheduler, StaticScheduler, \
+                                UNKNOWABLE_TEAM
+from .load_profile import LoadProfile
 
 
 class WrongNumberOfTeams(Exception):
@@ -44,13 +48,84 @@ def parse_ranges(ranges):
             result.append(a)
     return set(result)
 
+class TimeIndex(object):
+    """
+    An index of items by the intervals of time which they span, allowing
+    lookups in logarithmic time.
+
+    The intervals may have differing lengths, and may overlap. Lookups
+    return items in the order in which they were given to the index.
+
+    :param list items: The items to index.
+    :param start: A callable which gets the start time of an item.
+    :param end: A callable which gets the end time of an item (exclusive).
+    """
+
+    def __init__(self, items, start, end):
+        entries = sorted(enumerate(items), key=lambda e: (start(e[1]), e[0]))
+
+        self._starts = [start(item) for _, item in entries]
+        self._ends = [end(item) for _, item in entries]
+        self._entries = entries
+
+        durations = [e - s for s, e in zip(self._starts, self._ends)]
+        self._max_duration = max(durations) if durations else timedelta()
+
+    def _items(self, lo, hi, end_after=None):
+        found = [self._entries[i] for i in range(lo, hi)
+                 if end_after is None or end_after < self._ends[i]]
+        found.sort(key=lambda e: e[0])
+        return [item for _, item in found]
+
+    def at(self, date):
+        """
+        Get the items whose intervals contain the given ``date``.
+
+        :param datetime date: The date to look up.
+        :return: A list of the items.
+        """
+
+        # No item which started at or before this can still be running
+        lo = bisect_right(self._starts, date - self._max_duration)
+        hi = bisect_right(self._starts, date)
+        return self._items(lo, hi, end_after=date)
+
+    def starting_between(self, start, end):
+        """
+        Get the items which start within the given range.
+
+        :param datetime start: The start of the range (inclusive).
+        :param datetime end: The end of the range (exclusive).
+        :return: A list of the items.
+        """
+
+        lo = bisect_left(self._starts, start)
+        hi = bisect_left(self._starts, end)
+        return self._items(lo, max(lo, hi))
+
+    def first_starting_after(self, date):
+        """
+        Get the items which have the earliest start time after ``date``.
+
+        :param datetime date: The date to look after.
+        :return: A list of the items, all of which start at the same time.
+        """
+
+        lo = bisect_right(self._starts, date)
+        if lo == len(self._starts):
+            return []
+        hi = bisect_right(self._starts, self._starts[lo])
+        return self._items(lo, hi)
+
+
 class MatchSchedule(object):
     """
     A match schedule.
     """
 
     @classmethod
-    def create(cls, config_fname, league_fname, scores, arenas, num_teams_per_arena, teams):
+    def create(cls, config_fname, league_fname, scores, arenas, num_teams_per_arena, teams,
+               cache=None, profile=None):
         """
         Create a new match schedule around the given config data.
 
@@ -60,27 +135,48 @@ class MatchSchedule(object):
         :param dict arenas: A mapping of arena ids to :class:`.Arena` instances.
         :param int num_teams_per_arena: The usual number of teams per arena.
         :param dict teams: A mapping of TLAs to :class:`.Team` instances.
+        :param cache: An optional :class:`sr.comp.cache.FileCache`.
+        :param profile: An optional :class:`sr.comp.load_profile.LoadProfile`
+                        to record the time taken by each phase in.
         """
 
-        y = yaml_loader.load(config_fname)
+        if profile is None:
+            profile = LoadProfile()
+
+        with profile.phase('schedule.yaml'):
+            y = yaml_loader.cached_load(config_fname, cache)
 
-        league = yaml_loader.load(league_fname)['matches']
+            league = yaml_loader.cached_load(league_fname, cache)['matches']
 
-        schedule = cls(y, league, teams, num_teams_per_arena)
+        with profile.phase('schedule.league'):
+            schedule = cls(y, league, teams, num_teams_per_arena)
 
         if y['knockout'].get('static', False):
             knockout_scheduler = StaticScheduler
         else:
             knockout_scheduler = KnockoutScheduler
 
+        # Kept so that the knockouts can be worked out again for other scores
+        schedule._knockout_setup = (knockout_scheduler, arenas, y)
+
         k = knockout_scheduler(schedule, scores, arenas, num_teams_per_arena, teams, y)
-        k.add_knockouts()
+
+        if k.played_all_league_matches():
+            # The knockouts depend on the knockout scores, which are only
+            # loaded when first needed. Load them in their own phase so that
+            # the time isn't counted as scheduling the knockouts.
+            with profile.phase('scores.knockout'):
+                scores.knockout # pylint: disable=pointless-statement
+
+        with profile.phase('schedule.knockouts'):
+            k.add_knockouts()
 
         schedule.knockout_rounds = k.knockout_rounds
         schedule.match_periods.append(k.period)
 
         if 'tiebreaker' in y:
-            schedule.add_tiebreaker(scores, y['tiebreaker'])
+            with profile.phase('schedule.tiebreaker'):
+                schedule.add_tiebreaker(scores, y['tiebreaker'])
 
         return schedule
 
@@ -128,12 +224,24 @@ class MatchSchedule(object):
         self.n_planned_league_matches = 0
         """The number of planned league matches."""
 
+        self._knockout_setup = None
+        self._reset_indexes()
+
         self._build_matchlist(league)
 
         self.timezone = gettz(y.get('timezone', 'UTC'))
 
         self.n_league_matches = self.n_matches()
 
+    def _reset_indexes(self):
+        self._match_index = None
+        self._period_index = None
+
+        self._slots_by_num = {}
+        self._matches_by_id = {}
+        self._team_matches = defaultdict(list)
+        self._n_indexed_slots = 0
+
     def _load_match_slot_lengths(self, yamldata):
         durations = {key: datetime.timedelta(0, value)
                      for key, value in yamldata.items()}
@@ -252,7 +360,7 @@ class MatchSchedule(object):
             raise Exception("Matches are not a complete 0-N range")
 
         # Effectively just the .values(), except that it's ordered by number
-        raw_matches = [yamldata[m] for m in match_numbers]
+        raw_matches = iter([yamldata[m] for m in match_numbers])
 
         match_n = 0
 
@@ -266,8 +374,8 @@ class MatchSchedule(object):
             # Fill this match period with matches
             for start in clock.iterslots(self.match_duration):
                 try:
-                    arenas = raw_matches.pop(0)
-                except IndexError:
+                    arenas = next(raw_matches)
+                except StopIteration:
                     # no more matches left
                     break
 
@@ -328,6 +436,28 @@ class MatchSchedule(object):
 
         return total
 
+    def _get_match_index(self):
+        # Matches are added to the schedule after it is created (for
+        # example by the knockout schedulers), but are never removed.
+        index = self._match_index
+        if index is None or index[0] != len(self.matches):
+            all_matches = [match for slot in self.matches
+                           for match in slot.values()]
+            index = (len(self.matches),
+                     TimeIndex(all_matches, lambda m: m.start_time,
+                               lambda m: m.end_time))
+            self._match_index = index
+        return index[1]
+
+    def _get_period_index(self):
+        index = self._period_index
+        if index is None or index[0] != len(self.match_periods):
+            index = (len(self.match_periods),
+                     TimeIndex(self.match_periods, lambda p: p.start_time,
+                               lambda p: p.max_end_time))
+            self._period_index = index
+        return index[1]
+
     def matches_at(self, date):
         """
         Get all the matches that occur around a specific ``date``.
@@ -336,10 +466,130 @@ class MatchSchedule(object):
         :return: An iterable list of matches.
         """
 
-        for slot in self.matches:
+        return self._get_match_index().at(date)
+
+    def next_match_after(self, date):
+        """
+        Get the matches which are next to start after a specific ``date``.
+
+        :param datetime date: The date to look after.
+        :return: A list of the matches (one per arena in use) which start at
+                 the earliest time after ``date``, or an empty list if there
+                 are no more matches.
+        """
+
+        return self._get_match_index().first_starting_after(date)
+
+    def matches_between(self, start, end):
+        """
+        Get all the matches which start within a range of dates.
+
+        :param datetime start: The start of the range (inclusive).
+        :param datetime end: The end of the range (exclusive).
+        :return: A list of the matches, in schedule order.
+        """
+
+        return self._get_match_index().starting_between(start, end)
+
+    def hypothetical_knockouts(self, scores):
+        """
+        Work out what the knockouts would be with different scores, leaving
+        this schedule as it is.
+
+        The knockouts are scheduled again after just the league matches, by
+        the same scheduler and with the same config as this schedule's
+        were, so the matches have the same numbers and times as in
+        :attr:`knockout_rounds`. Nothing else is rebuilt.
+
+        :param scores: The scores to schedule the knockouts for, for example
+                       the competition's with some hypothetical knockout
+                       results (see :func:`sr.comp.what_if.knockout_what_if`).
+                       Only the ``league`` and ``knockout`` scores are used.
+        :return: A list of the knockout matches by round, like
+                 :attr:`knockout_rounds`.
+        :raises ValueError: If this schedule wasn't made by :meth:`create`.
+        """
+
+        if self._knockout_setup is None:
+            raise ValueError("Only schedules made by MatchSchedule.create "
+                             "know how to schedule their knockouts")
+        knockout_scheduler, arenas, config = self._knockout_setup
+
+        league_only = copy.copy(self)
+        league_only.matches = self.matches[:self.n_league_matches]
+        league_only._reset_indexes()
+
+        k = knockout_scheduler(league_only, scores, arenas, self._num_corners,
+                               self.teams, config)
+        k.add_knockouts()
+        return k.knockout_rounds
+
+    def _index_new_slots(self):
+        # Slots are only ever appended to the schedule, so we only need to
+        # index those which have been added since we last looked.
+        for slot in self.matches[self._n_indexed_slots:]:
             for match in slot.values():
-                if match.start_time <= date < match.end_time:
-                    yield match
+                self._slots_by_num[match.num] = slot
+                self._matches_by_id[(match.arena, match.num)] = match
+                for team in set(match.teams):
+                    if team is not None:
+                        self._team_matches[team].append(match)
+        self._n_indexed_slots = len(self.matches)
+
+    def _get_team_matches(self, tla):
+        self._index_new_slots()
+        return self._team_matches.get(tla, ())
+
+    def get_match(self, arena, num):
+        """
+        Get a scheduled match.
+
+        :param str arena: The arena the match is in.
+        :param int num: The number of the match.
+        :return: The :class:`.Match`.
+        :raises KeyError: If there is no such match.
+        """
+
+        self._index_new_slots()
+        return self._matches_by_id[(arena, num)]
+
+    def get_slot(self, num):
+        """
+        Get the slot of the schedule containing the given match number.
+
+        :param int num: The number of the match.
+        :return: A :class:`dict` of arena to :class:`.Match` for the slot.
+        :raises KeyError: If there is no such match.
+        """
+
+        self._index_new_slots()
+        return self._slots_by_num[num]
+
+    def matches_for_team(self, tla):
+        """
+        Get all the matches which a team is scheduled to appear in.
+
+        :param str tla: The TLA of the team.
+        :return: A list of the team's matches, in schedule order.
+        """
+
+        return list(self._get_team_matches(tla))
+
+    def next_match_for_team(self, tla, after):
+        """
+        Get the next match which a team is scheduled to appear in.
+
+        :param str tla: The TLA of the team.
+        :param datetime after: The date to look after.
+        :return: The first of the team's matches which starts after
+                 ``after``, or ``None`` if there isn't one.
+        """
+
+        for match in self._get_team_matches(tla):
+            if match.start_time > after:
+                return match
+
+        return None
 
     def period_at(self, date):
         """
@@ -349,9 +599,9 @@ class MatchSchedule(object):
         :return: The period at that time or ``None``.
         """
 
-        for period in self.match_periods:
-            if period.start_time <= date < period.max_end_time:
-                return period
+        periods = self._get_period_index().at(date)
+        if periods:
+            return periods[0]
 
         return None
 
@@ -388,6 +638,11 @@ class MatchSchedule(object):
         # pylint: disable=too-many-locals
 
         finals_info = self.knockout_rounds[-1][0]
+        if UNKNOWABLE_TEAM in finals_info.teams:
+            # The finals can't have been played yet, so there's no need to
+            # load the knockout scores
+            return
+
         finals_key = (finals_info.arena, finals_info.num)
         try:
             finals_positions = scores.knockout.game_positions[finals_key]
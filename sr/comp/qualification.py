@@ -0,0 +1,821 @@
+"""
+Exact analysis of the possible outcomes of the league.
+
+For each team this finds the best and worst places in the league which it
+could still finish in, given the league matches which haven't been scored
+yet. Any outcome of those matches is considered possible, including teams
+being absent from (or disqualified in) them.
+
+Teams are placed as the knockouts are seeded: by league points, then by game
+points, then by TLA. Game points aren't bounded, so a team which plays in
+any of the remaining matches could win any tie on league points.
+"""
+
+from collections import deque, namedtuple, OrderedDict
+from itertools import combinations, product
+
+# For reasons which are not clear, Pylint on Travis doesn't find the ranker.
+from sr.comp import ranker # pylint: disable=no-name-in-module,relative-import
+
+from .league_simulation import remaining_league_matches
+
+
+#: The most states the search for a team's worst place may visit in each
+#: independent group of teams. Beyond this the search gives up and uses its
+#: upper bound instead, so a team's worst place may be reported as worse
+#: than it really is, but never as better.
+MAX_SEARCH_NODES = 500
+
+
+class PositionBounds(namedtuple('PositionBounds', ['best', 'worst'])):
+    """The best and worst places in the league a team could finish in."""
+
+    __slots__ = ()
+
+    def qualified(self, arity):
+        """
+        Check whether the team is certain to finish within the given number
+        of places, for example the knockout ``arity``.
+        """
+        return self.worst <= arity
+
+    def eliminated(self, arity):
+        """
+        Check whether the team can no longer finish within the given number
+        of places, for example the knockout ``arity``.
+        """
+        return self.best > arity
+
+
+def knockout_arity(schedule):
+    """
+    Get the number of teams which go through to the knockouts.
+
+    :param schedule: A :class:`sr.comp.matches.MatchSchedule` instance.
+    :return: The number of teams in the first round of the knockouts.
+    """
+
+    return sum(1 for match in schedule.knockout_rounds[0]
+               for tla in match.teams if tla is not None)
+
+
+def _match_outcomes(num_teams, num_teams_per_arena):
+    """
+    Get the league points of every outcome of a match between the given
+    number of teams (all present), from the best for the first team to the
+    best for the last.
+    """
+
+    if not num_teams:
+        return [()]
+
+    # Every ordered arrangement of the teams, including ties, given as
+    # points which the ranker will order them by
+    orders = [order for order in product(range(num_teams), repeat=num_teams)
+              if set(order) == set(range(max(order) + 1))]
+    orders.sort(key=lambda order: [-points for points in order])
+
+    outcomes = []
+    for order in orders:
+        positions = ranker.calc_positions(dict(enumerate(order)), ())
+        ranked_points = ranker.calc_ranked_points(positions, (),
+                                                  num_teams_per_arena)
+        outcomes.append(tuple(ranked_points[zone]
+                              for zone in range(num_teams)))
+    return outcomes
+
+
+class _Catchers(object):
+    """
+    Finds the largest number of teams which can all reach their targets.
+
+    A quick guess at the outcomes of the matches is usually the best or
+    close to it, and an upper bound on the number of teams which can reach
+    their targets usually shows which. Only when it doesn't is there a
+    branch and bound search over the outcomes of the matches, in order,
+    which is then mostly spent proving that nothing better than the guess
+    exists.
+
+    :param dict needs: A mapping of TLAs to the points they need.
+    :param list matches: The matches, each a list of the TLAs in it.
+    :param gains: A function giving the possible points for the teams in a
+                  match, given the number of teams.
+    :param ceiling: The most points a team can get from a match.
+    :param step: The points a team gets for each team it finishes ahead of
+                 in a match, if that is how ``gains`` works (see
+                 :func:`_pairwise_step`), otherwise ``None``.
+    :param int max_nodes: The most states to visit before giving up.
+    """
+
+    def __init__(self, needs, matches, gains, ceiling, step=None,
+                 max_nodes=MAX_SEARCH_NODES):
+        self._gains = gains
+        self._ceiling = ceiling
+        self._step = step
+
+        # The least points which the given number of teams in the same
+        # match lose between them, compared to each coming first
+        self._losses = [num_teams * ceiling - sum(gains(num_teams)[0])
+                        for num_teams in range(max(len(teams)
+                                                   for teams in matches) + 1)]
+
+        self.matches = matches
+        self.initial = dict(needs)
+
+        self.last_match = {}
+        self._team_matches = {tla: [] for tla in needs}
+        for i, teams in enumerate(matches):
+            for tla in teams:
+                self.last_match[tla] = i
+                self._team_matches[tla].append(i)
+
+        # The teams which play in each match or later, in a fixed order
+        self.live = []
+        live = set()
+        for teams in reversed(matches):
+            live.update(teams)
+            self.live.append(sorted(live))
+        self.live.reverse()
+        self.live.append([])
+
+        # The number of matches each team has from each match onwards
+        self.remaining = []
+        counts = dict.fromkeys(needs, 0)
+        for teams in reversed(matches):
+            for tla in teams:
+                counts[tla] += 1
+            self.remaining.append(dict(counts))
+        self.remaining.reverse()
+        self.remaining.append(counts)
+
+        self._best = -1
+        self._seen = {}
+        self._nodes_left = max_nodes
+        self._root_bound = len(needs)
+
+    def solve(self):
+        """
+        Get the largest number of teams which can reach their targets, or an
+        upper bound on it if the search gives up.
+        """
+
+        self._best, failed = self._first_guess(())
+        bound = self._upper_bound(0, self.initial)
+        if self._best < bound and self._step is not None:
+            bound = min(bound, len(self.initial) - _num_deficient(
+                self.initial, self.matches, self._gains, self._step,
+            ))
+        self._root_bound = bound
+
+        # Giving up on the teams furthest from their targets leaves more
+        # points for the others, so the guess can often be improved on
+        given_up = set()
+        while self._best < bound and failed:
+            given_up.add(max(failed, key=self.initial.get))
+            reached, failed = self._first_guess(given_up)
+            self._best = max(self._best, reached)
+
+        if self._best < bound:
+            self._search()
+            if self._nodes_left < 0:
+                return max(self._best, self._root_bound)
+        return self._best
+
+    def _sorted_teams(self, index, needs):
+        """
+        Get the teams in the match at ``index`` which still need points,
+        those with the fewest points to spare first.
+        """
+
+        remaining = self.remaining[index]
+        teams = [tla for tla in self.matches[index] if needs[tla]]
+        teams.sort(key=lambda tla: self._ceiling * remaining[tla] - needs[tla])
+        return teams
+
+    def _after(self, index, needs, teams, points):
+        """
+        Get the needs of the given teams after they get the given points in
+        the match at ``index``.
+        """
+
+        remaining = self.remaining[index]
+        after = []
+        for tla, gained in zip(teams, points):
+            need = needs[tla] - gained
+            if need <= 0:
+                need = 0
+            elif need > self._ceiling * (remaining[tla] - 1):
+                need = None
+            after.append(need)
+        return tuple(after)
+
+    def _finished(self, index, needs):
+        """
+        Count the teams whose last match is at ``index`` and have reached
+        their targets.
+        """
+        return sum(1 for tla in self.matches[index]
+                   if self.last_match[tla] == index and needs[tla] == 0)
+
+    def _first_guess(self, given_up):
+        """
+        Get the number of teams which reach their targets when every match
+        has the outcome which the search would try first, and the teams
+        which don't.
+
+        :param given_up: The teams to treat as unable to reach their
+                         targets from the start.
+        """
+
+        needs = dict(self.initial)
+        needs.update(dict.fromkeys(given_up))
+        reached = 0
+        for index in range(len(self.matches)):
+            teams = self._sorted_teams(index, needs)
+            needs.update(zip(teams, self._after(index, needs, teams,
+                                                self._gains(len(teams))[0])))
+            reached += self._finished(index, needs)
+
+        failed = [tla for tla, need in needs.items()
+                  if need != 0 and tla not in given_up]
+        return reached, failed
+
+    def _upper_bound(self, index, needs):
+        """
+        Get an upper bound on the number of teams which play in the match at
+        ``index`` or later that can reach their targets.
+
+        This is those which still can, less one for each of a set of
+        distinct groups of them which can't all do so: between them they
+        must lose more points in the matches they share than they can
+        afford to.
+        """
+
+        remaining = self.remaining[index]
+        slack = {}
+        bound = 0
+        for tla in self.live[index]:
+            need = needs[tla]
+            if need is not None:
+                bound += 1
+                if need:
+                    slack[tla] = self._ceiling * remaining[tla] - need
+
+        losses = self._losses
+        grouped = set()
+        for seed in sorted(slack, key=slack.get):
+            if seed in grouped:
+                continue
+
+            # Grow a group from the tightest team, adding whichever of the
+            # teams it plays next costs the group the most
+            group = set()
+            counts = {}
+            gains = {}
+            self._add_to_group(seed, index, group, grouped, slack, counts,
+                               gains)
+            excess = -slack[seed]
+            while excess <= 0 and gains:
+                best_tla = max(gains, key=gains.get)
+                best_gain = gains[best_tla]
+                if best_gain <= 0:
+                    break
+                self._add_to_group(best_tla, index, group, grouped, slack,
+                                   counts, gains)
+                excess += best_gain
+
+            if excess > 0:
+                grouped.update(group)
+                bound -= self._failures(group, counts, slack, excess)
+
+        return bound
+
+    def _add_to_group(self, tla, index, group, grouped, slack, counts,
+                      gains):
+        """
+        Add a team to a group being grown by :meth:`_upper_bound`.
+
+        ``counts`` maps the matches at ``index`` or later which the group's
+        teams play in to how many of them play in each, and ``gains`` maps
+        the teams which could join the group (those in one of its matches
+        which need points and aren't in another group) to how much closer
+        each would bring the group to losing more points than it can afford
+        to. Both are kept up to date here, which only involves the teams
+        in the added team's matches.
+        """
+
+        losses = self._losses
+        group.add(tla)
+        gains.pop(tla, None)
+        for i in self._team_matches[tla]:
+            if i < index:
+                continue
+            count = counts.get(i, 0)
+            counts[i] = count + 1
+            for other in self.matches[i]:
+                if other in group or other in grouped or other not in slack:
+                    continue
+                if other in gains:
+                    gains[other] += (losses[count + 2] - 2 * losses[count + 1] +
+                                     losses[count])
+                else:
+                    gain = -slack[other]
+                    for j in self._team_matches[other]:
+                        if j in counts:
+                            gain += losses[counts[j] + 1] - losses[counts[j]]
+                    gains[other] = gain
+
+    def _failures(self, group, counts, slack, excess):
+        """
+        Get the least number of the teams in a group which must fail to
+        reach their targets, given how many more points (``excess``) the
+        group must lose than it can afford to.
+
+        Each team which fails reduces the excess by at most the points it
+        would lose, less its slack; these reductions are largest for the
+        first team to fail since the least points a match's teams lose
+        between them grows faster the more teams there are.
+        """
+
+        losses = self._losses
+        reductions = []
+        for tla in group:
+            reduction = -slack[tla]
+            for j in self._team_matches[tla]:
+                if j in counts:
+                    reduction += losses[counts[j]] - losses[counts[j] - 1]
+            reductions.append(reduction)
+        reductions.sort(reverse=True)
+
+        failures = 0
+        for reduction in reductions:
+            failures += 1
+            excess -= reduction
+            if excess <= 0:
+                break
+        return failures
+
+    def _search(self):
+        """
+        Search the outcomes of the matches for a better set than the best
+        found so far.
+
+        This is a depth first search, kept on an explicit stack rather than
+        by recursion so that any number of matches can be searched.
+        """
+
+        stack = [(self._root_bound, iter([(0, self.initial, 0)]))]
+        while stack:
+            bound, children = stack[-1]
+            child = next(children, None)
+            if (child is None or self._best >= bound or
+                    self._nodes_left < 0):
+                stack.pop()
+                continue
+
+            frame = self._visit(bound, *child)
+            if frame is not None:
+                stack.append(frame)
+
+    def _visit(self, bound, index, needs, reached):
+        """
+        Visit a state of the search, before the match at ``index``.
+
+        ``needs`` maps the TLAs of the teams which play in that match or
+        later to the points they still need, which is zero if they've
+        reached their target and ``None`` if they no longer can.
+        ``reached`` is the number of other teams which have reached their
+        targets.
+
+        :return: The bound and an iterator over the arguments for the
+                 following states worth visiting, or ``None`` if there
+                 aren't any.
+        """
+
+        self._nodes_left -= 1
+        if self._nodes_left < 0:
+            return None
+
+        bound = min(bound, reached + self._upper_bound(index, needs))
+        if bound <= self._best:
+            return None
+
+        if index == len(self.matches):
+            self._best = reached
+            return None
+
+        # Don't search from the same state again unless more teams have
+        # reached their targets on the way
+        key = (index, tuple(needs[tla] for tla in self.live[index]))
+        if self._seen.get(key, -1) >= reached:
+            return None
+        self._seen[key] = reached
+
+        # Only the teams which still need points matter here; the others
+        # may as well be absent
+        teams = self._sorted_teams(index, needs)
+        candidates = [self._after(index, needs, teams, points)
+                      for points in self._gains(len(teams))]
+        return bound, self._children(index, needs, reached, teams,
+                                     _undominated(candidates))
+
+    def _children(self, index, needs, reached, teams, candidates):
+        """Generate the states after each outcome of a match."""
+
+        live = self.live[index + 1]
+        for after in candidates:
+            next_needs = dict(needs)
+            next_needs.update(zip(teams, after))
+            yield (index + 1, {tla: next_needs[tla] for tla in live},
+                   reached + self._finished(index, next_needs))
+
+
+def _undominated(candidates):
+    """
+    Filter the possible needs of the teams in a match after it down to
+    those which aren't worse for every team than some other possibility,
+    keeping their order. Needs of ``None`` (unreachable) are the worst.
+    """
+
+    # Many outcomes leave the teams needing the same, so compare each
+    # distinct possibility once, with unreachable needs as infinite
+    infinity = float('inf')
+    distinct = OrderedDict()
+    for candidate in candidates:
+        if candidate not in distinct:
+            distinct[candidate] = tuple(infinity if need is None else need
+                                        for need in candidate)
+
+    undominated = []
+    for candidate, needs in distinct.items():
+        dominated = False
+        for other, other_needs in distinct.items():
+            if other != candidate and all(
+                    a >= b for a, b in zip(needs, other_needs)):
+                dominated = True
+                break
+        if not dominated:
+            undominated.append(candidate)
+    return undominated
+
+
+def _pairwise_step(gains, max_teams):
+    """
+    Find how many points a team gets for each team it finishes ahead of in a
+    match, if every outcome gives each team that (shared equally with any it
+    ties with) on top of a fixed amount for the number of teams in the
+    match, as the usual ranking does.
+
+    :return: The points, or ``None`` if the outcomes don't work that way.
+    """
+
+    step = None
+    for num_teams in range(2, max_teams + 1):
+        outcomes = gains(num_teams)
+        base = outcomes[0][-1]
+        if step is None:
+            step = outcomes[0][-2] - base
+            if step <= 0:
+                return None
+
+        for outcome in outcomes:
+            for points in outcome:
+                below = sum(1 for other in outcome if other < points)
+                tied = sum(1 for other in outcome if other == points) - 1
+                if points != base + step * (below + tied / 2.0):
+                    return None
+    return step
+
+
+def _num_deficient(needs, matches, gains, step):
+    """
+    Count a set of distinct groups of teams which can't all reach their
+    targets, and so each contain at least one team which won't.
+
+    Each team gets the points for the last place in each of its matches,
+    plus ``step`` for each team in the match which it finishes ahead of.
+    Allowing each pair of teams in a match to share the ``step`` for the
+    pair between them as they like (even when no order of the teams would
+    give that) turns whether the teams can all reach their targets into a
+    maximum flow problem, from the pairs to the teams. If they can't, the
+    teams which the flow can't reach more of make a group which can't,
+    whatever the other teams do; these are set aside and the rest checked
+    again.
+    """
+
+    # pylint: disable=too-many-locals
+    needs = dict(needs)
+    deficient = 0
+    while needs:
+        demands = dict(needs)
+        pairs = []
+        for teams in matches:
+            teams = [tla for tla in teams if tla in needs]
+            base = gains(len(teams))[0][-1] if teams else 0
+            for tla in teams:
+                demands[tla] -= base
+            pairs.extend(combinations(teams, 2))
+
+        tlas = sorted(needs)
+        nodes = {tla: 2 + len(pairs) + i for i, tla in enumerate(tlas)}
+        flow = _Flow(2 + len(pairs) + len(tlas))
+        for i, pair in enumerate(pairs):
+            flow.add_edge(0, 2 + i, step)
+            for tla in pair:
+                flow.add_edge(2 + i, nodes[tla], step)
+
+        required = 0
+        for tla in tlas:
+            if demands[tla] > 0:
+                flow.add_edge(nodes[tla], 1, demands[tla])
+                required += demands[tla]
+
+        if flow.max_flow(0, 1) >= required:
+            break
+
+        deficient += 1
+        reachable = flow.reachable(0)
+        for tla in tlas:
+            if nodes[tla] not in reachable:
+                del needs[tla]
+    return deficient
+
+
+class _Flow(object):
+    """
+    A flow network, for finding maximum flows.
+
+    :param int num_nodes: The number of nodes, which are numbered from 0.
+    """
+
+    def __init__(self, num_nodes):
+        # Each edge is a list of the node it goes to, its spare capacity
+        # and the index of its reverse edge in that node's list
+        self._edges = [[] for _ in range(num_nodes)]
+        self._levels = None
+        self._next = None
+
+    def add_edge(self, start, end, capacity):
+        """Add an edge with the given capacity."""
+        self._edges[start].append([end, capacity, len(self._edges[end])])
+        self._edges[end].append([start, 0, len(self._edges[start]) - 1])
+
+    def reachable(self, source):
+        """Get the nodes which more flow could still reach."""
+
+        reached = set([source])
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            for end, capacity, _ in self._edges[node]:
+                if capacity > 0 and end not in reached:
+                    reached.add(end)
+                    queue.append(end)
+        return reached
+
+    def max_flow(self, source, sink):
+        """
+        Find the maximum flow, which is then left in the network.
+
+        This is Dinic's algorithm: flow is pushed along the shortest paths
+        with spare capacity, which are found by a breadth first search,
+        until there aren't any.
+        """
+
+        total = 0
+        while True:
+            self._levels = [None] * len(self._edges)
+            self._levels[source] = 0
+            queue = deque([source])
+            while queue:
+                node = queue.popleft()
+                for end, capacity, _ in self._edges[node]:
+                    if capacity > 0 and self._levels[end] is None:
+                        self._levels[end] = self._levels[node] + 1
+                        queue.append(end)
+            if self._levels[sink] is None:
+                return total
+
+            self._next = [0] * len(self._edges)
+            while True:
+                pushed = self._push(source, sink, float('inf'))
+                if not pushed:
+                    break
+                total += pushed
+
+    def _push(self, node, sink, limit):
+        """Push flow along a shortest path with spare capacity."""
+
+        if node == sink:
+            return limit
+
+        edges = self._edges[node]
+        while self._next[node] < len(edges):
+            edge = edges[self._next[node]]
+            end, capacity, reverse = edge
+            if capacity > 0 and self._levels[end] == self._levels[node] + 1:
+                pushed = self._push(end, sink, min(limit, capacity))
+                if pushed:
+                    edge[1] -= pushed
+                    self._edges[end][reverse][1] += pushed
+                    return pushed
+            self._next[node] += 1
+        return 0
+
+
+def _components(needs, matches):
+    """Split the teams and matches into independent groups."""
+
+    parent = {tla: tla for tla in needs}
+
+    def find(tla):
+        while parent[tla] != tla:
+            parent[tla] = parent[parent[tla]]
+            tla = parent[tla]
+        return tla
+
+    for teams in matches:
+        for tla in teams[1:]:
+            parent[find(tla)] = find(teams[0])
+
+    groups = OrderedDict()
+    for tla in sorted(needs):
+        groups.setdefault(find(tla), ({}, []))[0][tla] = needs[tla]
+    for teams in matches:
+        groups[find(teams[0])][1].append(teams)
+    return groups.values()
+
+
+class LeagueAnalysis(object):
+    """
+    Analysis of the places teams could finish the league in.
+
+    :param schedule: A :class:`sr.comp.matches.MatchSchedule` instance.
+    :param league_scores: A :class:`sr.comp.scores.LeagueScores` instance.
+    :param int num_teams_per_arena: The usual number of teams per arena.
+    :param dict teams: An optional mapping of TLAs to :class:`.Team`
+                       instances; teams which have dropped out aren't
+                       expected in matches after they dropped out.
+    """
+
+    def __init__(self, schedule, league_scores, num_teams_per_arena,
+                 teams=None):
+        self._num_teams_per_arena = num_teams_per_arena
+
+        self._keys = {tla: (score.league_points, score.game_points, tla)
+                      for tla, score in league_scores.teams.items()}
+
+        self._matches = []
+        self._num_matches = dict.fromkeys(self._keys, 0)
+        for match in remaining_league_matches(schedule, league_scores):
+            match_teams = [tla for tla in match.teams
+                           if tla is not None and
+                           (teams is None or
+                            teams[tla].is_still_around(match.num))]
+            for tla in match_teams:
+                self._num_matches[tla] += 1
+            self._matches.append(match_teams)
+
+        self._outcomes = {}
+        self.ceiling = self.outcomes(1)[0][0]
+        """The most league points a team can get from a single match."""
+
+        # A team which plays in a match can always do at least as well as
+        # coming last in a full arena, without affecting any other team
+        self._floor = min(self.outcomes(num_teams_per_arena)[0])
+        self._gains = {}
+        self._step = _pairwise_step(self._gains_above_floor,
+                                    num_teams_per_arena)
+
+        # Teams level on league points often have the same rivals, needing
+        # the same points in the same matches, so share the searches
+        self._catchers = {}
+
+    def outcomes(self, num_teams):
+        """
+        Get the league points of every outcome of a match between the given
+        number of teams, who are all present and not disqualified.
+
+        :param int num_teams: The number of teams.
+        :return: A :class:`list` of tuples of the points of each team.
+        """
+
+        outcomes = self._outcomes.get(num_teams)
+        if outcomes is None:
+            outcomes = self._outcomes[num_teams] = _match_outcomes(
+                num_teams, self._num_teams_per_arena,
+            )
+        return outcomes
+
+    def _gains_above_floor(self, num_teams):
+        gains = self._gains.get(num_teams)
+        if gains is None:
+            gains = self._gains[num_teams] = [
+                tuple(points - self._floor for points in outcome)
+                for outcome in self.outcomes(num_teams)
+            ]
+        return gains
+
+    def best_position(self, tla):
+        """
+        Get the best place in the league a team could finish in.
+
+        This is when the team wins all its remaining matches and every other
+        team is absent from all of theirs.
+
+        :param str tla: The TLA of the team.
+        """
+
+        league, game, _ = self._keys[tla]
+        if self._num_matches[tla]:
+            league += self.ceiling * self._num_matches[tla]
+            game = float('inf')
+        key = (league, game, tla)
+
+        return 1 + sum(1 for other in self._keys.values() if other > key)
+
+    def worst_position(self, tla):
+        """
+        Get the worst place in the league a team could finish in.
+
+        This is when the team is absent from all its remaining matches, and
+        as many other teams as possible get enough league points to pass it.
+        Finding those teams is a search over the outcomes of the matches
+        between them, though teams which can't pass the team, or are sure
+        to (even by coming last in all their matches), are left out of it.
+
+        The search is limited to :data:`MAX_SEARCH_NODES` states for each
+        independent group of teams; in the rare cases where that isn't
+        enough, the place given may be worse than the team's true worst
+        place, but is never better than it.
+
+        :param str tla: The TLA of the team.
+        """
+
+        key = self._keys[tla]
+        league = key[0]
+
+        ahead = 0
+        needs = {}
+        for other, other_key in self._keys.items():
+            if other == tla:
+                continue
+            if other_key > key:
+                ahead += 1
+                continue
+
+            num_matches = self._num_matches[other]
+            need = league - other_key[0]
+            if not num_matches or need > self.ceiling * num_matches:
+                continue
+            need -= self._floor * num_matches
+            if need <= 0:
+                # Level (at least) on league points, so ahead on game points
+                # by playing at all
+                ahead += 1
+            else:
+                needs[other] = need
+
+        matches = []
+        for teams in self._matches:
+            teams = [other for other in teams if other in needs]
+            if teams:
+                matches.append(teams)
+
+        for group_needs, group_matches in _components(needs, matches):
+            key = (tuple(sorted(group_needs.items())),
+                   tuple(tuple(teams) for teams in group_matches))
+            num_catchers = self._catchers.get(key)
+            if num_catchers is None:
+                catchers = _Catchers(group_needs, group_matches,
+                                     self._gains_above_floor,
+                                     self.ceiling - self._floor, self._step)
+                num_catchers = self._catchers[key] = catchers.solve()
+            ahead += num_catchers
+
+        return 1 + ahead
+
+    def position_bounds(self):
+        """
+        Get the best and worst places in the league of every team.
+
+        :return: A :class:`dict` mapping TLAs to :class:`PositionBounds`.
+        """
+
+        return {tla: PositionBounds(self.best_position(tla),
+                                    self.worst_position(tla))
+                for tla in self._keys}
+
+
+def league_position_bounds(comp):
+    """
+    Get the best and worst places in the league which each team of a
+    competition could still finish in.
+
+    :param comp: A :class:`sr.comp.comp.SRComp` instance.
+    :return: A :class:`dict` mapping TLAs to :class:`PositionBounds`.
+    """
+
+    analysis = LeagueAnalysis(comp.schedule, comp.scores.league,
+                              comp.num_teams_per_arena, comp.teams)
+    return analysis.position_bounds()
@@ -23,9 +23,16 @@ class RawCompstate(object):
 
     # Load and save related functionality
 
-    def load(self):
-        """Load the state as an ``SRComp`` instance."""
-        return SRComp(self._path)
+    def load(self, revision=None):
+        """
+        Load the state as an ``SRComp`` instance.
+
+        :param str revision: An optional revision to load the state from,
+                             rather than the working copy.
+        """
+        if revision is None:
+            return SRComp(self._path)
+        return SRComp.from_revision(self._path, revision)
 
     def load_shepherds(self):
         """Load the shepherds' state."""
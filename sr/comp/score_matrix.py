@@ -0,0 +1,79 @@
+"""
+Array views of scores, for vectorised analysis.
+
+This module requires :mod:`numpy`, which is an optional dependency.
+"""
+
+import numpy
+
+
+class ScoreMatrix(object):
+    """
+    The scores for a set of matches as teams by matches arrays.
+
+    Row ``i`` of each array is for the team ``teams[i]`` and column ``j``
+    is for the match ``match_ids[j]``. Entries for teams which weren't in a
+    match are ``NaN`` in the numeric arrays and ``False`` in the masks, so
+    that, for example, each team's mean game points are given by
+    ``numpy.nanmean(matrix.game_points, axis=1)``.
+
+    :param scores: A :class:`sr.comp.scores.BaseScores` instance.
+    """
+
+    def __init__(self, scores):
+        self.teams = sorted(scores.teams)
+        """A sorted :class:`list` of the TLAs of the teams."""
+
+        self.match_ids = sorted(scores.game_points,
+                                key=lambda match_id: (match_id[1], match_id[0]))
+        """
+        A :class:`list` of the ``(arena_id, match_num)`` of the matches, in
+        order of match number.
+        """
+
+        self.team_index = {tla: i for i, tla in enumerate(self.teams)}
+        """A :class:`dict` mapping TLAs to their rows."""
+
+        self.match_index = {match_id: j
+                            for j, match_id in enumerate(self.match_ids)}
+        """A :class:`dict` mapping match ids to their columns."""
+
+        shape = (len(self.teams), len(self.match_ids))
+
+        self.game_points = numpy.full(shape, numpy.nan)
+        """The game points of each team in each match."""
+
+        self.ranked_points = numpy.full(shape, numpy.nan)
+        """The normalised (league) points of each team in each match."""
+
+        self.positions = numpy.full(shape, numpy.nan)
+        """The game position (``1`` for first) of each team in each match."""
+
+        self.played = numpy.zeros(shape, dtype=bool)
+        """Whether each team was in each match."""
+
+        self.absent = numpy.zeros(shape, dtype=bool)
+        """Whether each team was absent from each match."""
+
+        self.disqualified = numpy.zeros(shape, dtype=bool)
+        """Whether each team was disqualified from each match."""
+
+        team_index = self.team_index
+        for j, match_id in enumerate(self.match_ids):
+            for tla, points in scores.game_points[match_id].items():
+                i = team_index[tla]
+                self.played[i, j] = True
+                self.game_points[i, j] = points
+
+            for tla, points in scores.ranked_points[match_id].items():
+                self.ranked_points[team_index[tla], j] = points
+
+            for position, tlas in scores.game_positions[match_id].items():
+                for tla in tlas:
+                    self.positions[team_index[tla], j] = position
+
+            for tla in scores.absent[match_id]:
+                self.absent[team_index[tla], j] = True
+
+            for tla in scores.disqualified[match_id]:
+                self.disqualified[team_index[tla], j] = True
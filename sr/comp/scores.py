@@ -1,11 +1,14 @@
 """Utilities for working with scores."""
 
+from bisect import bisect_left, insort
 from collections import OrderedDict
 from functools import total_ordering
 import glob
+import multiprocessing
 import os
 
 from . import yaml_loader
+from .cache import FileCache, git_blob_id
 
 # For reasons which are not clear, Pylint on Travis doesn't find the ranker.
 from sr.comp import ranker # pylint: disable=no-name-in-module,relative-import
@@ -37,43 +40,105 @@ class TeamScore(object):
     """
     A team score.
 
+    Team scores are ordered by their league points and then by their game
+    points, and are greater than anything which isn't a team score.
+
+    Team scores are mutable (points are added to them as matches are scored)
+    and so aren't hashable; see :class:`FrozenTeamScore` for an immutable,
+    hashable, variant.
+
     :param int league: The league points.
     :param int game: The game points.
     """
 
+    __slots__ = ('league_points', 'game_points')
+
     def __init__(self, league=0, game=0):
         self.league_points = league
         self.game_points = game
 
-    @property
-    def _ordering_key(self):
-        # Sort lexicographically by league points, then game points
-        return self.league_points, self.game_points
+    def freeze(self):
+        """
+        Get an immutable copy of this score.
+
+        :return: A :class:`FrozenTeamScore`.
+        """
+        return FrozenTeamScore(self.league_points, self.game_points)
 
     def __eq__(self, other):
-        # pylint: disable=protected-access
-        return (isinstance(other, type(self)) and
-                self._ordering_key == other._ordering_key)
+        return (isinstance(other, TeamScore) and
+                self.league_points == other.league_points and
+                self.game_points == other.game_points)
 
     # total_ordering doesn't provide this!
     def __ne__(self, other):
         return not (self == other)
 
+    # Mutable, so must not be hashable (also under Python 2)
+    __hash__ = None
+
     def __lt__(self, other):
-        if not isinstance(other, type(self)):
+        if not isinstance(other, TeamScore):
             # TeamScores are greater than other things (that have no score)
             return False
 
-        # pylint: disable=protected-access
-        return self._ordering_key < other._ordering_key
+        # Sort lexicographically by league points, then game points
+        if self.league_points != other.league_points:
+            return self.league_points < other.league_points
+        return self.game_points < other.game_points
+
+    def __reduce__(self):
+        return type(self), (self.league_points, self.game_points)
 
     def __repr__(self):
-        return "TeamScore({0}, {1})".format(self.league_points,
-                                            self.game_points)
+        return "{0}({1}, {2})".format(type(self).__name__,
+                                      self.league_points,
+                                      self.game_points)
+
+
+class FrozenTeamScore(TeamScore):
+    """
+    An immutable, hashable, :class:`TeamScore`, suitable for publishing
+    results which shouldn't change.
+
+    :param int league: The league points.
+    :param int game: The game points.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, league=0, game=0):
+        # pylint: disable=super-init-not-called
+        object.__setattr__(self, 'league_points', league)
+        object.__setattr__(self, 'game_points', game)
+
+    def freeze(self):
+        return self
 
+    def __setattr__(self, name, value):
+        raise AttributeError("{0} is immutable".format(type(self).__name__))
 
-def results_finder(root):
-    """An iterator that finds score sheet files."""
+    def __delattr__(self, name):
+        raise AttributeError("{0} is immutable".format(type(self).__name__))
+
+    def __hash__(self):
+        return hash((self.league_points, self.game_points))
+
+
+def results_finder(root, cache=None):
+    """
+    An iterator that finds score sheet files.
+
+    :param str root: The directory containing the score sheets, grouped
+                     into a sub-directory per arena.
+    :param cache: An optional :class:`sr.comp.cache.FileCache` through which
+                  to find the files.
+    """
+
+    if cache is not None:
+        for resfile in cache.glob(os.path.join(root, "*", "*.yaml")):
+            yield resfile
+        return
 
     for dname in glob.glob(os.path.join(root, "*")):
         if not os.path.isdir(dname):
@@ -107,6 +172,175 @@ def get_validated_scores(scorer_cls, input_data):
     return scores
 
 
+def score_sheet(scorer_cls, input_data, num_teams_per_arena):
+    """
+    Score the data from a score sheet.
+
+    :param scorer_cls: The scorer logic.
+    :param dict input_data: The parsed score sheet.
+    :param int num_teams_per_arena: The usual number of teams per arena.
+    :return: A tuple of the match id, game points, game positions, ranked
+             points, absent teams and disqualified teams for the match.
+    """
+
+    match_id = (input_data["arena_id"], input_data["match_number"])
+
+    game_points = get_validated_scores(scorer_cls, input_data)
+
+    # Build the disqualification dict
+    dsq = []
+    absent = set()
+    disqualified = set()
+    for tla, scoreinfo in input_data["teams"].items():
+        # disqualifications and non-presence are effectively the same
+        # in terms of league points awarding.
+        if not scoreinfo.get("present", True):
+            absent.add(tla)
+        if scoreinfo.get("disqualified", False):
+            disqualified.add(tla)
+        if tla in absent or tla in disqualified:
+            dsq.append(tla)
+
+    positions = ranker.calc_positions(game_points, dsq)
+    ranked_points = ranker.calc_ranked_points(positions, dsq,
+                                              num_teams_per_arena)
+
+    return (match_id, game_points, positions, ranked_points,
+            frozenset(absent), frozenset(disqualified))
+
+
+def score_sheet_cache_key(scorer_cls, num_teams_per_arena):
+    """
+    Get the :class:`sr.comp.cache.FileCache` key for the results of
+    :func:`score_sheet`.
+    """
+    # The scorer is part of the key since the same score sheet may have been
+    # scored by a different version of the scoring code.
+    return ('scores', scorer_cls, num_teams_per_arena)
+
+
+def score_sheet_memo_key(content, scorer_id, num_teams_per_arena):
+    """
+    Get the :class:`sr.comp.cache.ContentMemo` key for the results of
+    :func:`score_sheet`.
+
+    :param bytes content: The raw content of the score sheet.
+    :param str scorer_id: An identifier for the version of the scorer logic.
+    :param int num_teams_per_arena: The usual number of teams per arena.
+    """
+    # Versioned since the memo may be persistent, and the form of the
+    # results has changed over time.
+    return ('scores-v2', git_blob_id(content), scorer_id,
+            num_teams_per_arena)
+
+
+# State for the worker processes used by `prescore_sheets`. Since these are
+# always forked, this is set before the pool is created rather than being
+# passed to the workers; the scorer classes loaded from compstates generally
+# can't be pickled.
+_worker_args = None
+
+
+def _score_sheet_in_worker(content):
+    cache, scorer_cls, num_teams_per_arena = _worker_args
+    try:
+        return score_sheet(scorer_cls, cache.loads(content),
+                           num_teams_per_arena)
+    except Exception: # pylint: disable=broad-except
+        # Let the parent process score this sheet itself, so that any errors
+        # are raised from there exactly as they would be without workers.
+        return None
+
+
+def _get_fork_context():
+    try:
+        return multiprocessing.get_context('fork')
+    except AttributeError:
+        # Python 2, which always forks on the platforms which support it
+        return multiprocessing if hasattr(os, 'fork') else None
+    except ValueError:
+        # Forking isn't supported on this platform
+        return None
+
+
+def prescore_sheets(resfiles, cache, scorer, num_teams_per_arena, workers,
+                    scorer_id=None):
+    """
+    Parse and score the given score sheets using a pool of worker processes,
+    storing the results in the cache.
+
+    Score sheets which already have valid results in the cache (or its memo)
+    are skipped, as are any which can't be scored (these are left for the
+    caller to score in-process so that errors are reported as usual). Does
+    nothing on platforms which don't support forking processes.
+
+    :param list resfiles: The paths to the score sheets.
+    :param cache: The :class:`sr.comp.cache.FileCache` to populate.
+    :param scorer: The scorer logic.
+    :param int num_teams_per_arena: The usual number of teams per arena.
+    :param int workers: The number of worker processes to use.
+    :param str scorer_id: An optional identifier for the version of the
+                          scorer logic, used to key the cache's memo.
+    """
+
+    # pylint: disable=global-statement,too-many-locals
+
+    global _worker_args
+
+    context = _get_fork_context()
+    if context is None:
+        return
+
+    key = score_sheet_cache_key(scorer, num_teams_per_arena)
+
+    memo = cache.memo if scorer_id is not None else None
+
+    signatures = []
+    contents = []
+    todo = []
+    for resfile in resfiles:
+        if cache.contains(resfile, key):
+            continue
+
+        # Get the signature before reading the file, as the cache does
+        signature = cache.signature(resfile)
+        content = cache.read(resfile)
+
+        if memo is not None:
+            memo_key = score_sheet_memo_key(content, scorer_id,
+                                            num_teams_per_arena)
+            result = memo.get(memo_key)
+            if result is not None:
+                cache.put(resfile, key, signature, result)
+                continue
+
+        signatures.append(signature)
+        contents.append(content)
+        todo.append(resfile)
+
+    if not todo:
+        return
+
+    _worker_args = (cache, scorer, num_teams_per_arena)
+    pool = context.Pool(workers)
+    try:
+        chunksize = max(1, len(todo) // (workers * 4))
+        results = pool.map(_score_sheet_in_worker, contents, chunksize)
+    finally:
+        _worker_args = None
+        pool.terminate()
+        pool.join()
+
+    for resfile, signature, content, result in zip(todo, signatures,
+                                                   contents, results):
+        if result is not None:
+            cache.put(resfile, key, signature, result)
+            if memo is not None:
+                memo_key = score_sheet_memo_key(content, scorer_id,
+                                                num_teams_per_arena)
+                memo.put(memo_key, result)
+
+
 def degroup(grouped_positions):
     """
     Given a mapping of positions to collections ot teams at that position,
@@ -135,11 +369,21 @@ class BaseScores(object):
     :param dict teams: The teams in the competition.
     :param dict scorer: The scorer logic.
     :param int num_teams_per_arena: The usual number of teams per arena.
+    :param cache: An optional :class:`sr.comp.cache.FileCache` used to avoid
+                  re-scoring score sheets which haven't changed.
+    :param str scorer_id: An optional identifier for the version of the
+                          scorer logic (such as the git blob id of its
+                          source). If given, and the cache has a memo, the
+                          results of scoring are memoised by the content of
+                          the score sheets.
     """
 
-    def __init__(self, resultdir, teams, scorer, num_teams_per_arena):
+    def __init__(self, resultdir, teams, scorer, num_teams_per_arena,
+                 cache=None, scorer_id=None):
         self._scorer = scorer
+        self._scorer_id = scorer_id
         self._num_corners = num_teams_per_arena
+        self._cache = cache
 
         self.game_points = {}
         """
@@ -164,6 +408,20 @@ class BaseScores(object):
         they would earn for that match.
         """
 
+        self.absent = {}
+        """
+        The teams which were absent from each match. Keys are tuples of the
+        form ``(arena_id, match_num)``, values are :class:`frozenset` s of
+        TLAs.
+        """
+
+        self.disqualified = {}
+        """
+        The teams which were disqualified from each match. Keys are tuples
+        of the form ``(arena_id, match_num)``, values are
+        :class:`frozenset` s of TLAs.
+        """
+
         self.teams = {}
         """
         Points for each team earned during this portion of the competition.
@@ -175,7 +433,7 @@ class BaseScores(object):
             self.teams[tla] = TeamScore()
 
         # Find the scores for each match
-        for resfile in results_finder(resultdir):
+        for resfile in results_finder(resultdir, cache):
             self._load_resfile(resfile)
 
         # Sum the game for each team
@@ -186,28 +444,61 @@ class BaseScores(object):
                 self.teams[tla].game_points += score
 
     def _load_resfile(self, fname):
-        y = yaml_loader.load(fname)
-
-        match_id = (y["arena_id"], y["match_number"])
+        if self._cache is None:
+            result = self._score_resfile(fname)
+        else:
+            key = score_sheet_cache_key(self._scorer, self._num_corners)
+            result = self._cache.get(fname, key,
+                                     lambda: self._score_resfile(fname))
+
+        match_id, game_points, positions, ranked_points, absent, \
+            disqualified = result
         if match_id in self.game_points:
             raise DuplicateScoresheet(match_id)
 
-        game_points = get_validated_scores(self._scorer, y)
         self.game_points[match_id] = game_points
+        self.game_positions[match_id] = positions
+        self.ranked_points[match_id] = ranked_points
+        self.absent[match_id] = absent
+        self.disqualified[match_id] = disqualified
 
-        # Build the disqualification dict
-        dsq = []
-        for tla, scoreinfo in y["teams"].items():
-            # disqualifications and non-presence are effectively the same
-            # in terms of league points awarding.
-            if (scoreinfo.get("disqualified", False) or
-               not scoreinfo.get("present", True)):
-                dsq.append(tla)
+    def _score_resfile(self, fname):
+        """
+        Load and score a score sheet.
 
-        positions = ranker.calc_positions(game_points, dsq)
-        self.game_positions[match_id] = positions
-        self.ranked_points[match_id] = \
-            ranker.calc_ranked_points(positions, dsq, self._num_corners)
+        :param str fname: The path to the score sheet.
+        :return: A tuple of the match id, game points, game positions, ranked
+                 points, absent teams and disqualified teams for the match.
+        """
+
+        cache = self._cache
+
+        if cache is None:
+            y = yaml_loader.load(fname)
+            return score_sheet(self._scorer, y, self._num_corners)
+
+        if self._scorer_id is None or cache.memo is None:
+            y = cache.parse_yaml(fname)
+            return score_sheet(self._scorer, y, self._num_corners)
+
+        content = cache.read(fname)
+        key = score_sheet_memo_key(content, self._scorer_id, self._num_corners)
+        return cache.memo.memoize(key, lambda: score_sheet(self._scorer,
+                                                           cache.loads(content),
+                                                           self._num_corners))
+
+    def as_arrays(self):
+        """
+        Get the scores as teams by matches arrays, for vectorised analysis.
+
+        This requires :mod:`numpy`, which is an optional dependency.
+
+        :return: A :class:`sr.comp.score_matrix.ScoreMatrix`.
+        """
+
+        # Only imported here since numpy is optional
+        from .score_matrix import ScoreMatrix
+        return ScoreMatrix(self)
 
     @property
     def last_scored_match(self):
@@ -229,7 +520,7 @@ class LeagueScores(BaseScores):
         deterministically.
         """
 
-        # Reverse sort the (tla, score) pairs so the biggest scores are at the
+        # Rank the teams so that the biggest scores are at the
         # top. We break perfect ties by TLA, which is not fair but is
         # deterministic.
         # Note that the unfair result is only present within the key ordering
@@ -238,21 +529,29 @@ class LeagueScores(BaseScores):
         # Both of these are used within the system -- the knockouts need
         # a list of teams to seed with, various awards (and humans) want
         # a result which allows for ties.
-        ranking = sorted(team_scores.items(),
-                         key=lambda x: (x[1], x[0]),
-                         reverse=True)
-        positions = OrderedDict()
-        pos = 1
-        last_score = None
-        for i, (tla, score) in enumerate(ranking, start=1):
-            if score != last_score:
-                pos = i
-            positions[tla] = pos
-            last_score = score
-        return positions
+        return LeagueScores._positions_from_ranking(
+            LeagueScores._sorted_ranking(team_scores),
+        )
+
+    @staticmethod
+    def _sorted_ranking(team_scores):
+        """
+        Get an ascending list of ``(league_points, game_points, tla)`` for
+        the given mapping of TLA to :class:`TeamScore`.
+
+        This sorts in the same order as the :class:`TeamScore` instances
+        would (breaking ties by TLA), but comparing the plain tuples is
+        much faster than using the rich comparisons of :class:`TeamScore`.
+        """
+
+        return sorted((score.league_points, score.game_points, tla)
+                      for tla, score in team_scores.items())
 
-    def __init__(self, resultdir, teams, scorer, num_teams_per_arena):
-        super(LeagueScores, self).__init__(resultdir, teams, scorer, num_teams_per_arena)
+    def __init__(self, resultdir, teams, scorer, num_teams_per_arena,
+                 cache=None, scorer_id=None):
+        super(LeagueScores, self).__init__(resultdir, teams, scorer,
+                                           num_teams_per_arena, cache,
+                                           scorer_id)
 
         # Sum the league scores for each team
         for match_id, match in self.ranked_points.items():
@@ -266,6 +565,150 @@ class LeagueScores(BaseScores):
         An :class:`.OrderedDict` of TLAs to :class:`.TeamScore` instances.
         """
 
+        # A list of (league points, game points, TLA) for every team, in
+        # ascending order. This is only built once it's needed, by the
+        # incremental update methods below.
+        self._ranking = None
+
+    def add_match(self, match_id, sheet):
+        """
+        Add the scores for a match, updating the league table.
+
+        This is equivalent to (but much cheaper than) adding the score sheet
+        to the compstate and reloading the scores. Note that the
+        :attr:`positions` are replaced, rather than modified.
+
+        :param tuple match_id: The ``(arena_id, match_num)`` of the match.
+        :param dict sheet: The parsed score sheet for the match.
+        :raises DuplicateScoresheet: If there are already scores for the match.
+        :raises InvalidTeam: If the sheet contains an unknown team.
+        """
+
+        if match_id in self.game_points:
+            raise DuplicateScoresheet(match_id)
+
+        result = self._score_match(match_id, sheet)
+        self._update_teams(result, 1)
+
+    def remove_match(self, match_id):
+        """
+        Remove the scores for a match, updating the league table.
+
+        :param tuple match_id: The ``(arena_id, match_num)`` of the match.
+        :raises KeyError: If there are no scores for the match.
+        """
+
+        result = (match_id,
+                  self.game_points[match_id],
+                  self.game_positions[match_id],
+                  self.ranked_points[match_id],
+                  self.absent[match_id],
+                  self.disqualified[match_id])
+        self._update_teams(result, -1)
+
+    def replace_match(self, match_id, sheet):
+        """
+        Replace the scores for a match, updating the league table.
+
+        The existing scores are left in place if the new sheet is invalid.
+
+        :param tuple match_id: The ``(arena_id, match_num)`` of the match.
+        :param dict sheet: The new parsed score sheet for the match.
+        :raises KeyError: If there are no scores for the match.
+        :raises InvalidTeam: If the sheet contains an unknown team.
+        """
+
+        if match_id not in self.game_points:
+            raise KeyError(match_id)
+
+        result = self._score_match(match_id, sheet)
+        self.remove_match(match_id)
+        self._update_teams(result, 1)
+
+    def _score_match(self, match_id, sheet):
+        result = score_sheet(self._scorer, sheet, self._num_corners)
+
+        if result[0] != match_id:
+            raise ValueError("Score sheet is for match {0}{1}, not {2}{3}."
+                             .format(*(result[0] + match_id)))
+
+        _, game_points, _, ranked_points, _, _ = result
+        for points, what in ((game_points, "score"),
+                             (ranked_points, "ranked score")):
+            for tla in points:
+                if tla not in self.teams:
+                    raise InvalidTeam(tla, "{0} for match {1}{2}".format(
+                        what, *match_id))
+
+        return result
+
+    def _update_teams(self, result, sign):
+        """
+        Add (``sign`` of 1) or remove (``sign`` of -1) the given scoring
+        result from the league table.
+        """
+
+        match_id, game_points, game_positions, ranked_points, absent, \
+            disqualified = result
+
+        if sign > 0:
+            self.game_points[match_id] = game_points
+            self.game_positions[match_id] = game_positions
+            self.ranked_points[match_id] = ranked_points
+            self.absent[match_id] = absent
+            self.disqualified[match_id] = disqualified
+        else:
+            del self.game_points[match_id]
+            del self.game_positions[match_id]
+            del self.ranked_points[match_id]
+            del self.absent[match_id]
+            del self.disqualified[match_id]
+
+        ranking = self._get_ranking()
+
+        for tla in set(game_points) | set(ranked_points):
+            team_score = self.teams[tla]
+
+            old_key = (team_score.league_points, team_score.game_points, tla)
+            del ranking[bisect_left(ranking, old_key)]
+
+            team_score.game_points += sign * game_points.get(tla, 0)
+            team_score.league_points += sign * ranked_points.get(tla, 0)
+
+            insort(ranking, (team_score.league_points,
+                             team_score.game_points,
+                             tla))
+
+        self.positions = self._positions_from_ranking(ranking)
+
+    def _get_ranking(self):
+        if self._ranking is None:
+            self._ranking = self._sorted_ranking(self.teams)
+        return self._ranking
+
+    @staticmethod
+    def _positions_from_ranking(ranking):
+        """
+        Build the positions from an ascending ranking list, as
+        :meth:`rank_league` does from the team scores.
+
+        Finding the teams to move within the ranking is O(log n), however
+        the positions themselves must still be rebuilt in O(n) since every
+        team between a moved team's old and new places changes position.
+        This avoids re-sorting the teams though, which is the dominant cost.
+        """
+
+        positions = OrderedDict()
+        pos = 1
+        last_score = None
+        for i, (league, game, tla) in enumerate(reversed(ranking), start=1):
+            score = (league, game)
+            if score != last_score:
+                pos = i
+            positions[tla] = pos
+            last_score = score
+        return positions
+
 
 class KnockoutScores(BaseScores):
     """A class which holds knockout scores."""
@@ -296,8 +739,11 @@ class KnockoutScores(BaseScores):
 
         return ranking
 
-    def __init__(self, resultdir, teams, scorer, num_teams_per_arena, league_positions):
-        super(KnockoutScores, self).__init__(resultdir, teams, scorer, num_teams_per_arena)
+    def __init__(self, resultdir, teams, scorer, num_teams_per_arena,
+                 league_positions, cache=None, scorer_id=None):
+        super(KnockoutScores, self).__init__(resultdir, teams, scorer,
+                                             num_teams_per_arena, cache,
+                                             scorer_id)
 
         self.resolved_positions = {}
         """
@@ -321,39 +767,95 @@ class TiebreakerScores(KnockoutScores):
 class Scores(object):
     """
     A simple class which stores references to the league and knockout scores.
+
+    The league scores are loaded immediately, while the knockout and
+    tiebreaker scores are only loaded when first accessed, since they are
+    not needed until late in the competition.
+
+    :param str root: The root path of the ``compstate`` repo.
+    :param dict teams: The teams in the competition.
+    :param dict scorer: The scorer logic.
+    :param int num_teams_per_arena: The usual number of teams per arena.
+    :param cache: An optional :class:`sr.comp.cache.FileCache`.
+    :param int workers: An optional number of worker processes to use to
+                        parse and score the score sheets in parallel. The
+                        results are the same as without workers.
+    :param str scorer_id: An optional identifier for the version of the
+                          scorer logic. See :class:`BaseScores`.
     """
 
-    def __init__(self, root, teams, scorer, num_teams_per_arena):
+    def __init__(self, root, teams, scorer, num_teams_per_arena, cache=None,
+                 workers=None, scorer_id=None):
         self.root = root
 
+        if workers is not None and workers > 1:
+            if cache is None:
+                cache = FileCache()
+
+            resfiles = []
+            for dirname in ("league", "knockout", "tiebreaker"):
+                resultdir = os.path.join(root, dirname)
+                resfiles += results_finder(resultdir, cache)
+
+            prescore_sheets(resfiles, cache, scorer, num_teams_per_arena,
+                            workers, scorer_id)
+
+        self._teams = teams
+        self._scorer = scorer
+        self._num_teams_per_arena = num_teams_per_arena
+        self._cache = cache
+        self._scorer_id = scorer_id
+
         self.league = LeagueScores(os.path.join(root, "league"),
-                                   teams, scorer, num_teams_per_arena)
+                                   teams, scorer, num_teams_per_arena,
+                                   cache, scorer_id)
         """
         The :class:`LeagueScores` for the competition.
         """
 
+        self._knockout = None
+        self._tiebreaker = None
 
-        self.knockout = KnockoutScores(os.path.join(root, "knockout"),
-                                       teams, scorer, num_teams_per_arena,
-                                       self.league.positions)
+    @property
+    def knockout(self):
         """
         The :class:`KnockoutScores` for the competition.
+
+        These are only loaded when first accessed.
         """
 
-        self.tiebreaker = TiebreakerScores(os.path.join(root, "tiebreaker"),
-                                           teams, scorer, num_teams_per_arena,
-                                           self.league.positions)
+        if self._knockout is None:
+            self._knockout = KnockoutScores(os.path.join(self.root, "knockout"),
+                                            self._teams, self._scorer,
+                                            self._num_teams_per_arena,
+                                            self.league.positions,
+                                            self._cache, self._scorer_id)
+        return self._knockout
+
+    @property
+    def tiebreaker(self):
         """
         The :class:`TiebreakerScores` for the competition.
+
+        These are only loaded when first accessed.
         """
 
-        lsm = None
-        for scores in (self.tiebreaker, self.knockout, self.league):
-            lsm = scores.last_scored_match
-            if lsm is not None:
-                break
+        if self._tiebreaker is None:
+            self._tiebreaker = TiebreakerScores(
+                os.path.join(self.root, "tiebreaker"),
+                self._teams, self._scorer, self._num_teams_per_arena,
+                self.league.positions, self._cache, self._scorer_id,
+            )
+        return self._tiebreaker
 
-        self.last_scored_match = lsm
+    @property
+    def last_scored_match(self):
         """
         The match with the highest id for which we have score data.
         """
+
+        for scores in (self.tiebreaker, self.knockout, self.league):
+            lsm = scores.last_scored_match
+            if lsm is not None:
+                return lsm
+        return None
@@ -22,15 +22,16 @@ class Team(_Team):
             return match_number <= self.dropped_out_after
 
 
-def load_teams(filename):
+def load_teams(filename, cache=None):
     """
     Load teams from a YAML file.
 
     :param str filename: The filename of the YAML file to load.
+    :param cache: An optional :class:`sr.comp.cache.FileCache`.
     :return: A dictionary mapping TLAs to :class:`Team` objects.
     """
 
-    data = yaml_loader.load(filename)
+    data = yaml_loader.cached_load(filename, cache)
 
     teams = {}
     for tla, info in data['teams'].items():
@@ -39,6 +39,10 @@ def validate(comp):
     :return: The number of errors that have occurred.
     """
 
+    # The venue is only loaded when first accessed, and checks its layout
+    # and shepherding data (raising if they are invalid) when it is loaded.
+    comp.venue  # pylint: disable=pointless-statement
+
     count = 0
     count += validate_schedule(comp.schedule, comp.teams.keys(),
                                comp.arenas.keys())
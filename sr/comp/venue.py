@@ -64,7 +64,14 @@ class ShepherdingAreasException(MismatchException):
 
 
 class Venue(object):
-    """A class providing information about the layout within the venue."""
+    """
+    A class providing information about the layout within the venue.
+
+    :param list teams: The TLAs of the teams in the competition.
+    :param str layout_file: The path to the layout file.
+    :param str shepherding_file: The path to the shepherding file.
+    :param cache: An optional :class:`sr.comp.cache.FileCache`.
+    """
 
     @staticmethod
     def _check_staging_times(shepherding_areas, staging_times):
@@ -125,13 +132,13 @@ class Venue(object):
             raise LayoutTeamsException(duplicate_teams, extra_teams, missing_teams)
 
 
-    def __init__(self, teams, layout_file, shepherding_file):
+    def __init__(self, teams, layout_file, shepherding_file, cache=None):
 
-        layout_data = yaml_loader.load(layout_file)
+        layout_data = yaml_loader.cached_load(layout_file, cache)
         teams_layout = layout_data['teams']
         self.check_teams(teams, teams_layout)
 
-        shepherding_data = yaml_loader.load(shepherding_file)
+        shepherding_data = yaml_loader.cached_load(shepherding_file, cache)
         shepherds = shepherding_data['shepherds']
 
         self._shepherding_areas = [a['name'] for a in shepherds]
@@ -144,7 +151,9 @@ class Venue(object):
             raise ShepherdingAreasException('in the shepherding data', \
                                             duplicate_areas, [], [])
 
-        self.locations = {r['name']: r for r in teams_layout}
+        # Copy the locations since we add the shepherding information to
+        # them and the loaded data may be shared with other instances.
+        self.locations = {r['name']: dict(r) for r in teams_layout}
         """
         A :class:`dict` of location names (from the layout file) to location
         information, including which teams are in that location and the
@@ -153,7 +162,7 @@ class Venue(object):
 
         self._team_locations = {}
 
-        for location in teams_layout:
+        for location in self.locations.values():
             for team in location['teams']:
                 self._team_locations[team] = location
 
@@ -0,0 +1,77 @@
+"""
+What the knockouts would be with hypothetical results.
+
+This answers questions such as "who would be in the semi-finals if these
+teams won their quarter-finals?" from a loaded competition, by scheduling
+just its knockouts again with the hypothetical results laid over the real
+ones, rather than writing score sheets and loading everything again.
+"""
+
+from collections import OrderedDict
+
+
+class HypotheticalKnockoutScores(object):
+    """
+    Knockout scores with some hypothetical results laid over them.
+
+    Only the resolved positions are provided, since they are all that the
+    knockout schedulers use.
+
+    :param knockout_scores: The real :class:`sr.comp.scores.KnockoutScores`.
+    :param dict results: A mapping of ``(arena, match number)`` tuples to
+                         lists of the TLAs of the teams in the match, in the
+                         order they finished in (the winner first). These
+                         take the place of any real results for the matches.
+    """
+
+    def __init__(self, knockout_scores, results):
+        self.resolved_positions = dict(knockout_scores.resolved_positions)
+        """
+        A :class:`dict` mapping ``(arena, match number)`` tuples to an
+        :class:`collections.OrderedDict` of TLAs to positions, in order, as
+        in :attr:`sr.comp.scores.KnockoutScores.resolved_positions`.
+        """
+
+        for match_id, ranking in results.items():
+            self.resolved_positions[match_id] = OrderedDict(
+                (tla, position) for position, tla in enumerate(ranking, 1)
+            )
+
+
+class HypotheticalScores(object):
+    """
+    The scores of a competition with some hypothetical knockout results.
+
+    :param scores: The real :class:`sr.comp.scores.Scores`.
+    :param dict results: The hypothetical knockout results, as for
+                         :class:`HypotheticalKnockoutScores`.
+    """
+
+    def __init__(self, scores, results):
+        self.league = scores.league
+        """The real :class:`sr.comp.scores.LeagueScores`."""
+
+        self.knockout = HypotheticalKnockoutScores(scores.knockout, results)
+        """A :class:`HypotheticalKnockoutScores` instance."""
+
+
+def knockout_what_if(comp, results):
+    """
+    Work out what the knockouts of a competition would be with some
+    hypothetical knockout results.
+
+    Only the knockouts are scheduled again (see
+    :meth:`sr.comp.matches.MatchSchedule.hypothetical_knockouts`); the
+    competition itself is left as it is.
+
+    :param comp: A :class:`sr.comp.comp.SRComp` instance.
+    :param dict results: A mapping of ``(arena, match number)`` tuples to
+                         lists of the TLAs of the teams in each knockout
+                         match, in the order they finished in (the winner
+                         first).
+    :return: A list of the knockout matches by round, like
+             :attr:`sr.comp.matches.MatchSchedule.knockout_rounds`.
+    """
+
+    scores = HypotheticalScores(comp.scores, results)
+    return comp.schedule.hypothetical_knockouts(scores)
@@ -82,12 +82,13 @@ def _compute_rookie_award(scores, teams):
                         if position == best_position))}
 
 
-def _compute_explicit_awards(path, teams):
+def _compute_explicit_awards(path, teams, cache=None):
     """Compute awards explicitly provided in the compstate repo."""
-    if not os.path.exists(path):
+    exists = os.path.exists if cache is None else cache.exists
+    if not exists(path):
         return {}
 
-    explicit_awards = yaml_loader.load(path)
+    explicit_awards = yaml_loader.cached_load(path, cache)
     assert explicit_awards, "Awards file should not be present if empty."
 
     awards = {Award(key): [value] if isinstance(value, str) else value
@@ -101,7 +102,7 @@ def _compute_explicit_awards(path, teams):
     return awards
 
 
-def compute_awards(scores, final_match, teams, path=None):
+def compute_awards(scores, final_match, teams, path=None, cache=None):
     """
     Compute the awards handed out from configuration.
 
@@ -109,6 +110,8 @@ def compute_awards(scores, final_match, teams, path=None):
     :param Match final_match: The match to use as the final.
     :param dict teams: A mapping from TLAs to :class:`sr.comp.teams.Team`
                        objects.
+    :param str path: The path to the explicit awards file, if any.
+    :param cache: An optional :class:`sr.comp.cache.FileCache`.
     :return: A dictionary of :class:`Award` types to TLAs is returned. This may
              not have a key for any award type that has not yet been
              determined.
@@ -118,5 +121,5 @@ def compute_awards(scores, final_match, teams, path=None):
     awards.update(_compute_main_awards(scores, final_match))
     awards.update(_compute_rookie_award(scores, teams))
     if path is not None:
-        awards.update(_compute_explicit_awards(path, teams))
+        awards.update(_compute_explicit_awards(path, teams, cache))
     return awards
@@ -39,3 +39,26 @@ def load(file_path):
     """
     with open(file_path, 'r') as f:
         return yaml.load(f, Loader=YAML_Loader)
+
+
+def loads(content):
+    """
+    Parse YAML content and return the results.
+
+    :param content: The YAML content, as either text or UTF-8 bytes.
+    :return: The parsed contents.
+    """
+    return yaml.load(content, Loader=YAML_Loader)
+
+
+def cached_load(file_path, cache=None):
+    """
+    Load a YAML file, via the given cache if there is one.
+
+    :param str file_path: The path to the YAML file.
+    :param cache: An optional :class:`sr.comp.cache.FileCache`.
+    :return: The parsed contents.
+    """
+    if cache is None:
+        return load(file_path)
+    return cache.load_yaml(file_path)
@@ -0,0 +1,234 @@
+from contextlib import contextmanager
+import os
+import shutil
+import tempfile
+
+import mock
+from nose.tools import eq_
+
+from sr.comp.cache import BlobStore, ContentMemo, FileCache, git_blob_id
+
+
+@contextmanager
+def temp_dir():
+    tmpdir = tempfile.mkdtemp()
+    try:
+        yield tmpdir
+    finally:
+        shutil.rmtree(tmpdir)
+
+@contextmanager
+def temp_file(content='a: 1\n'):
+    with temp_dir() as tmpdir:
+        path = os.path.join(tmpdir, 'file.yaml')
+        write(path, content)
+        yield path
+
+def write(path, content):
+    with open(path, 'w') as f:
+        f.write(content)
+
+def counter():
+    calls = []
+    def factory():
+        calls.append(None)
+        return len(calls)
+    return factory
+
+def test_reuses_value():
+    factory = counter()
+    with temp_file() as path:
+        cache = FileCache()
+        eq_(1, cache.get(path, 'key', factory))
+        eq_(1, cache.get(path, 'key', factory))
+
+def test_keys_are_distinct():
+    factory = counter()
+    with temp_file() as path:
+        cache = FileCache()
+        eq_(1, cache.get(path, 'key', factory))
+        eq_(2, cache.get(path, 'other', factory))
+
+def test_invalidated_by_change():
+    factory = counter()
+    with temp_file() as path:
+        cache = FileCache()
+        cache.get(path, 'key', factory)
+        write(path, 'a: 12\n')
+        eq_(2, cache.get(path, 'key', factory))
+
+def test_reuses_previous():
+    factory = counter()
+    with temp_file() as path:
+        previous = FileCache()
+        previous.get(path, 'key', factory)
+
+        cache = FileCache(previous)
+        eq_(1, cache.get(path, 'key', factory))
+
+def test_changed_paths_not_reused():
+    factory = counter()
+    with temp_file() as path:
+        previous = FileCache()
+        previous.get(path, 'key', factory)
+
+        cache = FileCache(previous, changed_paths=[path])
+        eq_(2, cache.get(path, 'key', factory))
+
+        # Only the previous entry is ignored, not our own
+        eq_(2, cache.get(path, 'key', factory))
+
+def test_previous_not_modified():
+    factory = counter()
+    with temp_file() as path:
+        previous = FileCache()
+        previous.get(path, 'key', factory)
+
+        cache = FileCache(previous, changed_paths=[path])
+        cache.get(path, 'key', factory)
+
+        eq_(1, previous.get(path, 'key', factory))
+
+def test_load_yaml():
+    with temp_file() as path:
+        cache = FileCache()
+        eq_({'a': 1}, cache.load_yaml(path))
+
+def test_git_blob_id():
+    # As given by 'git hash-object'
+    eq_('e69de29bb2d1d6434b8b29ae775ad8c2e48c5391', git_blob_id(b''))
+    eq_('a8926a52d8dcba5c4386945476ab6a2ad008afd4', git_blob_id(b'a: 1\n'))
+
+def test_blob_store_parses():
+    with temp_dir() as store_dir:
+        store = BlobStore(store_dir)
+        eq_({'a': 1}, store.loads(b'a: 1\n'))
+
+def test_blob_store_reuses_stored():
+    with temp_dir() as store_dir:
+        BlobStore(store_dir).loads(b'a: 1\n')
+
+        with mock.patch('sr.comp.yaml_loader.loads') as mock_loads:
+            data = BlobStore(store_dir).loads(b'a: 1\n')
+
+        eq_({'a': 1}, data)
+        assert not mock_loads.called, "Should have used the stored value"
+
+def stored_files(directory):
+    return [os.path.join(dirpath, name)
+            for dirpath, _, names in os.walk(directory)
+            for name in names]
+
+def test_blob_store_corrupt():
+    with temp_dir() as store_dir:
+        BlobStore(store_dir).loads(b'a: 1\n')
+        path, = stored_files(store_dir)
+        write(path, 'not a pickle')
+
+        eq_({'a': 1}, BlobStore(store_dir).loads(b'a: 1\n'))
+
+        # The corrupt file is replaced
+        with mock.patch('sr.comp.yaml_loader.loads') as mock_loads:
+            eq_({'a': 1}, BlobStore(store_dir).loads(b'a: 1\n'))
+        assert not mock_loads.called, "Should have used the stored value"
+
+def test_blob_store_unwritable():
+    with temp_file() as path:
+        # The store can't be created within a file
+        store = BlobStore(path)
+        eq_({'a': 1}, store.loads(b'a: 1\n'))
+        eq_({'a': 1}, store.loads(b'a: 1\n'))
+
+def test_blob_store_failed_write_cleaned_up():
+    with temp_dir() as store_dir:
+        with mock.patch('os.rename', side_effect=OSError):
+            eq_({'a': 1}, BlobStore(store_dir).loads(b'a: 1\n'))
+
+        eq_([], stored_files(store_dir))
+
+def test_file_cache_uses_store():
+    with temp_dir() as store_dir, temp_file() as path:
+        cache = FileCache(store=BlobStore(store_dir))
+        eq_({'a': 1}, cache.load_yaml(path))
+        eq_({'a': 1}, cache.parse_yaml(path))
+
+        assert os.listdir(store_dir), "Should have stored the parsed file"
+
+def test_file_cache_inherits_store():
+    store = BlobStore('somewhere')
+    cache = FileCache(FileCache(store=store))
+    assert cache._store is store
+
+def test_contains_and_put():
+    factory = counter()
+    with temp_file() as path:
+        cache = FileCache()
+        assert not cache.contains(path, 'key')
+
+        cache.put(path, 'key', cache.signature(path), 42)
+        assert cache.contains(path, 'key')
+        eq_(42, cache.get(path, 'key', factory))
+
+def test_put_stale_signature():
+    factory = counter()
+    with temp_file() as path:
+        cache = FileCache()
+        signature = cache.signature(path)
+        write(path, 'a: 12\n')
+
+        cache.put(path, 'key', signature, 42)
+        assert not cache.contains(path, 'key')
+        eq_(1, cache.get(path, 'key', factory))
+
+def test_memo_memoizes():
+    factory = counter()
+    memo = ContentMemo()
+    eq_(1, memo.memoize(('a', 1), factory))
+    eq_(1, memo.memoize(('a', 1), factory))
+    eq_(2, memo.memoize(('b', 1), factory))
+
+def test_memo_evicts_least_recently_used():
+    memo = ContentMemo(max_entries=2)
+    memo.put(('a',), 1)
+    memo.put(('b',), 2)
+    # Use 'a' so that 'b' is the least recently used
+    eq_(1, memo.get(('a',)))
+    memo.put(('c',), 3)
+
+    eq_(2, len(memo))
+    eq_(1, memo.get(('a',)))
+    eq_(None, memo.get(('b',)))
+    eq_(3, memo.get(('c',)))
+
+def test_memo_persists():
+    with temp_dir() as memo_dir:
+        ContentMemo(directory=memo_dir).put(('a', 1), {'some': 'value'})
+
+        memo = ContentMemo(directory=memo_dir)
+        eq_({'some': 'value'}, memo.get(('a', 1)))
+        eq_(None, memo.get(('a', 2)))
+
+def test_memo_corrupt():
+    with temp_dir() as memo_dir:
+        ContentMemo(directory=memo_dir).put(('a', 1), {'some': 'value'})
+        path, = stored_files(memo_dir)
+        write(path, '')
+
+        eq_(None, ContentMemo(directory=memo_dir).get(('a', 1)))
+
+def test_memo_unwritable():
+    with temp_file() as path:
+        memo = ContentMemo(directory=path)
+        memo.put(('a', 1), {'some': 'value'})
+
+        eq_({'some': 'value'}, memo.get(('a', 1)))
+        eq_(None, ContentMemo(directory=path).get(('a', 1)))
+
+def test_file_cache_inherits_memo():
+    memo = ContentMemo()
+    cache = FileCache(FileCache(memo=memo))
+    assert cache.memo is memo
+
+def test_content_id():
+    with temp_file() as path:
+        eq_(git_blob_id(b'a: 1\n'), FileCache().content_id(path))
@@ -1,10 +1,18 @@
 
+from contextlib import contextmanager
 import os
 import datetime
+import shutil
+import subprocess
+import sys
+import tempfile
 
 from nose.plugins.skip import SkipTest
+from nose.tools import eq_
 
-from sr.comp.comp import SRComp
+from sr.comp.cache import ContentMemo
+from sr.comp.comp import SRComp, _load_scorer_from_cache, load_scorer
+from sr.comp.git_tree import GitTreeCache
 
 DUMMY_PATH = os.path.dirname(os.path.abspath(__file__)) + '/dummy'
 
@@ -23,6 +31,7 @@ def test_load():
     assert instance.arenas
     assert instance.corners
     assert isinstance(instance.awards, dict)
+    assert instance.load_profile['total']['count'] == 1
 
 def test_timezone():
     # Test that one can get the timezone from the dummy state
@@ -31,3 +40,228 @@ def test_timezone():
         raise SkipTest("Timezone test skipped due to srcomp load failure.")
     assert (instance.timezone.utcoffset(datetime.datetime(2014, 4, 26)) ==
             datetime.timedelta(seconds=3600))
+
+def test_load_revision():
+    "Test that loading the dummy state from git works"
+    global instance
+    if instance is None:
+        raise SkipTest("Revision test skipped due to srcomp load failure.")
+    comp = SRComp.from_revision(DUMMY_PATH, instance.state)
+    assert comp.state == instance.state
+    assert comp.teams == instance.teams
+    assert comp.schedule.matches == instance.schedule.matches
+    assert comp.scores.league.positions == instance.scores.league.positions
+    assert comp.awards == instance.awards
+
+def assert_same_comp(comp, expected):
+    assert comp.state == expected.state
+    assert comp.teams == expected.teams
+    assert comp.schedule.matches == expected.schedule.matches
+    assert comp.scores.league.positions == expected.scores.league.positions
+    assert comp.scores.knockout.resolved_positions == \
+        expected.scores.knockout.resolved_positions
+    assert comp.awards == expected.awards
+
+def test_reload():
+    "Test that reloading the dummy state gives the same as a fresh load"
+    global instance
+    if instance is None:
+        raise SkipTest("Reload test skipped due to srcomp load failure.")
+
+    fresh = SRComp(DUMMY_PATH)
+
+    comp = instance.reload()
+    assert comp is not instance
+    assert comp.load_profile['total']['count'] == 1
+    assert_same_comp(comp, fresh)
+
+    changed_paths = ['teams.yaml', os.path.join(DUMMY_PATH, 'arenas.yaml')]
+    comp = SRComp.from_previous(comp, changed_paths=changed_paths)
+    assert_same_comp(comp, fresh)
+
+    # The previous instance is left as it was
+    assert_same_comp(instance, fresh)
+
+
+SCORER = """
+import srcomp_test_helper
+
+class Scorer(object):
+    value = srcomp_test_helper.VALUE
+"""
+
+def write(root, relpath, content):
+    path = os.path.join(root, relpath)
+    dirname = os.path.dirname(path)
+    if not os.path.exists(dirname):
+        os.makedirs(dirname)
+    with open(path, 'w') as f:
+        f.write(content)
+
+def git(root, *args):
+    command = ('git', '-c', 'user.name=Test', '-c', 'user.email=test@example.com')
+    subprocess.check_call(command + args, cwd=root)
+
+@contextmanager
+def scorer_repo():
+    root = tempfile.mkdtemp()
+    try:
+        git(root, 'init', '-q')
+        write(root, 'scoring/score.py', SCORER)
+        write(root, 'scoring/srcomp_test_helper.py', 'VALUE = "first"\n')
+        git(root, 'add', '.')
+        git(root, 'commit', '-q', '-m', 'First')
+
+        write(root, 'scoring/srcomp_test_helper.py', 'VALUE = "second"\n')
+        git(root, 'commit', '-q', '-a', '-m', 'Second')
+
+        # Uncommitted changes should be ignored
+        write(root, 'scoring/srcomp_test_helper.py', 'VALUE = "working"\n')
+
+        yield root
+    finally:
+        shutil.rmtree(root)
+
+def test_load_scorer_modules():
+    with scorer_repo() as root:
+        eq_('working', load_scorer(root).value)
+        sys.modules.pop('srcomp_test_helper', None)
+
+        scorer = load_scorer(root, SCORER.encode('utf-8'),
+                             {'srcomp_test_helper': b'VALUE = "given"\n'})
+
+        eq_('given', scorer.value)
+        assert 'srcomp_test_helper' not in sys.modules
+
+def test_scorer_modules_from_revision():
+    with scorer_repo() as root:
+        with GitTreeCache(root, 'HEAD^', memo=ContentMemo()) as previous:
+            first, first_id = _load_scorer_from_cache(root, previous)
+
+        with GitTreeCache(root, 'HEAD', previous) as cache:
+            second, second_id = _load_scorer_from_cache(root, cache)
+
+        with GitTreeCache(root, 'HEAD', cache) as cache:
+            again, again_id = _load_scorer_from_cache(root, cache)
+
+        eq_('first', first.value)
+        eq_('second', second.value)
+        assert first_id != second_id, "Should depend on the helper module"
+        assert again is second, "Should reuse the unchanged scorer"
+        eq_(second_id, again_id)
+
+COMPSTATE = {
+    'teams.yaml': """
+teams:
+  AAA: {name: Team A, rookie: false}
+  BBB: {name: Team B, rookie: false}
+  CCC: {name: Team C, rookie: false}
+  DDD: {name: Team D, rookie: false}
+  EEE: {name: Team E, rookie: false}
+  FFF: {name: Team F, rookie: false}
+  GGG: {name: Team G, rookie: false}
+  HHH: {name: Team H, rookie: false}
+""",
+    'arenas.yaml': """
+arenas:
+  A: {display_name: Arena A, colour: '#cccccc'}
+corners:
+  0: {colour: '#000000'}
+  1: {colour: '#280000'}
+  2: {colour: '#500000'}
+  3: {colour: '#780000'}
+""",
+    'league.yaml': """
+matches:
+  0: {A: [AAA, BBB, CCC, DDD]}
+  1: {A: [EEE, FFF, GGG, HHH]}
+""",
+    'schedule.yaml': """
+match_slot_lengths: {pre: 60, match: 180, post: 60, total: 300}
+staging:
+  opens: 300
+  closes: 120
+  duration: 180
+  signal_teams: 240
+  signal_shepherds: {Blue: 241}
+timezone: Europe/London
+delays: []
+match_periods:
+  league:
+  - start_time: 2014-04-26 10:00:00+01:00
+    end_time: 2014-04-26 12:00:00+01:00
+    description: League
+  knockout:
+  - start_time: 2014-04-26 14:00:00+01:00
+    end_time: 2014-04-26 16:00:00+01:00
+    description: Knockouts
+league: {extra_spacing: []}
+knockout:
+  round_spacing: 300
+  final_delay: 300
+  single_arena: {rounds: 3, arenas: [A]}
+tiebreaker: 2014-04-26 17:00:00+01:00
+""",
+    'scoring/score.py': """
+class Scorer(object):
+    def __init__(self, teams_data, arena_data):
+        self._teams_data = teams_data
+
+    def calculate_scores(self):
+        return dict((tla, info['score'])
+                    for tla, info in self._teams_data.items())
+""",
+}
+
+def score_sheet(num, tlas):
+    teams = ''.join('  {0}: {{score: {1}, zone: {2}}}\n'.format(tla, i, i)
+                    for i, tla in enumerate(tlas))
+    return 'arena_id: A\nmatch_number: {0}\nteams:\n{1}'.format(num, teams)
+
+@contextmanager
+def small_compstate(num_scored):
+    root = tempfile.mkdtemp()
+    try:
+        for relpath, content in COMPSTATE.items():
+            write(root, relpath, content)
+        matches = [['AAA', 'BBB', 'CCC', 'DDD'], ['EEE', 'FFF', 'GGG', 'HHH']]
+        for num, tlas in enumerate(matches[:num_scored]):
+            write(root, 'league/A/{0:03}.yaml'.format(num),
+                  score_sheet(num, tlas))
+
+        git(root, 'init', '-q')
+        git(root, 'add', '.')
+        git(root, 'commit', '-q', '-m', 'Compstate')
+
+        yield root
+    finally:
+        shutil.rmtree(root)
+
+def test_knockout_scores_not_loaded_during_league():
+    with small_compstate(num_scored=1) as root:
+        comp = SRComp(root)
+
+        assert comp.scores._knockout is None, \
+            "Should not load the knockout scores until the league is over"
+        assert 'scores.knockout' not in comp.load_profile
+        eq_([['???'] * 4] * 2, [m.teams for m in comp.schedule.knockout_rounds[0]])
+
+def test_knockout_scores_loaded_after_league():
+    with small_compstate(num_scored=2) as root:
+        comp = SRComp(root)
+
+        assert comp.scores._knockout is not None
+        eq_(1, comp.load_profile['scores.knockout']['count'])
+        eq_(['scores.knockout', 'schedule.knockouts'],
+            [name for name in comp.load_profile
+             if name in ('scores.knockout', 'schedule.knockouts')])
+        eq_(8, len(set(tla for m in comp.schedule.knockout_rounds[0]
+                       for tla in m.teams)))
+
+def test_load_profile_phases():
+    with small_compstate(num_scored=2) as root:
+        comp = SRComp(root)
+
+        for name in ('git', 'teams', 'arenas', 'scorer', 'scores',
+                     'schedule', 'total'):
+            eq_(1, comp.load_profile[name]['count'], name)
@@ -0,0 +1,96 @@
+from datetime import datetime, timedelta
+
+from dateutil.tz import gettz, tzoffset
+from nose.tools import eq_, raises
+
+from sr.comp.compact_schedule import CompactSchedule
+from sr.comp.match_period import Match, MatchType
+
+
+def make_match(num, arena, teams, start_time, type_=MatchType.league,
+               display_name=None, use_resolved_ranking=False):
+    if display_name is None:
+        display_name = 'Match {0}'.format(num)
+    return Match(num, display_name, arena, teams, start_time,
+                 start_time + timedelta(minutes=5), type_,
+                 use_resolved_ranking)
+
+def get_matches():
+    start = datetime(2014, 3, 26,  13)
+    return [
+        {
+            'A': make_match(0, 'A', ['ABC', 'DEF', None, 'GHI'], start),
+            'B': make_match(0, 'B', ['JKL', None, 'MNO', 'PQR'], start),
+        },
+        {
+            'A': make_match(1, 'A', ['DEF', 'ABC', 'GHI', 'JKL'],
+                            start + timedelta(minutes=5, seconds=15)),
+        },
+        {
+            'B': make_match(2, 'B', ['???', '???', '???', '???'],
+                            start + timedelta(days=1),
+                            type_=MatchType.knockout,
+                            display_name='Final (#2)',
+                            use_resolved_ranking=True),
+        },
+    ]
+
+def test_round_trip():
+    matches = get_matches()
+    compact = CompactSchedule(matches)
+
+    eq_(3, len(compact))
+    eq_(matches, list(compact))
+    eq_(matches[1], compact[1])
+
+def test_negative_index():
+    matches = get_matches()
+    compact = CompactSchedule(matches)
+
+    eq_(matches[-1], compact[-1])
+    eq_(matches[0], compact[-3])
+
+@raises(IndexError)
+def test_index_out_of_range():
+    CompactSchedule(get_matches())[3]
+
+def test_empty():
+    compact = CompactSchedule([])
+    eq_(0, len(compact))
+    eq_([], list(compact))
+
+def test_time_zones():
+    bst = tzoffset('BST', 3600)
+    gmt = tzoffset('GMT', 0)
+    matches = [
+        {'A': make_match(0, 'A', [], datetime(2014, 3, 29,  13, tzinfo=gmt))},
+        {'A': make_match(1, 'A', [], datetime(2014, 3, 30,  13, tzinfo=bst))},
+    ]
+    compact = CompactSchedule(matches)
+
+    eq_(matches, list(compact))
+    for slot, compact_slot in zip(matches, compact):
+        expected = slot['A'].start_time
+        actual = compact_slot['A'].start_time
+        eq_(expected.utcoffset(), actual.utcoffset())
+        eq_(expected.isoformat(), actual.isoformat())
+
+def test_daylight_saving_change():
+    # The first match (and so the epoch) is in a time zone whose UTC offset
+    # changes before the later matches
+    london = gettz('Europe/London')
+    bst = tzoffset('BST', 3600)
+    matches = [
+        {'A': make_match(0, 'A', [], datetime(2014, 3, 29, 13, tzinfo=london))},
+        {'A': make_match(1, 'A', [], datetime(2014, 3, 30, 13, tzinfo=bst))},
+        {'A': make_match(2, 'A', [], datetime(2014, 3, 30, 14, tzinfo=london))},
+    ]
+    compact = CompactSchedule(matches)
+
+    eq_(matches, list(compact))
+    for slot, compact_slot in zip(matches, compact):
+        expected = slot['A'].start_time
+        actual = compact_slot['A'].start_time
+        eq_(expected.utcoffset(), actual.utcoffset())
+        eq_(expected.isoformat(), actual.isoformat())
+    eq_('2014-03-30T13:00:00+01:00', compact[1]['A'].start_time.isoformat())
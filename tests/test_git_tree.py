@@ -0,0 +1,110 @@
+from contextlib import contextmanager
+import os
+import shutil
+import subprocess
+import tempfile
+
+from nose.tools import eq_, raises
+
+from sr.comp.git_tree import GitTree, GitTreeCache
+from sr.comp.scores import results_finder
+
+
+def write(root, relpath, content):
+    path = os.path.join(root, relpath)
+    dirname = os.path.dirname(path)
+    if not os.path.exists(dirname):
+        os.makedirs(dirname)
+    with open(path, 'w') as f:
+        f.write(content)
+
+def git(root, *args):
+    command = ('git', '-c', 'user.name=Test', '-c', 'user.email=test@example.com')
+    subprocess.check_call(command + args, cwd=root)
+
+@contextmanager
+def temp_repo():
+    root = tempfile.mkdtemp()
+    try:
+        git(root, 'init', '-q')
+        write(root, 'teams.yaml', 'teams: 1\n')
+        write(root, 'league/A/000.yaml', 'match_number: 0\n')
+        write(root, 'league/B/000.yaml', 'match_number: 0\n')
+        write(root, 'league/deep/er/000.yaml', 'match_number: 0\n')
+        git(root, 'add', '.')
+        git(root, 'commit', '-q', '-m', 'First')
+
+        write(root, 'teams.yaml', 'teams: 2\n')
+        git(root, 'commit', '-q', '-a', '-m', 'Second')
+
+        # Uncommitted changes should be ignored
+        write(root, 'teams.yaml', 'teams: 3\n')
+
+        yield root
+    finally:
+        shutil.rmtree(root)
+
+
+def test_read():
+    with temp_repo() as root, GitTree(root) as tree:
+        eq_(b'teams: 2\n', tree.read('teams.yaml'))
+        eq_(b'match_number: 0\n', tree.read('league/A/000.yaml'))
+
+def test_read_revision():
+    with temp_repo() as root, GitTree(root, 'HEAD^') as tree:
+        eq_(b'teams: 1\n', tree.read('teams.yaml'))
+
+def test_read_after_close():
+    with temp_repo() as root:
+        tree = GitTree(root)
+        tree.read('teams.yaml')
+        tree.close()
+        eq_(b'teams: 2\n', tree.read('teams.yaml'))
+        assert tree._batch is None
+
+@raises(KeyError)
+def test_read_missing():
+    with temp_repo() as root, GitTree(root) as tree:
+        tree.read('nope.yaml')
+
+def test_exists():
+    with temp_repo() as root:
+        tree = GitTree(root)
+        assert tree.exists('teams.yaml')
+        assert not tree.exists('league')
+        assert not tree.exists('nope.yaml')
+
+def test_glob():
+    with temp_repo() as root:
+        tree = GitTree(root)
+        eq_(['league/A/000.yaml', 'league/B/000.yaml'],
+            tree.glob('league/*/*.yaml'))
+
+def test_cache_results_finder():
+    with temp_repo() as root, GitTreeCache(root) as cache:
+        league = os.path.join(root, 'league')
+        expected = [os.path.join(league, 'A', '000.yaml'),
+                    os.path.join(league, 'B', '000.yaml')]
+        eq_(expected, list(results_finder(league, cache)))
+
+def test_cache_load_yaml():
+    with temp_repo() as root, GitTreeCache(root, 'HEAD^') as cache:
+        eq_({'teams': 1}, cache.load_yaml(os.path.join(root, 'teams.yaml')))
+
+def test_cache_reuses_unchanged_blobs():
+    with temp_repo() as root:
+        calls = []
+        def factory():
+            calls.append(None)
+            return len(calls)
+
+        teams = os.path.join(root, 'teams.yaml')
+        sheet = os.path.join(root, 'league', 'A', '000.yaml')
+
+        with GitTreeCache(root, 'HEAD^') as previous:
+            eq_(1, previous.get(teams, 'key', factory))
+            eq_(2, previous.get(sheet, 'key', factory))
+
+        with GitTreeCache(root, 'HEAD', previous) as cache:
+            eq_(3, cache.get(teams, 'key', factory))
+            eq_(2, cache.get(sheet, 'key', factory))
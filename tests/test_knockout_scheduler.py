@@ -1,4 +1,4 @@
-from nose.tools import assert_raises
+from nose.tools import assert_raises, eq_
 
 from collections import defaultdict, OrderedDict
 from datetime import datetime, timedelta
@@ -17,7 +17,8 @@ def mock_first_round_seeding(side_effect):
 
 def get_scheduler(matches = None, positions = None, \
                     knockout_positions = None, league_game_points = None, \
-                    delays = None, teams=None, num_teams_per_arena = 4):
+                    delays = None, teams=None, num_teams_per_arena = 4, \
+                    teams_advancing = None):
     matches = matches or []
     delays = delays or []
     match_duration = timedelta(minutes = 5)
@@ -47,6 +48,8 @@ def get_scheduler(matches = None, positions = None, \
             'arenas': ["A"],
         },
     }
+    if teams_advancing is not None:
+        knockout_config['teams_advancing'] = teams_advancing
     config = {
         'match_periods': { 'knockout': [period_config] },
         'knockout': knockout_config,
@@ -60,8 +63,17 @@ def get_scheduler(matches = None, positions = None, \
 
 
 def test_invalid_num_teams_per_arena():
+    # The winners of each match can't make up whole matches
     with assert_raises(ValueError):
-        get_scheduler(num_teams_per_arena=2)
+        get_scheduler(num_teams_per_arena=5)
+
+def test_invalid_teams_advancing():
+    with assert_raises(ValueError):
+        get_scheduler(teams_advancing=3)
+
+def test_invalid_all_teams_advancing():
+    with assert_raises(ValueError):
+        get_scheduler(teams_advancing=4)
 
 def test_knockout_match_winners_empty():
     scheduler = get_scheduler()
@@ -459,3 +471,109 @@ def test_timings_with_delays_during_gaps():
     ]
 
     assert expected_times == start_times, "Wrong start times"
+
+
+def get_scheduler_with_results(num_teams, **kwargs):
+    """
+    Get a scheduler for ``num_teams`` teams which has added the knockouts,
+    with every knockout match won by its teams in reverse order of TLA.
+    """
+
+    positions = OrderedDict()
+    for i in range(num_teams):
+        positions['T{0:02}'.format(i)] = i + 1
+
+    knockout_positions = {}
+    while True:
+        scheduler = get_scheduler(positions=positions,
+                                  knockout_positions=knockout_positions,
+                                  **kwargs)
+        scheduler.add_knockouts()
+
+        results = {}
+        for match in (m for r in scheduler.knockout_rounds for m in r):
+            teams = sorted((t for t in match.teams if t is not None),
+                           reverse=True)
+            if UNKNOWABLE_TEAM not in teams:
+                results[(match.arena, match.num)] = OrderedDict(
+                    (tla, i) for i, tla in enumerate(teams, 1)
+                )
+
+        if results == knockout_positions:
+            return scheduler
+        knockout_positions = results
+
+def get_round_teams(scheduler):
+    return [[m.teams for m in r] for r in scheduler.knockout_rounds]
+
+def test_four_teams_two_advancing_unchanged():
+    # The brackets of the original four teams per match with two advancing
+    scheduler = get_scheduler_with_results(16)
+
+    expected = [
+        [['T12', 'T00', 'T08', 'T04'], ['T02', 'T14', 'T06', 'T10'],
+         ['T11', 'T15', 'T07', 'T03'], ['T05', 'T01', 'T09', 'T13']],
+        [['T12', 'T10', 'T08', 'T14'], ['T09', 'T15', 'T13', 'T11']],
+        [['T12', 'T14', 'T13', 'T15']],
+    ]
+
+    eq_(expected, get_round_teams(scheduler))
+    eq_(['Quarter 1 (#0)', 'Quarter 2 (#1)', 'Quarter 3 (#2)',
+         'Quarter 4 (#3)', 'Semi 1 (#4)', 'Semi 2 (#5)', 'Final (#6)'],
+        [m.display_name for r in scheduler.knockout_rounds for m in r])
+
+def test_four_teams_two_advancing_unchanged_with_empty_zones():
+    scheduler = get_scheduler_with_results(11)
+
+    expected = [
+        [['T00', None, 'T04', 'T08'], ['T10', 'T02', None, 'T06'],
+         ['T07', None, None, 'T03'], ['T09', None, 'T05', 'T01']],
+        [['T10', 'T08', 'T04', 'T06'], ['T05', 'T07', 'T09', 'T03']],
+        [['T08', 'T10', 'T09', 'T07']],
+    ]
+
+    eq_(expected, get_round_teams(scheduler))
+
+def test_two_teams_one_advancing():
+    scheduler = get_scheduler_with_results(8, num_teams_per_arena=2)
+    rounds = get_round_teams(scheduler)
+
+    eq_([4, 2, 1], [len(r) for r in rounds])
+    eq_([sorted(m) for m in [['T00', 'T04'], ['T02', 'T06'],
+                             ['T03', 'T07'], ['T01', 'T05']]],
+        [sorted(m) for m in rounds[0]])
+    eq_([['T04', 'T06'], ['T05', 'T07']], [sorted(m) for m in rounds[1]])
+    eq_(['T06', 'T07'], sorted(rounds[2][0]))
+
+def test_three_teams_one_advancing():
+    scheduler = get_scheduler_with_results(9, num_teams_per_arena=3)
+    rounds = get_round_teams(scheduler)
+
+    eq_([['T00', 'T03', 'T06'], ['T01', 'T04', 'T07'],
+         ['T02', 'T05', 'T08']],
+        [sorted(m) for m in rounds[0]])
+    eq_(['T06', 'T07', 'T08'], sorted(rounds[1][0]))
+    eq_(['Semi 1 (#0)', 'Semi 2 (#1)', 'Semi 3 (#2)', 'Final (#3)'],
+        [m.display_name for r in scheduler.knockout_rounds for m in r])
+
+def test_six_teams_three_advancing():
+    scheduler = get_scheduler_with_results(12, num_teams_per_arena=6,
+                                           teams_advancing=3)
+    rounds = get_round_teams(scheduler)
+
+    eq_([['T00', 'T02', 'T04', 'T06', 'T08', 'T10'],
+         ['T01', 'T03', 'T05', 'T07', 'T09', 'T11']],
+        [sorted(m) for m in rounds[0]])
+    eq_(['T06', 'T07', 'T08', 'T09', 'T10', 'T11'], sorted(rounds[1][0]))
+
+def test_knockout_match_winners_one_advancing():
+    knockout_positions = {
+        ('A', 2): OrderedDict([('JKL', 1), ('GHI', 2)]),
+    }
+    scheduler = get_scheduler(knockout_positions=knockout_positions,
+                              num_teams_per_arena=2)
+
+    game = Match(2, 'Match 2', 'A', [], None, None, None, False)
+    eq_(['JKL'], scheduler.get_winners(game))
+    game = Match(3, 'Match 3', 'A', [], None, None, None, False)
+    eq_([UNKNOWABLE_TEAM], scheduler.get_winners(game))
@@ -1,7 +1,13 @@
 
 import mock
+import os
+import random
+import shutil
+import tempfile
 
-from sr.comp.scores import LeagueScores, TeamScore
+from sr.comp.cache import ContentMemo, FileCache
+from sr.comp.scores import DuplicateScoresheet, InvalidTeam, LeagueScores, \
+                           TeamScore
 
 class FakeScorer(object):
     def __init__(self, score_data, arena_data_unused=None):
@@ -107,6 +113,13 @@ def test_team_points():
     teams_data = scores.teams
     assert teams_data == expected
 
+def test_absent_and_disqualified():
+    scores = load_basic_data()
+
+    id_ = ('A', 123)
+    assert scores.absent == {id_: frozenset(['PAS'])}
+    assert scores.disqualified == {id_: frozenset(['JMS'])}
+
 
 def test_last_scored_match():
     m_1 = get_basic_data()
@@ -212,3 +225,122 @@ def test_league_ranker_full_tie():
     assert expected_map == ranking
     order = list(ranking.keys())
     assert expected_order == order
+
+def test_league_ranker_matches_team_score_ordering():
+    rand = random.Random(0)
+    team_scores = {
+        'T{0:03}'.format(i): TeamScore(rand.randint(0, 5), rand.randint(0, 5))
+        for i in range(200)
+    }
+    ranking = LeagueScores.rank_league(team_scores)
+
+    expected_order = [tla for tla, _ in sorted(team_scores.items(),
+                                               key=lambda x: (x[1], x[0]),
+                                               reverse=True)]
+    assert expected_order == list(ranking.keys())
+
+    for tla, pos in ranking.items():
+        better = [t for t, s in team_scores.items() if s > team_scores[tla]]
+        assert len(better) + 1 == pos, (tla, pos)
+
+def assert_same_table(expected, scores):
+    assert expected.game_points == scores.game_points
+    assert expected.ranked_points == scores.ranked_points
+    assert expected.teams == scores.teams
+    assert list(expected.positions.items()) == list(scores.positions.items())
+
+def get_other_data():
+    m_2 = get_basic_data()
+    m_2['match_number'] = 2
+    m_2['teams']['JMS']['disqualified'] = False
+    m_2['teams']['PAS']['present'] = True
+    m_2['teams']['PAS']['score'] = 9
+    return m_2
+
+def test_add_match():
+    m_2 = get_other_data()
+    expected = load_datas([get_basic_data(), get_other_data()],
+                          m_2['teams'].keys())
+
+    scores = load_basic_data()
+    scores.add_match(('A', 2), m_2)
+
+    assert_same_table(expected, scores)
+
+def test_add_match_duplicate():
+    scores = load_basic_data()
+
+    try:
+        scores.add_match(('A', 123), get_basic_data())
+    except DuplicateScoresheet:
+        pass
+    else:
+        raise AssertionError("Should have refused the duplicate match")
+
+def test_add_match_invalid_team():
+    scores = load_basic_data()
+    m_2 = get_other_data()
+    m_2['teams']['NOPE'] = m_2['teams'].pop('PAS')
+
+    try:
+        scores.add_match(('A', 2), m_2)
+    except InvalidTeam as e:
+        assert e.tla == 'NOPE'
+    else:
+        raise AssertionError("Should have refused the invalid team")
+
+    assert_same_table(load_basic_data(), scores)
+
+def test_remove_match():
+    m_2 = get_other_data()
+    expected = load_datas([get_other_data()], m_2['teams'].keys())
+
+    scores = load_datas([get_basic_data(), get_other_data()],
+                        m_2['teams'].keys())
+    scores.remove_match(('A', 123))
+
+    assert_same_table(expected, scores)
+
+def test_replace_match():
+    m_2 = get_other_data()
+    m_2['match_number'] = 123
+    expected = load_datas([m_2], m_2['teams'].keys())
+
+    scores = load_basic_data()
+    scores.replace_match(('A', 123), m_2)
+
+    assert_same_table(expected, scores)
+
+
+def test_memo_shared_between_caches():
+    tmpdir = tempfile.mkdtemp()
+    try:
+        arena_dir = os.path.join(tmpdir, 'A')
+        os.makedirs(arena_dir)
+        with open(os.path.join(arena_dir, '123.yaml'), 'w') as f:
+            f.write('match_number: 123\n'
+                    'arena_id: A\n'
+                    'teams:\n'
+                    '  RUN: {score: 8, zone: 1}\n'
+                    '  ICE: {score: 2, zone: 2}\n')
+
+        scorer = mock.Mock(side_effect=FakeScorer)
+        memo = ContentMemo()
+
+        def load():
+            return LeagueScores(tmpdir, ['RUN', 'ICE'], scorer,
+                                num_teams_per_arena=4,
+                                cache=FileCache(memo=memo),
+                                scorer_id='some-scorer')
+
+        first = load()
+        assert scorer.call_count == 1
+
+        # A new cache, so the sheet is only found in the shared memo
+        second = load()
+        assert scorer.call_count == 1, "Should have reused the memoised scores"
+
+        assert first.game_points == second.game_points
+        assert second.game_points == {('A', 123): {'RUN': 8, 'ICE': 2}}
+    finally:
+        shutil.rmtree(tmpdir)
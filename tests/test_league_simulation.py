@@ -0,0 +1,64 @@
+from datetime import datetime
+
+import mock
+from nose.tools import eq_
+
+from sr.comp.league_simulation import game_points_history, \
+                                      remaining_league_matches, \
+                                      simulate_league
+from sr.comp.match_period import Match, MatchType
+from sr.comp.scores import TeamScore
+
+def build_match(num, teams, type_=MatchType.league):
+    return Match(num, 'Match {0}'.format(num), 'A', teams,
+                 datetime(2014, 4, 26, 10, num), datetime(2014, 4, 26, 10, num),
+                 type_, False)
+
+def get_comp():
+    league = mock.Mock(
+        teams={
+            'ABC': TeamScore(100, 3),
+            'DEF': TeamScore(6, 1),
+            'GHI': TeamScore(4, 2),
+            'JKL': TeamScore(2, 0),
+        },
+        game_points={('A', 0): {'ABC': 3, 'DEF': 1, 'GHI': 2}},
+    )
+    schedule = mock.Mock(matches=[
+        {'A': build_match(0, ['ABC', 'DEF', 'GHI', None])},
+        {'A': build_match(1, ['DEF', 'GHI', 'JKL', 'ABC'])},
+        {'A': build_match(2, ['ABC', 'DEF'], MatchType.knockout)},
+    ])
+    return mock.Mock(schedule=schedule, scores=mock.Mock(league=league),
+                     num_teams_per_arena=4)
+
+def test_remaining_league_matches():
+    comp = get_comp()
+    remaining = remaining_league_matches(comp.schedule, comp.scores.league)
+    eq_([1], [match.num for match in remaining])
+
+def test_game_points_history():
+    comp = get_comp()
+    histories = game_points_history(comp.scores.league)
+    eq_({'ABC': [3], 'DEF': [1], 'GHI': [2], 'JKL': [3, 1, 2]}, histories)
+
+def test_simulate_league():
+    sim = simulate_league(get_comp(), trials=600, seed=1)
+
+    eq_(600, sim.trials)
+    for counts in sim.position_counts.values():
+        eq_(600, sum(counts))
+
+    # Too far ahead to be caught
+    eq_([600, 0, 0, 0], sim.position_counts['ABC'])
+    eq_([1.0, 0, 0, 0], sim.probabilities('ABC'))
+    eq_(0, sim.probability_in_top('DEF', 1))
+    eq_(1, sim.probability_in_top('DEF', 4))
+
+def test_simulate_league_repeatable():
+    comp = get_comp()
+    sim = simulate_league(comp, trials=600, seed=1)
+    eq_(sim.position_counts,
+        simulate_league(comp, trials=600, seed=1).position_counts)
+    eq_(sim.position_counts,
+        simulate_league(comp, trials=600, seed=1, workers=2).position_counts)
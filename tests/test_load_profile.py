@@ -0,0 +1,39 @@
+import mock
+from nose.tools import eq_
+
+from sr.comp.load_profile import LoadProfile
+
+def test_phase():
+    profile = LoadProfile()
+    with mock.patch('sr.comp.load_profile.default_timer') as timer:
+        timer.side_effect = [10, 12.5]
+        with profile.phase('thing'):
+            pass
+
+    eq_({'thing': {'time': 2.5, 'count': 1}}, profile.phases)
+
+def test_phase_accumulates():
+    profile = LoadProfile()
+    profile.record('thing', 1)
+    profile.record('thing', 2)
+
+    eq_({'thing': {'time': 3, 'count': 2}}, profile.phases)
+
+def test_phase_records_on_error():
+    profile = LoadProfile()
+    try:
+        with profile.phase('thing'):
+            raise ValueError()
+    except ValueError:
+        pass
+
+    eq_(1, profile.phases['thing']['count'])
+
+def test_nested_phase_order():
+    profile = LoadProfile()
+    with profile.phase('outer'):
+        with profile.phase('outer.inner'):
+            pass
+    profile.record('total', 1)
+
+    eq_(['outer', 'outer.inner', 'total'], list(profile.phases.keys()))
@@ -2,7 +2,7 @@
 from collections import defaultdict
 from datetime import datetime, timedelta
 
-from sr.comp.matches import MatchSchedule, parse_ranges
+from sr.comp.matches import MatchSchedule, TimeIndex, parse_ranges
 from sr.comp.match_period import Match
 from sr.comp.teams import Team
 
@@ -363,6 +363,118 @@ def test_matches_at_with_delays():
 
     yield check, [],            datetime(2014, 3, 26,  13, 15, 15)
 
+def test_matches_at_after_adding_match():
+    matches = load_basic_data()
+    when = datetime(2014, 3, 26,  16)
+    assert [] == list(matches.matches_at(when))
+
+    match = Match(3, 'Match 3', 'A', [], when, when + timedelta(minutes=5),
+                  None, False)
+    matches.matches.append({'A': match})
+
+    assert [match] == list(matches.matches_at(when))
+
+def test_next_match_after():
+    matches = load_basic_data()
+
+    def check(expected, when):
+        actual = matches.next_match_after(when)
+        assert expected == actual
+
+    def match_list(num):
+        return list(matches.matches[num].values())
+
+    yield check, match_list(0), datetime(2014, 3, 26,  12, 59, 59)
+    yield check, match_list(1), datetime(2014, 3, 26,  13)
+    yield check, match_list(1), datetime(2014, 3, 26,  13,  5, 14)
+    yield check, match_list(2), datetime(2014, 3, 26,  13,  5, 15)
+    yield check, [],            datetime(2014, 3, 26,  13, 10, 15)
+
+def test_matches_between():
+    matches = load_basic_data()
+
+    def check(expected, start, end):
+        actual = matches.matches_between(start, end)
+        assert expected == actual
+
+    def match_list(*nums):
+        return [match for num in nums
+                for match in matches.matches[num].values()]
+
+    yield check, match_list(0, 1, 2), datetime(2014, 3, 26,  13), \
+                                      datetime(2014, 3, 26,  14)
+    yield check, match_list(0),       datetime(2014, 3, 26,  13), \
+                                      datetime(2014, 3, 26,  13,  5, 15)
+    yield check, match_list(1, 2),    datetime(2014, 3, 26,  13,  0,  1), \
+                                      datetime(2014, 3, 26,  13, 10, 16)
+    yield check, [],                  datetime(2014, 3, 26,  13,  0,  1), \
+                                      datetime(2014, 3, 26,  13,  5, 15)
+    yield check, [],                  datetime(2014, 3, 26,  14), \
+                                      datetime(2014, 3, 26,  13)
+
+def test_matches_for_team():
+    matches = load_basic_data()
+
+    assert [matches.matches[0]['A']] == matches.matches_for_team('CLY')
+    assert [matches.matches[1]['A'], matches.matches[2]['A']] == \
+        matches.matches_for_team('QMS')
+
+    # Dropped out after match 1
+    assert [matches.matches[1]['A']] == matches.matches_for_team('WYC')
+
+    assert [] == matches.matches_for_team('NOPE')
+
+def test_matches_for_team_after_adding_match():
+    matches = load_basic_data()
+    assert 1 == len(matches.matches_for_team('CLY'))
+
+    when = datetime(2014, 3, 26,  16)
+    match = Match(3, 'Match 3', 'A', ['CLY', None, None, None],
+                  when, when + timedelta(minutes=5), None, False)
+    matches.matches.append({'A': match})
+
+    assert [matches.matches[0]['A'], match] == \
+        matches.matches_for_team('CLY')
+
+def test_next_match_for_team():
+    matches = load_basic_data()
+
+    def check(expected, tla, when):
+        actual = matches.next_match_for_team(tla, when)
+        assert expected == actual
+
+    yield check, matches.matches[1]['A'], 'QMS', datetime(2014, 3, 26,  13)
+    yield check, matches.matches[2]['A'], 'QMS', datetime(2014, 3, 26,  13, 6)
+    yield check, None,                    'QMS', datetime(2014, 3, 26,  13, 11)
+    yield check, None,                    'CLY', datetime(2014, 3, 26,  13)
+
+def test_get_match():
+    matches = load_basic_data()
+
+    assert matches.matches[1]['B'] == matches.get_match('B', 1)
+    assert matches.matches[2]['A'] == matches.get_match('A', 2)
+
+    for arena, num in (('B', 2), ('A', 3), ('A', -1), ('C', 0)):
+        try:
+            matches.get_match(arena, num)
+        except KeyError:
+            pass
+        else:
+            raise AssertionError("Should not find match {0}{1}".format(arena, num))
+
+def test_get_slot():
+    matches = load_basic_data()
+
+    assert matches.matches[1] is matches.get_slot(1)
+
+    for num in (3, -1):
+        try:
+            matches.get_slot(num)
+        except KeyError:
+            pass
+        else:
+            raise AssertionError("Should not find slot {0}".format(num))
+
 
 def test_no_matches():
     the_data = get_basic_data()
@@ -706,3 +818,33 @@ def test_parse_bad_ranges():
     yield check, "1,a"
     yield check, "1--4"
     yield check, "1-,4"
+
+def test_time_index_overlapping_intervals():
+    start = datetime(2014, 3, 26,  13)
+    def at(minutes):
+        return start + timedelta(minutes=minutes)
+
+    # (name, start, end), deliberately not sorted by start time
+    items = [
+        ('long',  at(0),  at(60)),
+        ('late',  at(30), at(35)),
+        ('short', at(0),  at(5)),
+        ('next',  at(5),  at(10)),
+    ]
+    index = TimeIndex(items, lambda i: i[1], lambda i: i[2])
+
+    def names(found):
+        return [item[0] for item in found]
+
+    assert ['long', 'short'] == names(index.at(at(0)))
+    assert ['long', 'next'] == names(index.at(at(5)))
+    assert ['long', 'late'] == names(index.at(at(34)))
+    assert ['long'] == names(index.at(at(59)))
+    assert [] == names(index.at(at(60)))
+
+    assert ['next'] == names(index.first_starting_after(at(0)))
+    assert ['late'] == names(index.first_starting_after(at(5)))
+    assert [] == names(index.first_starting_after(at(30)))
+
+    assert ['long', 'short', 'next'] == \
+        names(index.starting_between(at(0), at(30)))
@@ -0,0 +1,124 @@
+from datetime import datetime, timedelta
+
+import mock
+from nose.tools import eq_
+
+from sr.comp.match_period import Match, MatchType
+from sr.comp.qualification import knockout_arity, LeagueAnalysis, \
+                                   league_position_bounds, PositionBounds
+from sr.comp.scores import TeamScore
+
+def build_match(num, teams, type_=MatchType.league):
+    time = datetime(2014, 4, 26, 10) + timedelta(minutes=num)
+    return Match(num, 'Match {0}'.format(num), 'A', teams, time, time, type_,
+                 False)
+
+def get_comp(team_scores, remaining, teams=None):
+    league = mock.Mock(teams=team_scores,
+                       game_points={('A', 0): {'ABC': 3}})
+    matches = [{'A': build_match(0, ['ABC', None, None, None])}]
+    for num, match_teams in enumerate(remaining, start=1):
+        matches.append({'A': build_match(num, match_teams)})
+    knockout = build_match(len(matches), ['ABC', 'DEF', None, None],
+                           MatchType.knockout)
+    matches.append({'A': knockout})
+    schedule = mock.Mock(matches=matches, knockout_rounds=[[knockout]])
+    return mock.Mock(schedule=schedule, scores=mock.Mock(league=league),
+                     num_teams_per_arena=4, teams=teams)
+
+def get_analysis(comp):
+    return LeagueAnalysis(comp.schedule, comp.scores.league,
+                          comp.num_teams_per_arena, comp.teams)
+
+def get_basic_comp(teams=None):
+    return get_comp({
+        'ABC': TeamScore(30, 3),
+        'DEF': TeamScore(10, 5),
+        'GHI': TeamScore(8, 0),
+        'JKL': TeamScore(0, 0),
+        'MNO': TeamScore(0, 0),
+    }, [['DEF', 'GHI', 'JKL', None]], teams)
+
+def test_knockout_arity():
+    eq_(2, knockout_arity(get_basic_comp().schedule))
+
+def test_position_bounds():
+    bounds = PositionBounds(2, 5)
+    assert bounds.qualified(5)
+    assert not bounds.qualified(4)
+    assert bounds.eliminated(1)
+    assert not bounds.eliminated(2)
+
+def test_best_position():
+    analysis = get_analysis(get_basic_comp())
+    eq_(8, analysis.ceiling)
+
+    # Can't be caught
+    eq_(1, analysis.best_position('ABC'))
+    # Could win the match and then any tie on game points
+    eq_(2, analysis.best_position('DEF'))
+    eq_(2, analysis.best_position('GHI'))
+    eq_(3, analysis.best_position('JKL'))
+    # No matches left, so behind JKL only on TLA
+    eq_(4, analysis.best_position('MNO'))
+
+def test_worst_position():
+    analysis = get_analysis(get_basic_comp())
+
+    eq_(1, analysis.worst_position('ABC'))
+    # GHI passes it just by turning up; JKL can't get close enough
+    eq_(3, analysis.worst_position('DEF'))
+    eq_(4, analysis.worst_position('GHI'))
+    eq_(5, analysis.worst_position('JKL'))
+    eq_(5, analysis.worst_position('MNO'))
+
+def test_worst_position_rivals_play_each_other():
+    comp = get_comp({
+        'ABC': TeamScore(12, 0),
+        'DEF': TeamScore(4, 0),
+        'GHI': TeamScore(4, 0),
+    }, [['DEF', 'GHI', None, None]])
+    analysis = get_analysis(comp)
+
+    # Either could win the match, but not both
+    eq_(2, analysis.worst_position('ABC'))
+
+def test_worst_position_dropped_out():
+    teams = {
+        'ABC': mock.Mock(is_still_around=lambda num: True),
+        'DEF': mock.Mock(is_still_around=lambda num: True),
+        'GHI': mock.Mock(is_still_around=lambda num: num < 1),
+        'JKL': mock.Mock(is_still_around=lambda num: True),
+        'MNO': mock.Mock(is_still_around=lambda num: True),
+    }
+    analysis = get_analysis(get_basic_comp(teams))
+
+    # GHI won't play again, so can't pass DEF
+    eq_(2, analysis.worst_position('DEF'))
+    eq_(3, analysis.best_position('GHI'))
+    eq_(4, analysis.worst_position('GHI'))
+
+def test_league_position_bounds():
+    bounds = league_position_bounds(get_basic_comp())
+
+    eq_({
+        'ABC': PositionBounds(1, 1),
+        'DEF': PositionBounds(2, 3),
+        'GHI': PositionBounds(2, 4),
+        'JKL': PositionBounds(3, 5),
+        'MNO': PositionBounds(4, 5),
+    }, bounds)
+    assert bounds['ABC'].qualified(2)
+    assert bounds['MNO'].eliminated(2)
+
+def test_worst_position_long_schedule():
+    # Many more matches than Python's default recursion limit
+    comp = get_comp({
+        'ABC': TeamScore(8401, 0),
+        'DEF': TeamScore(0, 0),
+        'GHI': TeamScore(0, 0),
+    }, [['DEF', 'GHI', None, None]] * 1200)
+    analysis = get_analysis(comp)
+
+    # Both could only pass it by sharing every match, which isn't enough
+    eq_(2, analysis.worst_position('ABC'))
@@ -0,0 +1,71 @@
+import math
+
+import mock
+from nose.plugins.skip import SkipTest
+from nose.tools import eq_
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+def get_scores():
+    return mock.Mock(
+        teams={'ABC': None, 'DEF': None, 'GHI': None, 'JKL': None},
+        game_points={
+            ('B', 1): {'ABC': 3, 'DEF': 0},
+            ('A', 0): {'ABC': 4, 'DEF': 2, 'GHI': 0},
+        },
+        game_positions={
+            ('B', 1): {1: set(['ABC']), 2: set(['DEF'])},
+            ('A', 0): {1: set(['ABC']), 2: set(['DEF']), 3: set(['GHI'])},
+        },
+        ranked_points={
+            ('B', 1): {'ABC': 8, 'DEF': 0},
+            ('A', 0): {'ABC': 8, 'DEF': 6, 'GHI': 0},
+        },
+        absent={('B', 1): frozenset(), ('A', 0): frozenset(['GHI'])},
+        disqualified={('B', 1): frozenset(['DEF']), ('A', 0): frozenset()},
+    )
+
+def get_matrix():
+    if numpy is None:
+        raise SkipTest("numpy is not installed")
+
+    from sr.comp.score_matrix import ScoreMatrix
+    return ScoreMatrix(get_scores())
+
+def assert_rows(expected, array):
+    actual = [[None if math.isnan(value) else value for value in row]
+              for row in array.tolist()]
+    eq_(expected, actual)
+
+def test_axes():
+    matrix = get_matrix()
+    eq_(['ABC', 'DEF', 'GHI', 'JKL'], matrix.teams)
+    eq_([('A', 0), ('B', 1)], matrix.match_ids)
+    eq_(2, matrix.team_index['GHI'])
+    eq_(1, matrix.match_index[('B', 1)])
+
+def test_points():
+    matrix = get_matrix()
+    assert_rows([[4, 3], [2, 0], [0, None], [None, None]],
+                matrix.game_points)
+    assert_rows([[8, 8], [6, 0], [0, None], [None, None]],
+                matrix.ranked_points)
+    assert_rows([[1, 1], [2, 2], [3, None], [None, None]],
+                matrix.positions)
+
+def test_masks():
+    matrix = get_matrix()
+    eq_([[True, True], [True, True], [True, False], [False, False]],
+        matrix.played.tolist())
+    eq_([[False, False], [False, False], [True, False], [False, False]],
+        matrix.absent.tolist())
+    eq_([[False, False], [False, True], [False, False], [False, False]],
+        matrix.disqualified.tolist())
+
+def test_vectorised_mean():
+    matrix = get_matrix()
+    means = numpy.nanmean(matrix.game_points[:3], axis=1)
+    eq_([3.5, 1, 0], means.tolist())
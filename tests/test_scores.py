@@ -1,5 +1,10 @@
 
+import os
+import shutil
+import tempfile
+
 import mock
+import yaml
 
 from sr.comp.scores import Scores
 
@@ -36,3 +41,75 @@ def test_last_scored_match_none():
     # All present -- always choose tiebreaker value
     yield check, 13, 37, 42, 42
     yield check, 42, 37, 13, 13
+
+
+class FakeScorer(object):
+    def __init__(self, score_data, arena_data_unused=None):
+        self.score_data = score_data
+
+    def calculate_scores(self):
+        scores = {}
+        for team, info in self.score_data.items():
+            scores[team] = info['score']
+        return scores
+
+def write_score_sheets(root, score_sheets):
+    for match_type, sheets in score_sheets.items():
+        for arena, num, teams in sheets:
+            dirname = os.path.join(root, match_type, arena)
+            if not os.path.exists(dirname):
+                os.makedirs(dirname)
+
+            data = {'arena_id': arena, 'match_number': num, 'teams': teams}
+            with open(os.path.join(dirname, '{0:03}.yaml'.format(num)), 'w') as f:
+                yaml.safe_dump(data, f)
+
+def test_workers_same_results():
+    root = tempfile.mkdtemp()
+    try:
+        teams = ['ABC', 'DEF', 'GHI', 'JKL']
+        league = []
+        for num in range(20):
+            scores = [(num * 7 + i * 3) % 5 for i in range(len(teams))]
+            league.append(('A', num, {tla: {'score': score, 'zone': zone}
+                                      for zone, (tla, score)
+                                      in enumerate(zip(teams, scores))}))
+
+        knockout = [('A', 20, {'ABC': {'score': 3, 'zone': 0},
+                               'DEF': {'score': 1, 'zone': 1}})]
+
+        write_score_sheets(root, {'league': league, 'knockout': knockout})
+
+        expected = Scores(root, teams, FakeScorer, 4)
+        scores = Scores(root, teams, FakeScorer, 4, workers=3)
+
+        for attr in ('league', 'knockout', 'tiebreaker'):
+            expected_scores = getattr(expected, attr)
+            actual_scores = getattr(scores, attr)
+            assert expected_scores.game_points == actual_scores.game_points
+            assert expected_scores.ranked_points == actual_scores.ranked_points
+            assert expected_scores.teams == actual_scores.teams
+
+        assert list(expected.league.positions.items()) == \
+            list(scores.league.positions.items())
+        assert expected.knockout.resolved_positions == \
+            scores.knockout.resolved_positions
+        assert expected.last_scored_match == scores.last_scored_match
+    finally:
+        shutil.rmtree(root)
+
+def test_knockout_and_tiebreaker_loaded_lazily():
+    with mock.patch('sr.comp.scores.LeagueScores') as ls, \
+         mock.patch('sr.comp.scores.KnockoutScores') as ks, \
+         mock.patch('sr.comp.scores.TiebreakerScores') as ts:
+        scores = Scores('', None, None, 0)
+
+        assert ls.called
+        assert not ks.called, "Should not load the knockout until needed"
+        assert not ts.called, "Should not load the tiebreaker until needed"
+
+        assert scores.knockout is ks.return_value
+        assert scores.knockout is ks.return_value
+        assert scores.tiebreaker is ts.return_value
+        assert ks.call_count == 1
+        assert ts.call_count == 1
@@ -0,0 +1,131 @@
+import math
+
+from nose.tools import assert_raises, eq_
+
+from sr.comp.knockout_scheduler import seeding
+
+def reference_reverse_bits(n, width):
+    """The original implementation, for comparison."""
+    b = '{:0{width}b}'.format(n, width=width)
+    return int(b[::-1], 2)
+
+def reference_first_round_seeding(n_teams):
+    """The original implementation, for comparison."""
+    rounded_teams = int(2 ** math.ceil(math.log(n_teams, 2)))
+
+    n_per_match = 4
+    n_matches = int(math.ceil(float(rounded_teams) / n_per_match))
+    matches_bits = int(math.ceil(math.log(n_matches, 2)))
+
+    ins_order = []
+    for n in range(n_matches):
+        if n % 2 == 0:
+            v = reference_reverse_bits(n, matches_bits)
+        else:
+            v ^= seeding.bit_mask(matches_bits)
+        ins_order.append(v)
+
+    matches = []
+    for n in range(n_matches):
+        matches += [[]]
+
+    for n in range(n_teams):
+        matches[ins_order[n % n_matches]].append(n)
+
+    return matches
+
+def test_reverse_bits():
+    eq_(0b0011, seeding.reverse_bits(0b1100, 4))
+    eq_(0b00110, seeding.reverse_bits(0b01100, 5))
+    eq_(0, seeding.reverse_bits(0, 0))
+
+def test_reverse_bits_matches_reference():
+    for width in range(11):
+        for n in range(2 ** width):
+            eq_(reference_reverse_bits(n, width),
+                seeding.reverse_bits(n, width), (n, width))
+
+def test_first_round_seeding():
+    eq_([[0, 4, 8, 12], [2, 6, 10, 14], [3, 7, 11, 15], [1, 5, 9, 13]],
+        seeding.first_round_seeding(16))
+
+def test_first_round_seeding_matches_reference():
+    for n_teams in range(1, seeding.MAX_TABLE_TEAMS + 1):
+        eq_(reference_first_round_seeding(n_teams),
+            seeding.first_round_seeding(n_teams), n_teams)
+
+def test_first_round_seeding_beyond_table():
+    n_teams = seeding.MAX_TABLE_TEAMS + 3
+    eq_(reference_first_round_seeding(n_teams),
+        seeding.first_round_seeding(n_teams))
+
+def test_first_round_seeding_returns_new_lists():
+    seeding.first_round_seeding(8)[0].append(42)
+    eq_([0, 2, 4, 6], seeding.first_round_seeding(8)[0])
+
+def test_seeding_table():
+    table = seeding.seeding_table(16)
+
+    eq_(list(range(1, 17)), sorted(table.keys()))
+    for n_teams, matches in table.items():
+        eq_(reference_first_round_seeding(n_teams),
+            [list(seeds) for seeds in matches], n_teams)
+
+def test_seeding_table_default():
+    eq_(seeding.MAX_TABLE_TEAMS, len(seeding.seeding_table()))
+
+def test_seeding_table_remembered():
+    first = seeding.seeding_table(8)
+    second = seeding.seeding_table(8)
+
+    for n_teams in first:
+        assert first[n_teams] is second[n_teams], n_teams
+
+def test_reverse_digits():
+    eq_(0b0011, seeding.reverse_digits(0b1100, 4))
+    # 21 is 0210 in base 3
+    eq_(1 * 9 + 2 * 3, seeding.reverse_digits(21, 4, 3))
+
+def test_rotate_digits():
+    eq_(0b0110, seeding.rotate_digits(0b1001, 4, 2, 1))
+    # 0210 in base 3
+    eq_(1 * 27 + 0 * 9 + 2 * 3 + 1, seeding.rotate_digits(21, 4, 3, 1))
+
+def test_num_feeding_matches():
+    eq_(2, seeding.num_feeding_matches(4, 2))
+    eq_(2, seeding.num_feeding_matches(2, 1))
+    eq_(3, seeding.num_feeding_matches(3, 1))
+    eq_(4, seeding.num_feeding_matches(4, 1))
+
+def test_num_feeding_matches_invalid():
+    for n_per_match, n_advancing in [(3, 2), (4, 3), (4, 4), (4, 0)]:
+        with assert_raises(ValueError):
+            seeding.num_feeding_matches(n_per_match, n_advancing)
+
+def test_first_round_seeding_three_teams_one_advancing():
+    eq_([[0, 9, 18], [3, 12, 21], [6, 15, 24],
+         [7, 16, 25], [1, 10, 19], [4, 13, 22],
+         [5, 14, 23], [8, 17, 26], [2, 11, 20]],
+        seeding.first_round_seeding(27, 3, 1))
+
+def test_first_round_seeding_two_teams_one_advancing_byes():
+    # The top seeds get byes
+    eq_([[0, 4], [2], [3], [1]], seeding.first_round_seeding(5, 2, 1))
+
+def test_first_round_seeding_top_seeds_spread():
+    # Each of the top seeds starts in a different part of the bracket, so
+    # that they can only meet in the final
+    for n_per_match, n_advancing in [(2, 1), (3, 1), (4, 2), (4, 1), (6, 2)]:
+        n_feeding = seeding.num_feeding_matches(n_per_match, n_advancing)
+        matches = seeding.first_round_seeding(1000, n_per_match, n_advancing)
+        group_size = len(matches) // n_feeding
+        groups = [next(i // group_size for i, seeds in enumerate(matches)
+                       if seed in seeds)
+                  for seed in range(n_feeding)]
+        eq_(list(range(n_feeding)), sorted(groups),
+            (n_per_match, n_advancing))
+
+def test_seeding_table_teams_per_match():
+    table = seeding.seeding_table(9, 3, 1)
+    eq_(seeding.first_round_seeding(9, 3, 1),
+        [list(seeds) for seeds in table[9]])
@@ -1,9 +1,18 @@
 from __future__ import print_function
 
-from nose.tools import eq_
+import hashlib
 
+from nose.plugins.skip import SkipTest
+from nose.tools import eq_, raises
+
+from sr.comp.knockout_scheduler import seeding
 from sr.comp.knockout_scheduler.stable_random import Random
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 # Tests primarily to ensure stable behaviour across Python versions
 
 def test_getrandbits():
@@ -38,3 +47,124 @@ def test_shuffle():
     expected = [15, 3, 10, 2, 11, 1, 13, 5, 4, 12, 7, 0, 8, 9, 6, 14]
 
     eq_(numbers, expected)
+
+class ReferenceRandom(object):
+    """The original bit at a time implementation, for comparison."""
+
+    def __init__(self, seed):
+        h = hashlib.md5()
+        h.update(seed)
+        self.state = int(h.hexdigest(), 16) & 0xffffffff
+
+    def _rand_bit(self):
+        bit = self.state & 1
+
+        nb = 0
+        for n in (20, 25, 30, 31):
+            nb ^= (self.state >> n) & 1
+
+        self.state <<= 1
+        self.state |= nb
+
+        return bit
+
+    def getrandbits(self, n):
+        v = 0
+        for _ in range(n):
+            v <<= 1
+            v |= self._rand_bit()
+        return v
+
+    def random(self):
+        return self.getrandbits(32) / float(1 << 32)
+
+    def shuffle(self, x):
+        for i in reversed(range(1, len(x))):
+            j = int(self.random() * (i+1))
+            x[i], x[j] = x[j], x[i]
+
+def test_matches_reference():
+    sizes = [1, 2, 7, 20, 21, 22, 32, 42, 64, 100]
+    for i in range(1000):
+        seed = 'seed {0}'.format(i).encode('utf-8')
+        rnd = Random()
+        rnd.seed(seed)
+        reference = ReferenceRandom(seed)
+
+        for n in sizes:
+            eq_(reference.getrandbits(n), rnd.getrandbits(n), (seed, n))
+        eq_(reference._rand_bit(), rnd._rand_bit(), seed)
+        eq_(reference.random(), rnd.random(), seed)
+
+        expected = list(range(i % 40))
+        reference.shuffle(expected)
+        numbers = list(range(i % 40))
+        rnd.shuffle(numbers)
+        eq_(expected, numbers, seed)
+
+        eq_(reference.state & 0xffffffff, rnd.state, seed)
+
+def skip_without_numpy():
+    if numpy is None:
+        raise SkipTest("numpy is not installed")
+
+def get_seeds(count):
+    skip_without_numpy()
+    return ['seed {0}'.format(i).encode('utf-8') for i in range(count)]
+
+def test_batch_matches_scalar():
+    seeds = get_seeds(200)
+    batch = Random.batch(seeds)
+    generators = []
+    for seed in seeds:
+        rnd = Random()
+        rnd.seed(seed)
+        generators.append(rnd)
+
+    eq_([rnd.state for rnd in generators], batch.state.tolist())
+
+    for n in [1, 2, 7, 20, 21, 22, 32, 42, 64]:
+        eq_([rnd.getrandbits(n) for rnd in generators],
+            batch.getrandbits(n).tolist(), n)
+    eq_([rnd.random() for rnd in generators], batch.random().tolist())
+
+    numbers = numpy.tile(numpy.arange(16), (len(seeds), 1))
+    batch.shuffle(numbers)
+    for rnd, row in zip(generators, numbers.tolist()):
+        expected = list(range(16))
+        rnd.shuffle(expected)
+        eq_(expected, row)
+
+    eq_([rnd.state for rnd in generators], batch.state.tolist())
+
+def test_batch_replays_zone_shuffles():
+    # Shuffle the zones of the first round of knockout matches, as the
+    # automatic knockout scheduler does, for many seedings at once
+    skip_without_numpy()
+    tlas = ['T{0:02}'.format(i) for i in range(16)]
+    seedings = [tlas[i:] + tlas[:i] for i in range(16)]
+
+    batch = Random.batch(["".join(teams).encode("utf-8")
+                          for teams in seedings])
+    expected = [[] for _ in seedings]
+    for i, teams in enumerate(seedings):
+        rnd = Random()
+        rnd.seed("".join(teams).encode("utf-8"))
+        for seeds in seeding.first_round_seeding(len(teams)):
+            zones = [teams[seed] for seed in seeds]
+            rnd.shuffle(zones)
+            expected[i].append(zones)
+
+    actual = [[] for _ in seedings]
+    all_teams = numpy.array(seedings, dtype=object)
+    for seeds in seeding.first_round_seeding(len(tlas)):
+        zones = all_teams[:, seeds]
+        batch.shuffle(zones)
+        for i, row in enumerate(zones.tolist()):
+            actual[i].append(row)
+
+    eq_(expected, actual)
+
+@raises(ValueError)
+def test_batch_getrandbits_too_many():
+    Random.batch(get_seeds(2)).getrandbits(65)
@@ -1,5 +1,9 @@
 
-from sr.comp.scores import TeamScore
+import pickle
+
+from nose.tools import raises
+
+from sr.comp.scores import FrozenTeamScore, TeamScore
 
 def test_empty_ctor():
     ts = TeamScore()
@@ -113,3 +117,47 @@ def test_rich_comparisons_both_differ():
     ts1 = TeamScore(game = 25, league = 4)
     # Only care about league points really -- game are tie-break only
     assert_rich_comparisons(ts1, ts2)
+
+def test_no_instance_dict():
+    ts = TeamScore(game = 5, league = 4)
+    assert not hasattr(ts, '__dict__')
+
+@raises(TypeError)
+def test_not_hashable():
+    hash(TeamScore(game = 5, league = 4))
+
+def test_freeze():
+    ts = TeamScore(game = 5, league = 4)
+    frozen = ts.freeze()
+    assert isinstance(frozen, FrozenTeamScore)
+    assert frozen == ts
+    assert ts == frozen
+    assert frozen.freeze() is frozen
+
+    ts.game_points += 1
+    assert frozen.game_points == 5
+    assert_rich_comparisons(frozen, ts)
+
+@raises(AttributeError)
+def test_frozen_immutable():
+    frozen = FrozenTeamScore(game = 5, league = 4)
+    frozen.game_points += 1
+
+def test_frozen_hashable():
+    scores = {FrozenTeamScore(game = 5, league = 4),
+              FrozenTeamScore(game = 5, league = 4),
+              FrozenTeamScore(game = 5, league = 4.5)}
+    assert len(scores) == 2
+
+def test_pickle():
+    for ts in (TeamScore(game = 5, league = 4),
+               FrozenTeamScore(game = 5, league = 4)):
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            copied = pickle.loads(pickle.dumps(ts, protocol))
+            assert type(copied) is type(ts)
+            assert copied == ts
+
+def test_repr():
+    assert repr(TeamScore(game = 5, league = 4)) == 'TeamScore(4, 5)'
+    assert repr(FrozenTeamScore(game = 5, league = 4)) == \
+        'FrozenTeamScore(4, 5)'
@@ -0,0 +1,126 @@
+from collections import defaultdict, OrderedDict
+from datetime import datetime
+
+import mock
+from nose.tools import eq_, raises
+
+from sr.comp.matches import MatchSchedule
+from sr.comp.teams import Team
+from sr.comp.what_if import HypotheticalKnockoutScores, knockout_what_if
+
+TLAS = ['AAA', 'BBB', 'CCC', 'DDD', 'EEE', 'FFF', 'GGG', 'HHH']
+
+def get_config():
+    return {
+        'match_slot_lengths': {'pre': 60, 'match': 180, 'post': 60,
+                               'total': 300},
+        'staging': {'opens': 300, 'closes': 120, 'duration': 180,
+                    'signal_shepherds': {'Blue': 241}, 'signal_teams': 240},
+        'delays': [],
+        'match_periods': {
+            'league': [{
+                'description': 'League',
+                'start_time': datetime(2014, 3, 26, 13),
+                'end_time': datetime(2014, 3, 26, 17, 30),
+            }],
+            'knockout': [{
+                'description': 'Knockouts',
+                'start_time': datetime(2014, 3, 27, 13),
+                'end_time': datetime(2014, 3, 27, 17, 30),
+            }],
+        },
+        'league': {'extra_spacing': []},
+        'knockout': {
+            'round_spacing': 300,
+            'final_delay': 300,
+            'single_arena': {'rounds': 1, 'arenas': ['A']},
+        },
+    }
+
+def get_comp(knockout_positions=None):
+    league = {0: {'A': TLAS[:4], 'B': TLAS[4:]}}
+    league_scores = mock.Mock(
+        positions=OrderedDict((tla, i) for i, tla in enumerate(TLAS, 1)),
+        game_points={('A', 0): {}, ('B', 0): {}},
+    )
+    scores = mock.Mock(
+        league=league_scores,
+        knockout=mock.Mock(resolved_positions=knockout_positions or {}),
+    )
+    teams = defaultdict(lambda: Team(None, None, False, None))
+
+    with mock.patch('sr.comp.matches.yaml_loader.cached_load') as loader:
+        loader.side_effect = [get_config(), {'matches': league}]
+        schedule = MatchSchedule.create('schedule.yaml', 'league.yaml',
+                                        scores, ['A', 'B'], 4, teams)
+
+    return mock.Mock(schedule=schedule, scores=scores)
+
+def test_no_results():
+    comp = get_comp()
+    rounds = knockout_what_if(comp, {})
+
+    eq_([[m.num for m in r] for r in comp.schedule.knockout_rounds],
+        [[m.num for m in r] for r in rounds])
+    eq_([[m.teams for m in r] for r in comp.schedule.knockout_rounds],
+        [[m.teams for m in r] for r in rounds])
+    eq_([[m.start_time for m in r] for r in comp.schedule.knockout_rounds],
+        [[m.start_time for m in r] for r in rounds])
+
+def test_results():
+    comp = get_comp()
+    first, second = comp.schedule.knockout_rounds[0]
+    matches = list(comp.schedule.matches)
+    final = comp.schedule.knockout_rounds[-1][0]
+
+    results = {
+        (first.arena, first.num): sorted(t for t in first.teams if t),
+        (second.arena, second.num): sorted(t for t in second.teams if t),
+    }
+    rounds = knockout_what_if(comp, results)
+
+    expected = sorted(results[(first.arena, first.num)][:2] +
+                      results[(second.arena, second.num)][:2])
+    eq_(expected, sorted(rounds[-1][0].teams))
+    eq_(final.num, rounds[-1][0].num)
+
+    # The competition itself is left alone
+    eq_(matches, comp.schedule.matches)
+    assert final is comp.schedule.knockout_rounds[-1][0]
+    eq_(['???'] * 4, final.teams)
+
+def test_results_overlay_real_results():
+    first = get_comp().schedule.knockout_rounds[0][0]
+    first_teams = sorted(t for t in first.teams if t)
+    comp = get_comp({
+        (first.arena, first.num): OrderedDict(
+            (tla, i) for i, tla in enumerate(first_teams, 1)
+        ),
+    })
+    second = comp.schedule.knockout_rounds[0][1]
+    second_teams = sorted(t for t in second.teams if t)
+
+    rounds = knockout_what_if(comp, {
+        (second.arena, second.num): list(reversed(second_teams)),
+    })
+
+    eq_(sorted(first_teams[:2] + second_teams[-2:]),
+        sorted(rounds[-1][0].teams))
+
+def test_hypothetical_knockout_scores():
+    real = mock.Mock(resolved_positions={('A', 1): OrderedDict([('AAA', 1)])})
+    scores = HypotheticalKnockoutScores(real, {('A', 2): ['BBB', 'CCC']})
+
+    eq_({
+        ('A', 1): OrderedDict([('AAA', 1)]),
+        ('A', 2): OrderedDict([('BBB', 1), ('CCC', 2)]),
+    }, scores.resolved_positions)
+    eq_(['BBB', 'CCC'], list(scores.resolved_positions[('A', 2)].keys()))
+    eq_({('A', 1): OrderedDict([('AAA', 1)])}, real.resolved_positions)
+
+@raises(ValueError)
+def test_schedule_not_created():
+    teams = defaultdict(lambda: Team(None, None, False, None))
+    config = get_config()
+    schedule = MatchSchedule(config, {}, teams, 4)
+    schedule.hypothetical_knockouts(mock.Mock())